@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares `try_parse_many` with catching `RealizedParseError` per row, for columns with some invalid rows.
+
+Run with `python benchmarks/bench_bulk.py`.
+"""
+
+import random
+import timeit
+
+from realized.bulk import try_parse_many
+from realized.dt.instants import InstantUtc
+from realized.errors import RealizedParseError
+
+N = 100_000
+
+
+def _column(bad_fraction: float) -> list[str]:
+    rng = random.Random(0)
+    good = [f"20{rng.randrange(10, 30)}-0{rng.randrange(1, 10)}-1{rng.randrange(10)}T12:00:00Z" for _ in range(N)]
+    bad = ["2022-02-30T00:00:00Z", "n/a", "2022-09-01 12:00"]
+    return [rng.choice(bad) if rng.random() < bad_fraction else v for v in good]
+
+
+def _previous(values: list[str]) -> list[InstantUtc | None]:
+    out = []
+    for v in values:
+        try:
+            out.append(InstantUtc.from_str(v))
+        except RealizedParseError:
+            out.append(None)
+    return out
+
+
+def main() -> None:
+    for bad_fraction in (0.0, 0.05, 0.5):
+        values = _column(bad_fraction)
+        assert try_parse_many(InstantUtc, values).values == _previous(values)
+        old = min(timeit.repeat(lambda values=values: _previous(values), number=1, repeat=3))
+        new = min(timeit.repeat(lambda values=values: try_parse_many(InstantUtc, values), number=1, repeat=3))
+        print(f"{bad_fraction:4.0%} invalid:   except: {1e3 * old:6.1f} ms   try_parse_many: {1e3 * new:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares `InstantUtc.from_str` and `InstantWithOffset.from_str` with the `datetime.fromisoformat` path they replaced.
+
+Run with `python benchmarks/bench_instants.py`.
+"""
+
+import timeit
+from datetime import datetime
+
+from realized.dt.instants import UTC, Instant, InstantUtc, InstantWithOffset
+
+N = 100_000
+VALUES = {
+    "UTC, seconds": ("2022-09-01T00:22:56Z", InstantUtc),
+    "UTC, microseconds": ("2022-09-01T00:22:56.123456Z", InstantUtc),
+    "offset, milliseconds": ("2022-09-01T00:22:56.123-07:00", InstantWithOffset),
+    "offset, bytes": (b"2022-09-01T00:22:56+02:00", InstantWithOffset),
+}
+
+
+def _previous(s: str | bytes, cls: type[Instant]) -> Instant:
+    if isinstance(s, bytes):
+        s = s.decode("ascii")
+    if cls is InstantUtc:
+        # the old path produced a datetime.timezone, which InstantUtc rejects, so convert it
+        return cls(datetime.fromisoformat(s.replace("−", "-").replace("Z", "+00:00")).astimezone(UTC))
+    return cls(datetime.fromisoformat(s.replace("−", "-")))
+
+
+def main() -> None:
+    for name, (value, cls) in VALUES.items():
+        assert cls.from_str(value) == _previous(value, cls)
+        old = min(timeit.repeat(lambda v=value, c=cls: _previous(v, c), number=N, repeat=5))
+        new = min(timeit.repeat(lambda v=value, c=cls: c.from_str(v), number=N, repeat=5))
+        print(f"{name:<22} previous: {1e9 * old / N:6.0f} ns   from_str: {1e9 * new / N:6.0f} ns   ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
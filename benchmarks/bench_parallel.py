@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares `parse_many` and `format_many` across numbers of workers, against a plain loop over `from_str`.
+
+Run with `python benchmarks/bench_parallel.py [n_values]`.
+"""
+
+import os
+import sys
+import timeit
+
+from realized.dt.instants import InstantUtc
+from realized.parallel import format_many, parse_many
+
+
+def main(n: int = 1_000_000) -> None:
+    values = [f"20{10 + i % 20}-0{1 + i % 9}-1{i % 10}T12:{i % 60:02}:00.{i % 1000:03}Z" for i in range(n)]
+    loop = min(timeit.repeat(lambda: [InstantUtc.from_str(v) for v in values], number=1, repeat=3))
+    print(f"{n} values; from_str loop: {1e3 * loop:7.0f} ms")
+    cpus = os.cpu_count() or 1
+    for workers in sorted({1, 2, 4, 8, 16, 32, cpus}):
+        if workers > cpus:
+            continue
+        parse = min(timeit.repeat(lambda w=workers: parse_many(InstantUtc, values, workers=w), number=1, repeat=3))
+        instants = parse_many(InstantUtc, values, workers=workers)
+        fmt = min(timeit.repeat(lambda w=workers, ms=instants: format_many(ms, workers=w), number=1, repeat=3))
+        print(f"{workers:>3} workers:   parse_many: {1e3 * parse:7.0f} ms   format_many: {1e3 * fmt:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
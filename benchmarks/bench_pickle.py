@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares pickling models by raw fields with pickling them by `as_str` and reparsing with `from_str`.
+
+Run with `python benchmarks/bench_pickle.py`.
+"""
+
+import pickle
+import timeit
+from datetime import timedelta
+
+from realized import Well8x12
+from realized._core import Model
+from realized.dt.instants import InstantUtc, InstantWithCity
+from realized.dt.intervals import Interval
+
+N = 100_000
+
+
+class _AsStr:
+    def __init__(self, model: Model) -> None:
+        self.model = model
+
+    def __reduce__(self) -> tuple:
+        return self.model.__class__.from_str, (self.model.as_str,)
+
+
+def main() -> None:
+    start = InstantWithCity.from_str("2022-09-01T00:22:56-07:00 [America/Los_Angeles]")
+    columns = {
+        "InstantUtc": [InstantUtc.from_str("2022-09-01T00:22:56Z") + timedelta(seconds=i) for i in range(N)],
+        "InstantWithCity": [start + timedelta(minutes=i) for i in range(N)],
+        "Interval": [Interval(start, start + timedelta(hours=i)) for i in range(N // 10)],
+    }
+    wells = [Well8x12.from_index(1 + i % 96) for i in range(N)]
+    for name, models in columns.items():
+        old = min(
+            timeit.repeat(lambda ms=models: pickle.loads(pickle.dumps([_AsStr(m) for m in ms])), number=1, repeat=3)
+        )
+        new = min(timeit.repeat(lambda ms=models: pickle.loads(pickle.dumps(ms)), number=1, repeat=3))
+        print(f"{name:>16}:   as_str: {1e3 * old:7.1f} ms   raw: {1e3 * new:7.1f} ms   ({old / new:.1f}x)")
+    new = min(timeit.repeat(lambda: pickle.loads(pickle.dumps(wells)), number=1, repeat=3))
+    print(f"{'Well8x12':>16}:   raw: {1e3 * new:7.1f} ms (wells could not be pickled before)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares `Schedule.expand_micros` with per-occurrence `datetime` arithmetic for multi-year wall-clock schedules.
+
+Run with `python benchmarks/bench_schedules.py`.
+"""
+
+import timeit
+from datetime import datetime, timedelta
+
+from realized.dt.arrays import EPOCH, ONE_MICROSECOND
+from realized.dt.instants import UTC, InstantUtc, InstantWithCity, get_zone
+from realized.dt.schedules import Schedule
+from realized.dt.zones import ZoneTable
+
+ZONES = [
+    "America/Los_Angeles",
+    "America/New_York",
+    "America/Sao_Paulo",
+    "Europe/London",
+    "Europe/Berlin",
+    "Africa/Cairo",
+    "Asia/Tehran",
+    "Asia/Kolkata",
+    "Asia/Tokyo",
+    "Australia/Sydney",
+    "Australia/Lord_Howe",
+    "Pacific/Auckland",
+]
+# a wall-clock time, given each zone in turn
+ANCHOR = datetime(2024, 1, 1, 2, 30, tzinfo=UTC)
+END = InstantUtc.from_str("2034-01-01T00:00:00Z")
+PERIOD = timedelta(hours=6)
+
+
+def _schedules() -> list[Schedule]:
+    return [Schedule(InstantWithCity(ANCHOR.replace(tzinfo=get_zone(z))), PERIOD) for z in ZONES]
+
+
+def _previous(schedule: Schedule) -> list[int]:
+    # wall-clock arithmetic on naive datetimes, then fold=0 resolution (GapPolicy.LATER, FoldPolicy.EARLIER)
+    zone = schedule.anchor.zone
+    local = schedule.anchor.dt.replace(tzinfo=None)
+    end = (END.dt - EPOCH) // ONE_MICROSECOND
+    out = []
+    k = 0
+    while True:
+        micros = ((local + k * schedule.period).replace(tzinfo=zone) - EPOCH) // ONE_MICROSECOND
+        if micros >= end:
+            return out
+        out.append(micros)
+        k += 1
+
+
+def main() -> None:
+    schedules = _schedules()
+    for z in ZONES:
+        ZoneTable.of(z)  # tables are built once per process
+    for s in schedules:
+        assert s.expand_micros(end=END).tolist() == _previous(s)
+    n = sum(len(s.expand_micros(end=END)) for s in schedules)
+    old = min(timeit.repeat(lambda: [_previous(s) for s in schedules], number=1, repeat=3))
+    new = min(timeit.repeat(lambda: [s.expand_micros(end=END) for s in schedules], number=1, repeat=3))
+    print(f"{len(ZONES)} zones, {n} occurrences over 10 years")
+    print(f"previous: {1e3 * old:7.1f} ms   expand_micros: {1e3 * new:7.1f} ms   ({old / new:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measures canonical `WellSet.as_str` encoding and parsing on 1536-well selections.
+
+Run with `python benchmarks/bench_well_sets.py`.
+"""
+
+import random
+import timeit
+
+from realized import WellSet32x48
+
+N = 200
+
+
+def _random(density: float, rng: random.Random) -> WellSet32x48:
+    return WellSet32x48.from_mask(sum(1 << i for i in range(32 * 48) if rng.random() < density))
+
+
+def _structured(rng: random.Random) -> WellSet32x48:
+    # a union of a few random blocks, like replicate groups on a screening plate
+    mask = 0
+    for _ in range(8):
+        r, c = rng.randrange(32), rng.randrange(48)
+        h, w = rng.randint(1, 32 - r), rng.randint(1, 48 - c)
+        mask |= WellSet32x48.from_str(f"{_label(r, c)}*{_label(r + h - 1, c + w - 1)}").as_mask
+    return WellSet32x48.from_mask(mask)
+
+
+def _label(r: int, c: int) -> str:
+    return WellSet32x48.well_type().from_rc(r + 1, c + 1).as_str
+
+
+def main() -> None:
+    rng = random.Random(0)
+    cases = {
+        "random, 5%": [_random(0.05, rng) for _ in range(N)],
+        "random, 50%": [_random(0.5, rng) for _ in range(N)],
+        "random, 95%": [_random(0.95, rng) for _ in range(N)],
+        "union of blocks": [_structured(rng) for _ in range(N)],
+    }
+    for name, sets in cases.items():
+        encoded = [s.as_str for s in sets]
+        assert all(WellSet32x48.from_str(e) == s for e, s in zip(encoded, sets, strict=True))
+        listed = sum(len(",".join(w.as_str for w in s)) for s in sets) / N
+        length = sum(len(e) for e in encoded) / N
+        encode = min(timeit.repeat(lambda ss=sets: [s.as_str for s in ss], number=1, repeat=5)) / N
+        decode = min(timeit.repeat(lambda ee=encoded: [WellSet32x48.from_str(e) for e in ee], number=1, repeat=5)) / N
+        print(
+            f"{name:<16} {length:7.0f} chars (vs {listed:5.0f} listed)   "
+            f"as_str: {1e6 * encode:7.0f} us   from_str: {1e6 * decode:7.0f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
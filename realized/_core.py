@@ -2,20 +2,27 @@
 # SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
 # SPDX-License-Identifier: Apache-2.0
 
+import dataclasses
+import functools
+import os
+import zoneinfo
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Self, TypeAlias
+from typing import Any, ClassVar, NamedTuple, Self, TypeAlias
 
 import orjson
 
+from realized._internal import Utils
+from realized.errors import DatetimeMissingZoneError, ParseErrorCode, RealizedParseError, ZoneMismatchError
 
-__all__ = ["JsonEncoder", "JsonPrimitive", "JsonType", "Model", "NullableInt", "NULL_INT"]
+__all__ = ["JsonEncoder", "JsonPrimitive", "JsonType", "Model", "NullableInt", "NULL_INT", "ParseCacheInfo"]
 
 ORJSON_OPTS = (
     orjson.OPT_UTC_Z
     | orjson.OPT_SERIALIZE_NUMPY
     | orjson.OPT_STRICT_INTEGER  # 53-bit ints for JavaScript compat
     | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS  # models go through _json_default, not their fields
 )
 JsonPrimitive = None | bool | int | float | str
 
@@ -23,22 +30,247 @@ JsonPrimitive = None | bool | int | float | str
 JsonType: TypeAlias = JsonPrimitive | list["JsonType"] | dict[str, "JsonType"]
 
 
+class ParseCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+# Per-type LRU caches for Model.from_str, keyed by the exact class; absent means disabled
+_PARSE_CACHES: dict[type, Callable[[str | bytes], Any]] = {}
+_HASHABLE_INPUTS = (str, bytes)
+# what from_str raises for an invalid value, as mapped to a ParseErrorCode by Model._try_from_str
+_PARSE_ERRORS = (
+    RealizedParseError,
+    ZoneMismatchError,
+    DatetimeMissingZoneError,
+    ValueError,
+    LookupError,
+    OverflowError,
+    TypeError,
+)
+
+
+def _parse_cached(fn: Callable[..., Any], replaced: classmethod | None) -> Callable[..., Any]:
+    """
+    Wraps a `from_str` implementation so that it consults the class's parse cache.
+    Only installed while a cache is enabled, so uncached types call `from_str` directly.
+    `replaced` is the class's own `from_str` (or `None` if inherited), restored when the cache is disabled.
+    """
+
+    @functools.wraps(fn)
+    def from_str(cls: type, v: str | bytes, *args: Any, **kwargs: Any) -> Any:
+        cache = _PARSE_CACHES.get(cls)
+        if cache is None or args or kwargs or v.__class__ not in _HASHABLE_INPUTS:
+            return fn(cls, v, *args, **kwargs)
+        return cache(v)
+
+    from_str.replaced = replaced
+    return from_str
+
+
+# Maps each Model subclass to its _json_data getter; filled from all subclasses on the first miss
+_JSON_DATA: dict[type, Callable[[Any], JsonType]] = {}
+
+
+def _refresh_json_data() -> None:
+    for clazz in Utils.subclasses(Model):
+        _JSON_DATA[clazz] = clazz._json_data.fget
+
+
+def _dataclass_fields(obj: Any) -> dict[str, Any]:
+    # what orjson does for other dataclasses, which PASSTHROUGH_DATACLASS sends here too; orjson serializes the values
+    return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+
+
+def _json_default(obj: Any) -> JsonType:
+    """
+    The orjson `default` hook, which converts a model anywhere in the data to its JSON data,
+    and any other dataclass to a map of its fields.
+    """
+    fn = _JSON_DATA.get(obj.__class__)
+    if fn is None:
+        if isinstance(obj, Model):
+            _refresh_json_data()
+            fn = _JSON_DATA.setdefault(obj.__class__, obj.__class__._json_data.fget)
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            fn = _JSON_DATA.setdefault(obj.__class__, _dataclass_fields)
+        else:
+            msg = f"Type {obj.__class__.__qualname__} is not JSON-serializable"
+            raise TypeError(msg)
+    return fn(obj)
+
+
+_KEY_BIAS = 1 << 63
+
+
+def _int64_key(v: int) -> bytes:
+    """
+    Encodes an int64 as big-endian bytes with the sign bit flipped, so that bytewise order is numeric order.
+    """
+    return (v + _KEY_BIAS).to_bytes(8, "big")
+
+
+def _int64_of_key(key: bytes, start: int = 0) -> int:
+    return int.from_bytes(key[start : start + 8], "big") - _KEY_BIAS
+
+
+def _check_key(cls: type, key: bytes, length: int, *, exact: bool = True) -> None:
+    if (len(key) != length) if exact else (len(key) < length):
+        msg = f"{key!r} is not a sort key for {cls.__qualname__}"
+        raise RealizedParseError(msg, value=key)
+
+
+@functools.cache
+def _init_field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in dataclasses.fields(cls) if f.init)
+
+
+def _from_raw(cls: type, *raw: Any) -> Any:
+    """
+    Unpickles a model from its raw fields.
+    A module-level function and a class are memoized by pickle, unlike a fresh bound method per object.
+    """
+    return cls._from_raw(*raw)
+
+
 class JsonEncoder:
+    """
+    Serializes JSON data, which may contain models nested at any depth, in a single orjson call.
+    """
 
-    def to_json(self: Self, data: JsonType, options: int = 0) -> str:
-        return orjson.dumps(data, option=options | ORJSON_OPTS).decode("utf-8")
+    def to_json(self: Self, data: Any, options: int = 0) -> str:
+        return self.to_json_bytes(data, options).decode("utf-8")
+
+    def to_json_bytes(self: Self, data: Any, options: int = 0) -> bytes:
+        return orjson.dumps(data, default=_json_default, option=options | ORJSON_OPTS)
 
 
 @dataclass(slots=True, frozen=True, order=True)
 class Model:
+    # set on Model itself, so one switch covers every subclass; see enable_trusted_checks
+    _checks_trusted: ClassVar[bool] = os.environ.get("REALIZED_CHECK_TRUSTED", "0") not in ("", "0")
 
     @classmethod
     def from_str(cls: type[Self], v: str) -> Self:
         raise NotImplementedError()
 
+    @classmethod
+    def _try_from_str(cls: type[Self], v: str) -> Self | ParseErrorCode:
+        """
+        Like `from_str`, but returns why the value is invalid instead of raising.
+        This default catches the exception; subclasses override it to check their format without raising.
+        """
+        try:
+            return cls.from_str(v)
+        except (ZoneMismatchError, DatetimeMissingZoneError, zoneinfo.ZoneInfoNotFoundError):
+            return ParseErrorCode.ZONE
+        except OverflowError:
+            return ParseErrorCode.RANGE
+        except (RealizedParseError, ValueError, LookupError, TypeError):
+            return ParseErrorCode.SYNTAX
+
+    @classmethod
+    def enable_parse_cache(cls: type[Self], maxsize: int = 4096) -> None:
+        """
+        Memoizes `from_str` for exactly this class, keeping the `maxsize` most recently used values.
+        Instances are frozen, so sharing them between callers is safe.
+        Replaces (and clears) any cache already enabled for the class.
+        """
+        if maxsize < 1:
+            msg = f"maxsize must be positive, not {maxsize}"
+            raise ValueError(msg)
+        fn = cls.from_str.__func__
+        raw = fn.__wrapped__ if hasattr(fn, "replaced") else fn  # a superclass's cache may be enabled
+        if raw is Model.from_str.__func__:
+            msg = f"{cls.__qualname__} does not implement from_str"
+            raise TypeError(msg)
+        _PARSE_CACHES[cls] = functools.lru_cache(maxsize=maxsize)(functools.partial(raw, cls))
+        own = vars(cls).get("from_str")
+        if not hasattr(getattr(own, "__func__", None), "replaced"):
+            cls.from_str = classmethod(_parse_cached(raw, own))
+
+    @classmethod
+    def disable_parse_cache(cls: type[Self]) -> None:
+        """
+        Drops the cache and restores the uncached `from_str`.
+        """
+        _PARSE_CACHES.pop(cls, None)
+        wrapper = getattr(vars(cls).get("from_str"), "__func__", None)
+        if hasattr(wrapper, "replaced"):
+            if wrapper.replaced is None:
+                del cls.from_str
+            else:
+                cls.from_str = wrapper.replaced
+
+    @classmethod
+    def clear_parse_cache(cls: type[Self]) -> None:
+        """
+        Empties the cache and resets its statistics, leaving it enabled.
+        """
+        if cls in _PARSE_CACHES:
+            _PARSE_CACHES[cls].cache_clear()
+
+    @classmethod
+    def parse_cache_info(cls: type[Self]) -> ParseCacheInfo | None:
+        """
+        Returns hit and miss counts for the class's parse cache, or `None` if it is disabled.
+        """
+        if cls not in _PARSE_CACHES:
+            return None
+        return ParseCacheInfo(*_PARSE_CACHES[cls].cache_info())
+
+    @classmethod
+    def _unchecked(cls: type[Self], *args: Any) -> Self:
+        """
+        Constructs from the same arguments as `cls(...)` without validating them.
+        Only for values that this library already validated, such as when unpickling or decoding stored data.
+        Validates anyway while trusted checks are enabled.
+        """
+        if Model._checks_trusted:
+            return cls(*args)
+        model = object.__new__(cls)
+        for name, v in zip(_init_field_names(cls), args, strict=True):
+            object.__setattr__(model, name, v)
+        return model
+
+    @staticmethod
+    def enable_trusted_checks() -> None:
+        """
+        Makes trusted construction (`_unchecked` and the deserializers that use it) validate, for every model type.
+        For tests and debugging; also enabled by setting the environment variable `REALIZED_CHECK_TRUSTED=1`.
+        """
+        Model._checks_trusted = True
+
+    @staticmethod
+    def disable_trusted_checks() -> None:
+        Model._checks_trusted = False
+
+    @classmethod
+    def from_bytes(cls: type[Self], v: bytes | bytearray | memoryview) -> Self:
+        """
+        Parses the UTF-8 encoded string form.
+        Subclasses whose strings are ASCII override this to parse the buffer without decoding it.
+        """
+        try:
+            s = str(v, "utf-8")
+        except UnicodeDecodeError as e:
+            msg = f"{bytes(v)!r} is not valid UTF-8"
+            raise RealizedParseError(msg, value=bytes(v)) from e
+        return cls.from_str(s)
+
     @classmethod
     def from_json(cls: type[Self], v: str) -> Self:
-        return cls(**orjson.loads(v).encode("utf-8"))
+        return cls._from_json_data(orjson.loads(v))
+
+    @classmethod
+    def from_json_bytes(cls: type[Self], v: bytes | bytearray | memoryview) -> Self:
+        return cls._from_json_data(orjson.loads(v))  # orjson reads buffers directly
+
+    @classmethod
+    def _from_json_data(cls: type[Self], data: JsonType) -> Self:
+        return cls.from_str(data)  # inverse of the default _json_data
 
     def __post_init__(self: Self) -> None:
         pass
@@ -49,21 +281,43 @@ class Model:
     def __str__(self: Self) -> str:
         return self.as_str
 
-    def __reduce__(self: Self) -> tuple[Callable[[str], Self], tuple]:
+    def __reduce__(self: Self) -> tuple[Callable[..., Self], tuple]:
+        # subclasses with cheap raw fields pickle those instead, as `_from_raw, (cls, *fields)`,
+        # and rebuild with a trusted `cls._from_raw`; pickles made this way remain loadable, since `from_str` is kept
         return self.__class__.from_str, (self.as_str,)
 
     @property
     def as_str(self: Self) -> str:
         raise NotImplementedError()
 
+    @property
+    def as_sort_key(self: Self) -> bytes:
+        """
+        Bytes whose bytewise order is the order of the values, for keys in sorted stores and indexes.
+        `from_sort_key` decodes them.
+        """
+        msg = f"{self.__class__.__qualname__} has no sort key"
+        raise NotImplementedError(msg)
+
+    @classmethod
+    def from_sort_key(cls: type[Self], key: bytes) -> Self:
+        msg = f"{cls.__qualname__} has no sort key"
+        raise NotImplementedError(msg)
+
     def to_json(self: Self, *, options: int = 0) -> str:
-        return JsonEncoder().to_json(self._json_data, options)
+        return _ENCODER.to_json(self._json_data, options)
+
+    def to_json_bytes(self: Self, *, options: int = 0) -> bytes:
+        return _ENCODER.to_json_bytes(self._json_data, options)
 
     @property
     def _json_data(self: Self) -> JsonType:
         return self.as_str  # default
 
 
+_ENCODER = JsonEncoder()
+
+
 class NullableInt(int):
     """
     A replacement for `int | None` for which only `None` is `False`; `0` is `True`.
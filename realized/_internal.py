@@ -22,6 +22,13 @@ class Utils:
     ) -> Mapping[str, type[T_co]]:
         return {c.__name__: c for c in cls._get_subclasses(clazz, concrete=concrete)}
 
+    @classmethod
+    def subclasses(cls: type[Self], clazz: type[T_co]) -> list[type[T_co]]:
+        """
+        Returns all direct and indirect subclasses, including private and abstract ones.
+        """
+        return list(cls._get_subclasses(clazz))
+
     @classmethod
     def _get_subclasses(
         cls: type[Self],
@@ -0,0 +1,219 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Fixed-width little-endian binary layouts for models, with lazy zero-copy decoding.
+
+Only `BinaryLayout.numpy_dtype` and `BinaryView.as_numpy` need NumPy (the `arrays` extra).
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Generic, Self, TypeVar
+from zoneinfo import ZoneInfo
+
+from realized._core import JsonType, Model
+from realized.biochem.wells import Well
+from realized.dt.durations import Duration
+from realized.dt.instants import UTC, InstantUtc, InstantWithCity, InstantWithOffset, get_zone
+from realized.misc.coordinates import Rectangle, XY, _integral
+
+__all__ = ["BinaryLayout", "BinaryView"]
+M = TypeVar("M", bound=Model)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+ONE_MICROSECOND = timedelta(microseconds=1)
+# struct codes to NumPy type strings, for the little-endian standard sizes used here
+_NUMPY_TYPES = {"q": "<i8", "h": "<i2", "H": "<u2"}
+
+
+def _decimals(model_type: type) -> Callable[..., Any]:
+    return lambda *v: model_type(*map(Decimal, v))
+
+
+# per-type (struct, names, to_fields, from_fields); InstantWithCity also needs a zone, so it is handled separately
+_FIELDS: dict[type, Callable[[Any], tuple]] = {
+    InstantUtc: lambda t: (struct.Struct("<q"), ("micros",), lambda m: (m._utc_micros,), t._from_raw),
+    InstantWithOffset: lambda t: (
+        struct.Struct("<qh"),
+        ("micros", "offset_minutes"),
+        lambda m: (m._utc_micros, m._offset_minutes),
+        t._from_raw,
+    ),
+    Duration: lambda t: (struct.Struct("<q"), ("micros",), lambda m: (m.delta // ONE_MICROSECOND,), t._from_raw),
+    Well: lambda t: (struct.Struct("<H"), ("index",), lambda m: (m.as_index,), t.from_index),
+    Rectangle: lambda t: (
+        struct.Struct("<4q"),
+        ("left", "top", "right", "bottom"),
+        lambda m: tuple(_integral(v) for v in (m.left, m.top, m.right, m.bottom)),
+        _decimals(t),
+    ),
+    XY: lambda t: (struct.Struct("<2q"), ("x", "y"), lambda m: (_integral(m.x), _integral(m.y)), _decimals(t)),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class BinaryLayout(Generic[M]):
+    """
+    How one model type is packed into a fixed number of bytes.
+
+    Every field is a little-endian integer with no padding, so a buffer of `n` models is exactly `n * size` bytes
+    and can be read by any tool from `struct_format` or `dtype_descr` alone.
+    Per-column information that is not stored per row, such as the zone of `InstantWithCity` values,
+    is in `describe()`.
+
+    Example:
+        layout = BinaryLayout.of(InstantUtc)
+        data = layout.encode(instants)
+        view = layout.decode(memoryview(data))  # nothing is unpacked until indexed
+    """
+
+    model_type: type[M]
+    struct: struct.Struct
+    names: tuple[str, ...]
+    to_fields: Callable[[M], tuple]
+    from_fields: Callable[..., M]
+    zone: ZoneInfo | None = None
+
+    @classmethod
+    def of(cls: type[Self], model_type: type[M], zone: ZoneInfo | str | None = None) -> Self:
+        """
+        Returns the layout for a model type.
+        `InstantWithCity` columns share one zone, which must be given; it is not stored per row.
+
+        Raises:
+            TypeError: If the type has no binary layout
+        """
+        if issubclass(model_type, InstantWithCity):
+            return cls._city(model_type, zone)
+        for base, fields in _FIELDS.items():
+            if issubclass(model_type, base):
+                return cls(model_type, *fields(model_type))
+        msg = f"No binary layout for {model_type.__qualname__}"
+        raise TypeError(msg)
+
+    @classmethod
+    def _city(cls: type[Self], model_type: type[InstantWithCity], zone: ZoneInfo | str | None) -> Self:
+        if zone is None:
+            msg = "A zone is required for InstantWithCity"
+            raise TypeError(msg)
+        zone = get_zone(zone) if isinstance(zone, str) else zone
+
+        def to_fields(m: InstantWithCity) -> tuple[int]:
+            if m.zone != zone:
+                msg = f"{m} is not in {zone.key}"
+                raise ValueError(msg)
+            return (m._utc_micros,)
+
+        def from_fields(micros: int) -> InstantWithCity:
+            return model_type._of_parsed((EPOCH + timedelta(microseconds=micros)).astimezone(zone))
+
+        return cls(model_type, struct.Struct("<q"), ("micros",), to_fields, from_fields, zone)
+
+    @property
+    def size(self: Self) -> int:
+        return self.struct.size
+
+    @property
+    def struct_format(self: Self) -> str:
+        return self.struct.format
+
+    @property
+    def dtype_descr(self: Self) -> list[tuple[str, str]]:
+        """
+        The NumPy structured dtype description, e.g. `[("micros", "<i8"), ("offset_minutes", "<i2")]`.
+        """
+        types = []
+        count = ""
+        for c in self.struct.format.lstrip("<"):
+            if c.isdigit():
+                count += c
+            else:
+                types += [_NUMPY_TYPES[c]] * int(count or "1")
+                count = ""
+        return list(zip(self.names, types, strict=True))
+
+    def numpy_dtype(self: Self) -> Any:
+        import numpy as np  # noqa: PLC0415 (optional arrays extra)
+
+        return np.dtype(self.dtype_descr)
+
+    def describe(self: Self) -> dict[str, JsonType]:
+        """
+        Returns a JSON-serializable description, for a file header or sidecar.
+        """
+        return {
+            "type": self.model_type.__name__,
+            "struct": self.struct.format,
+            "size": self.size,
+            "fields": [{"name": n, "dtype": t} for n, t in self.dtype_descr],
+            "zone": None if self.zone is None else self.zone.key,
+        }
+
+    def encode(self: Self, models: Iterable[M]) -> bytes:
+        """
+        Packs models into one buffer of `len(models) * size` bytes.
+        """
+        pack, to_fields = self.struct.pack, self.to_fields
+        return b"".join([pack(*to_fields(m)) for m in models])
+
+    def decode(self: Self, buffer: bytes | bytearray | memoryview | Any) -> BinaryView[M]:
+        """
+        Returns a lazy view of a buffer (anything supporting the buffer protocol, such as an `mmap`) without copying it.
+
+        Raises:
+            ValueError: If the buffer is not a whole number of records
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) % self.size != 0:
+            msg = f"Buffer of {len(view)} bytes is not a multiple of {self.size}"
+            raise ValueError(msg)
+        return BinaryView(self, view)
+
+
+@dataclass(slots=True, frozen=True)
+class BinaryView(Sequence[M], Generic[M]):
+    """
+    A read-only sequence of models backed by a buffer.
+    Each model is unpacked when it is accessed; slices (with step 1) are views of the same buffer.
+    """
+
+    layout: BinaryLayout[M]
+    buffer: memoryview
+
+    def __len__(self: Self) -> int:
+        return len(self.buffer) // self.layout.size
+
+    def __getitem__(self: Self, i: int | slice) -> M | BinaryView[M]:
+        n, size = len(self), self.layout.size
+        if isinstance(i, slice):
+            start, stop, step = i.indices(n)
+            if step != 1:
+                msg = f"Only contiguous slices are views, not step {step}"
+                raise ValueError(msg)
+            return BinaryView(self.layout, self.buffer[start * size : max(start, stop) * size])
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            msg = f"Index {i} is out of range for {n} records"
+            raise IndexError(msg)
+        return self.layout.from_fields(*self.layout.struct.unpack_from(self.buffer, i * size))
+
+    def __iter__(self: Self) -> Iterator[M]:
+        from_fields = self.layout.from_fields
+        for fields in self.layout.struct.iter_unpack(self.buffer):
+            yield from_fields(*fields)
+
+    def as_numpy(self: Self) -> Any:
+        """
+        Returns a NumPy structured array over the same memory (read-only if the buffer is).
+        """
+        import numpy as np  # noqa: PLC0415 (optional arrays extra)
+
+        return np.frombuffer(self.buffer, dtype=self.layout.numpy_dtype())
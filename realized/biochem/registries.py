@@ -49,11 +49,13 @@ class DefaultWellTypeFactory(AbstractWellTypeFactory):
             _n_cols: ClassVar[int] = cols
 
         _Well.__name__ = f"{Well.__name__}{rows}x{cols}"
+        _Well._build_tables()
 
-        @dataclass(slots=True, frozen=True, order=True)
+        @dataclass(slots=True, frozen=True, order=True, init=False)
         class _WellSet(WellSet[_Well]):
             _n_rows: ClassVar[int] = rows
             _n_cols: ClassVar[int] = cols
+            _well_type: ClassVar[type[Well]] = _Well
 
         _WellSet.__name__ = f"{WellSet.__name__}{rows}x{cols}"
 
@@ -98,3 +100,17 @@ DEFAULT_TYPES = [
 _FACTORY = DefaultWellTypeFactory()
 WELL_TYPES = WellTypeRegistry.new_empty(_FACTORY)
 WELL_TYPES.register(*DEFAULT_TYPES)
+
+
+def _well(rows: int, cols: int, index: int) -> Well:
+    """
+    Unpickles a well (see `Well.__reduce__`).
+    """
+    return WELL_TYPES.well_type(rows, cols).from_index(index)
+
+
+def _well_set(rows: int, cols: int, mask: int) -> WellSet:
+    """
+    Unpickles a well set (see `WellSet.__reduce__`).
+    """
+    return WELL_TYPES.well_set_type(rows, cols).from_mask(mask)
@@ -6,72 +6,108 @@ from __future__ import annotations
 
 import abc
 import re
-import typing
-from collections.abc import Iterator, Sequence
-from dataclasses import dataclass, field
-from typing import Self, ClassVar, TypeVar, Generic
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, Self, ClassVar, TypeVar, Generic
 
-from pocketutils import KeyReusedError
+from pocketutils import KeyReusedError, ValueIllegalError
 
-from realized._core import Model, NullableInt, NULL_INT
+from realized._core import Model, NullableInt, NULL_INT, _check_key
 from realized.biochem.wells import Well
 from realized.errors import RealizedParseError
 
 __all__ = ["WellSet"]
 Coordinate = tuple[int, int]
 CoordinatePair = tuple[Coordinate, Coordinate]
-PATTERN = re.compile(r""" *([A-H]+[0-9]+) *(?:(-|\*|\.{3}) *([A-H]+[0-9]+))? *""")
+PATTERN = re.compile(r""" *([A-Z]+[0-9]+) *(?:(-|\*|\.{3}) *([A-Z]+[0-9]+))? *""")
+BYTES_PATTERN = re.compile(PATTERN.pattern.encode("ascii"))
 W = TypeVar("W", bound=Well)
 
 
-def simple_range(a: str, b: str, typ: type[Well]) -> Iterator[W]:
-    ar, ac = typ.from_str(a).as_rc
-    br, bc = typ.from_str(b).as_rc
-    if ar == br:
-        for c in range(ac, bc + 1):
-            yield typ.from_rc(ar, c)
-    elif ac == bc:
-        for r in range(ar, br + 1):
-            yield typ.from_rc(r, ac).as_rc
+def _run(start: int, length: int) -> int:
+    """
+    Returns a mask of `length` consecutive bits, starting at bit `start`.
+    """
+    return ((1 << length) - 1) << start
+
+
+def _strided(start: int, count: int, stride: int) -> int:
+    """
+    Returns a mask of `count` bits, `stride` apart, starting at bit `start`.
+    """
+    mask = 0
+    for i in range(count):
+        mask |= 1 << (start + i * stride)
+    return mask
+
+
+def simple_range(a: Well, b: Well) -> int:
+    if a.row == b.row and a.col <= b.col:
+        return _run(a.as_index - 1, b.col - a.col + 1)
+    if a.col == b.col and a.row <= b.row:
+        return _strided(a.as_index - 1, b.row - a.row + 1, a._n_cols)
     msg = f"{a}-{b} is not a simple range"
     raise RealizedParseError(msg)
 
 
-def block_range(a: str, b: str, typ: type[Well]) -> Iterator[W]:
-    ar, ac = typ.from_str(a).as_rc
-    br, bc = typ.from_str(b).as_rc
-    for r in range(ar, br + 1):
-        for c in range(ac, bc + 1):
-            yield typ.from_rc(r, c)
+def block_range(a: Well, b: Well) -> int:
+    if a.row > b.row or a.col > b.col:
+        msg = f"{a}*{b} is not a block"
+        raise RealizedParseError(msg)
+    return _strided(0, b.row - a.row + 1, a._n_cols) * _run(a.as_index - 1, b.col - a.col + 1)
 
 
-def traversal_range(a: str, b: str, typ: type[Well]) -> Iterator[W]:
-    ai = typ.from_str(a).as_index
-    bi = typ.from_str(b).as_index
-    for i in range(ai, bi + 1):
-        yield typ.from_index(i)
+def traversal_range(a: Well, b: Well) -> int:
+    if a.as_index > b.as_index:
+        msg = f"{a}...{b} is not a traversal"
+        raise RealizedParseError(msg)
+    return _run(a.as_index - 1, b.as_index - a.as_index + 1)
 
 
 @dataclass(slots=True, frozen=True, order=True, init=False)
 class WellSet(Model, Generic[W], metaclass=abc.ABCMeta):
+    """
+    A set of wells on one plate type.
 
-    _original: list[W]
-    _sorted: list[W] = field(init=False)
+    Stored as a bitmask in which bit `i` is set if the well with index `i + 1` is included.
+    Set algebra (`|`, `&`, `-`, `^`), membership, and `len` are big-integer operations.
+    Iteration is in index order (row by row), not the order in which wells were given:
+    a set does not remember it, so `wells` is always sorted and `sorted` returns the set itself.
+    """
+
+    _mask: int
     _n_rows: ClassVar[int]
     _n_cols: ClassVar[int]
+    _well_type: ClassVar[type[Well]]
+
+    def __init__(self: Self, wells: Iterable[W]) -> None:
+        mask = 0
+        reused = []
+        for w in wells:
+            if not isinstance(w, self._well_type):
+                msg = f"{w!r} is not a {self._well_type.__name__}"
+                raise ValueIllegalError(msg, value=w)
+            bit = 1 << (w.as_index - 1)
+            if mask & bit:
+                reused.append(w)
+            mask |= bit
+        if reused:
+            msg = f"Well range contains duplicate wells {reused}"
+            raise KeyReusedError(msg, keys=frozenset([str(w) for w in reused]))
+        object.__setattr__(self, "_mask", mask)
 
-    def __init__(self: Self, wells: Sequence[W]) -> None:
-        delta = set(self._original).symmetric_difference(set(wells))
-        if len(delta) > 0:
-            raise KeyReusedError(
-                f"Well range contains duplicate wells {delta}",
-                keys=frozenset([str(w) for w in delta])
-            )
-        self._sorted = list(sorted(wells))
+    @classmethod
+    def from_mask(cls: type[Self], mask: int) -> Self:
+        if mask < 0 or mask.bit_length() > cls._n_rows * cls._n_cols:
+            msg = f"Mask {mask:#x} has bits outside {cls.__name__}"
+            raise ValueIllegalError(msg, value=mask)
+        well_set = object.__new__(cls)
+        object.__setattr__(well_set, "_mask", mask)
+        return well_set
 
     @classmethod
     def well_type(cls: type[Self]) -> type[W]:
-        return typing.get_args(cls)[0]
+        return cls._well_type
 
     @classmethod
     def from_str(cls: type[Self], v: str) -> Self:
@@ -82,121 +118,248 @@ class WellSet(Model, Generic[W], metaclass=abc.ABCMeta):
             A01-E01   (sequence in a single column)
             A01*C01   (a rectangular block)
             A01...C01 (a traversal of the wells in order)
+        The empty string is the empty set.
         """
-        wells = []
+        if v == "":
+            return cls.from_mask(0)
+        mask = 0
         for txt in v.split(","):
             try:
-                wells += cls._parse(txt)
+                part = cls._parse(txt)
             except RealizedParseError as e:
-                raise RealizedParseError(f"'{txt}' is not a valid well expression", value=v) from e
-        return cls(wells)
+                msg = f"'{txt}' is not a valid well expression"
+                raise RealizedParseError(msg, value=v) from e
+            if mask & part:
+                reused = list(cls.from_mask(mask & part))
+                msg = f"Well range contains duplicate wells {reused}"
+                raise KeyReusedError(msg, keys=frozenset([str(w) for w in reused]))
+            mask |= part
+        return cls.from_mask(mask)
+
+    @classmethod
+    def from_bytes(cls: type[Self], v: bytes | bytearray | memoryview) -> Self:
+        if len(v) == 0:
+            return cls.from_mask(0)
+        mask = 0
+        for txt in bytes(v).split(b","):
+            try:
+                part = cls._parse_bytes(txt)
+            except RealizedParseError as e:
+                msg = f"{txt!r} is not a valid well expression"
+                raise RealizedParseError(msg, value=bytes(v)) from e
+            if mask & part:
+                reused = list(cls.from_mask(mask & part))
+                msg = f"Well range contains duplicate wells {reused}"
+                raise KeyReusedError(msg, keys=frozenset([str(w) for w in reused]))
+            mask |= part
+        return cls.from_mask(mask)
 
     def __bool__(self: Self) -> bool:
-        return not self.is_empty
+        return self._mask != 0
 
     def __len__(self: Self) -> int:
-        return len(self._original)
+        return self._mask.bit_count()
 
     def __iter__(self: Self) -> Iterator[W]:
-        return iter(self._original)
+        # bin() is the fastest way to find the set bits of a large int
+        bits = bin(self._mask)[:1:-1]
+        wells = self._well_type._wells
+        i = bits.find("1")
+        while i >= 0:
+            yield wells[i]
+            i = bits.find("1", i + 1)
+
+    def __contains__(self: Self, well: Any) -> bool:
+        return isinstance(well, self._well_type) and self._mask >> (well.as_index - 1) & 1 == 1
+
+    def __or__(self: Self, other: Self) -> Self:
+        return self.from_mask(self._mask | self._other_mask(other))
+
+    def __and__(self: Self, other: Self) -> Self:
+        return self.from_mask(self._mask & self._other_mask(other))
+
+    def __sub__(self: Self, other: Self) -> Self:
+        return self.from_mask(self._mask & ~self._other_mask(other))
+
+    def __xor__(self: Self, other: Self) -> Self:
+        return self.from_mask(self._mask ^ self._other_mask(other))
+
+    def _other_mask(self: Self, other: Self) -> int:
+        if other.__class__ is not self.__class__:
+            msg = f"Cannot combine {self.__class__.__name__} with {other.__class__.__name__}"
+            raise TypeError(msg)
+        return other._mask
+
+    def __reduce__(self: Self) -> tuple[Callable[[int, int, int], Self], tuple[int, int, int]]:
+        # as for wells, the type is found again by plate type in the registry
+        from realized.biochem.registries import _well_set  # noqa: PLC0415 (registries imports this module)
+
+        return _well_set, (self._n_rows, self._n_cols, self._mask)
+
+    @property
+    def as_sort_key(self: Self) -> bytes:
+        """
+        The mask as big-endian bytes, with one bit per well of the plate.
+        Sets therefore sort as their masks do, so by their highest-index well first.
+        """
+        return self._mask.to_bytes(self._sort_key_size(), "big")
+
+    @classmethod
+    def from_sort_key(cls: type[Self], key: bytes) -> Self:
+        _check_key(cls, key, cls._sort_key_size())
+        return cls.from_mask(int.from_bytes(key, "big"))
+
+    @classmethod
+    def _sort_key_size(cls: type[Self]) -> int:
+        return (cls._n_rows * cls._n_cols + 7) // 8
 
     @property
     def as_str(self: Self) -> str:
-        wells: Self = self._sorted
-        if self.is_empty:
-            return ""
-        if self.as_single:
-            return wells[0].as_str
-        if self.as_row or self.as_col:
-            return f"{wells[0]}-{wells[-1]}"
-        if self.as_block:
-            return f"{wells[0]}*{wells[-1]}"
-        if self.as_sequence:
-            return f"{wells[0]}...{wells[-1]}"
-        return ",".join(wells)
+        """
+        Returns the canonical expression, which is unique for every set; the empty set is `""`.
+
+        Greedily covers the lowest uncovered well with the largest disjoint range that starts there:
+        a block (`*`), a row or column (`-`), or a traversal (`...`) if that crosses rows and is larger.
+        The result is deterministic but not always the shortest expression for the set.
+        """
+        wells = self._well_type._wells
+        n_rows, n_cols = self._n_rows, self._n_cols
+        remaining = self._mask
+        parts = []
+        while remaining:
+            p = (remaining & -remaining).bit_length() - 1
+            row, col = divmod(p, n_cols)
+            x = remaining >> p
+            run = (~x & (x + 1)).bit_length() - 1
+            # for each width, find how many rows down the block can extend; keep the largest
+            width, height = 1, 1
+            for w in range(1, min(run, n_cols - col) + 1):
+                seg = _run(0, w)
+                h = 1
+                while row + h < n_rows and (remaining >> (p + h * n_cols)) & seg == seg:
+                    h += 1
+                if w * h >= width * height:
+                    width, height = w, h
+            if run > width * height:
+                remaining &= ~_run(p, run)
+                parts.append(f"{wells[p]}...{wells[p + run - 1]}")
+                continue
+            last = p + (height - 1) * n_cols + width - 1
+            remaining &= ~(_strided(0, height, n_cols) * _run(p, width))
+            if width == height == 1:
+                parts.append(wells[p].as_str)
+            elif width == 1 or height == 1:
+                parts.append(f"{wells[p]}-{wells[last]}")
+            else:
+                parts.append(f"{wells[p]}*{wells[last]}")
+        return ",".join(parts)
+
+    @property
+    def as_mask(self: Self) -> int:
+        return self._mask
 
     @property
     def wells(self: Self) -> Sequence[W]:
-        return list(self._original)
+        """
+        The wells in index order.
+        """
+        return list(self)
 
     @property
     def sorted(self: Self) -> Self:
-        return self.__class__(self._sorted, self._sorted)
+        """
+        Returns this set, which is always in index order.
+        """
+        return self
 
     @property
     def is_empty(self: Self) -> bool:
-        return len(self._sorted) == 0
+        return self._mask == 0
 
     @property
     def as_single(self: Self) -> Coordinate | None:
-        if len(self._sorted) == 1:
-            return self._sorted[0].as_rc
+        if self._mask.bit_count() == 1:
+            return self._first.as_rc
         return None
 
     @property
     def as_row(self: Self) -> NullableInt:
-        w0 = None
-        for w in self._sorted:
-            if w0 is not None and w.row != w0.row:
-                return NULL_INT
-            if w0 is not None and w.col != w0.col + 1:
-                return NULL_INT
-            w0 = w
-        return NullableInt.of(w0.row)
+        if self._is_run and self._first.row == self._last.row:
+            return NullableInt.of(self._first.row)
+        return NULL_INT
 
     @property
     def as_col(self: Self) -> NullableInt:
-        w0 = None
-        for w in self._sorted:
-            if w0 is not None and w.col != w0.col:
-                return NULL_INT
-            if w0 is not None and w.row != w0.row + 1:
-                return NULL_INT
-            w0 = w
-        return NullableInt.of(w0.col)
+        if self._is_col:
+            return NullableInt.of(self._first.col)
+        return NULL_INT
 
     @property
     def as_sequence(self: Self) -> CoordinatePair | None:
-        w00 = (-1, -1)
-        w0 = None
-        for w in self._sorted:
-            if w0 is None:
-                w00 = w.as_rc
-            if w0 is not None and w.as_index != w0.index + 1:
-                return None
-            w0 = w
-        return w00, w0.as_rc
+        if self._is_run:
+            return self._first.as_rc, self._last.as_rc
+        return None
 
     @property
     def as_block(self: Self) -> CoordinatePair | None:
-        wells = self._sorted
-        w00 = wells[0].row
-        w01 = wells[-1].row
-        w10 = wells[0].col
-        w11 = wells[-1].col
-        if len(wells) != (w01 - w00) * (w11 - w10):
+        if self.is_empty:
             return None
-        actual: set[tuple[int, int]] = {(w.row, w.col) for w in wells}
-        for r in range(w00, w01 + 1):
-            for c in range(w10, w11 + 1):
-                if (r, c) not in actual:
-                    return None
-        return wells[0].as_rc, wells[-1].as_rc
+        first, last = self._first, self._last
+        if first.col > last.col or self._mask != block_range(first, last):
+            return None
+        return first.as_rc, last.as_rc
+
+    @property
+    def _is_col(self: Self) -> bool:
+        if self.is_empty:
+            return False
+        first, last = self._first, self._last
+        column = _strided(first.as_index - 1, last.row - first.row + 1, self._n_cols)
+        return first.col == last.col and self._mask == column
+
+    @property
+    def _is_run(self: Self) -> bool:
+        # true if the set bits are consecutive
+        low = self._mask & -self._mask
+        return self._mask != 0 and (self._mask + low) & self._mask == 0
+
+    @property
+    def _first(self: Self) -> W:
+        return self._well_type._wells[(self._mask & -self._mask).bit_length() - 1]
+
+    @property
+    def _last(self: Self) -> W:
+        return self._well_type._wells[self._mask.bit_length() - 1]
 
     @classmethod
-    def _parse(cls: type[Self], v: str) -> Iterator[W]:
+    def _parse(cls: type[Self], v: str) -> int:
         match = PATTERN.fullmatch(v)
         if match is None:
             msg = f"'{v}' is not a valid well expression"
             raise RealizedParseError(msg, value=v)
         a, x, b = match.group(1), match.group(2), match.group(3)
         if x is None:
-            return cls.well_type.from_str(a)
-        elif x == "-":
-            return simple_range(a, b, cls.well_type)
+            return 1 << (cls._well_type.from_str(a).as_index - 1)
+        return cls._range(cls._well_type.from_str(a), x, cls._well_type.from_str(b))
+
+    @classmethod
+    def _parse_bytes(cls: type[Self], v: bytes) -> int:
+        match = BYTES_PATTERN.fullmatch(v)
+        if match is None:
+            msg = f"{v!r} is not a valid well expression"
+            raise RealizedParseError(msg, value=v)
+        a, x, b = match.group(1), match.group(2), match.group(3)
+        if x is None:
+            return 1 << (cls._well_type.from_bytes(a).as_index - 1)
+        return cls._range(cls._well_type.from_bytes(a), x.decode("ascii"), cls._well_type.from_bytes(b))
+
+    @staticmethod
+    def _range(a: Well, x: str, b: Well) -> int:
+        if x == "-":
+            return simple_range(a, b)
         elif x == "*":
-            return block_range(a, b, cls.well_type)
+            return block_range(a, b)
         elif x == "...":
-            return traversal_range(a, b, cls.well_type)
+            return traversal_range(a, b)
         msg = f"'{x}' is not a valid range operator"
-        raise RealizedParseError(msg, value=v)
+        raise RealizedParseError(msg, value=x)
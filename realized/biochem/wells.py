@@ -6,31 +6,27 @@ from __future__ import annotations
 
 import abc
 from dataclasses import dataclass
+from collections.abc import Callable
 from typing import Self, ClassVar
 
-import regex
 from pocketutils import ValueIllegalError
 
-from realized._core import Model
+from realized._core import Model, _check_key
+from realized.errors import ParseErrorCode, RealizedParseError
 
 __all__ = ["Well"]
-REGEX = regex.compile(r"^([A-Z]+)(\d+)$", flags=regex.V1)
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
 
-def _letters_to_number(s: str, base: int) -> int:
-    x = 0
-    for i, c in enumerate(s):
-        x += (len(s) - i) * base * ord(c) - 65 + 1
-    return x
+def _number_to_letters(x: int, n_rows: int) -> str:
+    # plates with more than 26 rows use two letters for every row: AA, AB, ..., AZ, BA, ...
+    if n_rows <= len(LETTERS):
+        return LETTERS[x - 1]
+    return LETTERS[(x - 1) // len(LETTERS)] + LETTERS[(x - 1) % len(LETTERS)]
 
 
-def _number_to_letters(x: int, base: int) -> str:
-    x -= 1
-    s = ""
-    while x:
-        s += "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[x % base]
-        x //= base
-    return s[::-1]
+def _label(row: int, col: int, n_rows: int, n_cols: int) -> str:
+    return _number_to_letters(row, n_rows) + str(col).zfill(len(str(n_cols)))
 
 
 @dataclass(slots=True, frozen=True, order=True)
@@ -40,6 +36,11 @@ class Well(Model, metaclass=abc.ABCMeta):
     col: int
     _n_rows: ClassVar[int]
     _n_cols: ClassVar[int]
+    # flyweight tables, filled by _build_tables; position i holds the well with index i + 1
+    _wells: ClassVar[tuple[Self, ...]]
+    _labels: ClassVar[tuple[str, ...]]
+    _by_label: ClassVar[dict[str, Self]]
+    _by_label_bytes: ClassVar[dict[bytes, Self]]
 
     def __post_init__(self: Self) -> None:
         if self.row > self._n_rows or self.row < 1:
@@ -49,24 +50,78 @@ class Well(Model, metaclass=abc.ABCMeta):
             _msg = f"Column {self.col} is out of bounds for {self.__class__.__name__}"
             raise ValueIllegalError(_msg, value=self.col)
 
+    @classmethod
+    def _build_tables(cls: type[Self]) -> None:
+        """
+        Precomputes one shared instance per well, plus its label.
+        Called once per plate type by the well type factory.
+        """
+        cls._wells = tuple(cls(r, c) for r in range(1, cls._n_rows + 1) for c in range(1, cls._n_cols + 1))
+        cls._labels = tuple(_label(w.row, w.col, cls._n_rows, cls._n_cols) for w in cls._wells)
+        cls._by_label = dict(zip(cls._labels, cls._wells, strict=True))
+        cls._by_label_bytes = {k.encode("ascii"): w for k, w in cls._by_label.items()}
+
     @classmethod
     def from_rc(cls: type[Self], r: int, c: int) -> Self:
-        return cls(r, c)
+        if not 1 <= c <= cls._n_cols or not 1 <= r <= cls._n_rows:
+            cls(r, c)  # raises the usual error
+        return cls._wells[cls._n_cols * (r - 1) + c - 1]
+
+    @classmethod
+    def _unchecked(cls: type[Self], row: int, col: int) -> Self:
+        # the shared instance, without the bounds check of from_rc
+        if Model._checks_trusted:
+            return cls.from_rc(row, col)
+        return cls._wells[cls._n_cols * (row - 1) + col - 1]
 
     @classmethod
     def from_index(cls: type[Self], i: int) -> Self:
-        return cls(cls._n_cols // i, cls._n_cols % i)
+        if not 1 <= i <= len(cls._wells):
+            _msg = f"Index {i} is out of bounds for {cls.__name__}"
+            raise ValueIllegalError(_msg, value=i)
+        return cls._wells[i - 1]
 
     @classmethod
     def from_str(cls: type[Self], v: str) -> Self:
-        match = REGEX.fullmatch(v)
-        row = _letters_to_number(match.group(1), cls._n_rows)
-        col = int(match.group(2))
-        return cls(row, col)
+        well = cls._by_label.get(v)
+        if well is None:
+            msg = f"'{v}' is not a well label for {cls.__name__}"
+            raise RealizedParseError(msg, value=v)
+        return well
+
+    @classmethod
+    def _try_from_str(cls: type[Self], v: str) -> Self | ParseErrorCode:
+        return cls._by_label.get(v, ParseErrorCode.SYNTAX)
+
+    @classmethod
+    def from_bytes(cls: type[Self], v: bytes | bytearray | memoryview) -> Self:
+        well = cls._by_label_bytes.get(v if v.__class__ is bytes else bytes(v))
+        if well is None:
+            msg = f"{bytes(v)!r} is not a well label for {cls.__name__}"
+            raise RealizedParseError(msg, value=bytes(v))
+        return well
+
+    def __reduce__(self: Self) -> tuple[Callable[[int, int, int], Self], tuple[int, int, int]]:
+        # well types are created at runtime, so they are found again by plate type in the registry
+        from realized.biochem.registries import _well  # noqa: PLC0415 (registries imports this module)
+
+        return _well, (self._n_rows, self._n_cols, self.as_index)
+
+    @property
+    def as_sort_key(self: Self) -> bytes:
+        """
+        The index (row by row) as 2 big-endian bytes.
+        """
+        return self.as_index.to_bytes(2, "big")
+
+    @classmethod
+    def from_sort_key(cls: type[Self], key: bytes) -> Self:
+        _check_key(cls, key, 2)
+        return cls.from_index(int.from_bytes(key, "big"))
 
     @property
     def as_str(self: Self) -> str:
-        return self.letter + str(self.col)
+        return self._labels[self._n_cols * (self.row - 1) + self.col - 1]
 
     @property
     def as_rc(self: Self) -> tuple[int, int]:
@@ -78,4 +133,4 @@ class Well(Model, metaclass=abc.ABCMeta):
 
     @property
     def letter(self: Self) -> str:
-        return _number_to_letters(self.row, self._n_rows)
+        return self.as_str.rstrip("0123456789")
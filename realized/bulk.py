@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Bulk parsing that reports invalid rows with error codes instead of raising.
+
+Requires NumPy (the `arrays` extra).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Generic, Self, TypeVar
+
+import numpy as np
+
+from realized._core import _PARSE_ERRORS, Model
+from realized.errors import ParseErrorCode
+
+__all__ = ["ParseResult", "try_parse_many"]
+M = TypeVar("M", bound=Model)
+
+
+@dataclass(slots=True, frozen=True)
+class ParseResult(Generic[M]):
+    """
+    The outcome of parsing each row: the model (or `None`), whether it is valid, and its `ParseErrorCode`.
+    `messages` maps a sample of invalid rows to the full message that `from_str` would have raised.
+    """
+
+    values: list[M | None]
+    valid: np.ndarray  # bool
+    codes: np.ndarray  # uint8 ParseErrorCode values; 0 for valid rows
+    messages: dict[int, str]
+
+    def __len__(self: Self) -> int:
+        return len(self.values)
+
+    @property
+    def n_invalid(self: Self) -> int:
+        return len(self.values) - int(self.valid.sum())
+
+    @property
+    def invalid_rows(self: Self) -> np.ndarray:
+        return np.flatnonzero(~self.valid)
+
+    def error_counts(self: Self) -> dict[ParseErrorCode, int]:
+        """
+        Counts invalid rows by error code, omitting codes with no rows.
+        """
+        counts = np.bincount(self.codes, minlength=len(ParseErrorCode))
+        return {code: int(counts[code]) for code in ParseErrorCode if code is not ParseErrorCode.OK and counts[code]}
+
+    @property
+    def summary(self: Self) -> str:
+        """
+        E.g. `3 of 1000 rows are invalid (SYNTAX: 2, RANGE: 1)`.
+        """
+        counts = ", ".join(f"{code.name}: {n}" for code, n in self.error_counts().items())
+        return f"{self.n_invalid} of {len(self)} rows are invalid" + (f" ({counts})" if counts else "")
+
+
+def try_parse_many(model_type: type[M], values: Iterable[str], *, max_messages: int = 0) -> ParseResult[M]:
+    """
+    Parses every value with `model_type._try_from_str`, which returns an error code rather than raising.
+
+    Args:
+        model_type: Any `Model` subclass
+        values: The `as_str` forms; other types get `ParseErrorCode.TYPE`
+        max_messages: Number of invalid rows, evenly spaced, for which to collect full error messages;
+                      only these rows pay for an exception
+
+    Example:
+        result = try_parse_many(InstantUtc, column, max_messages=5)
+        if result.n_invalid:
+            logger.warning(result.summary)
+        good = [v for v in result.values if v is not None]
+    """
+    values = values if isinstance(values, list | tuple) else list(values)
+    hook = model_type._try_from_str
+    parsed = [hook(v) if v.__class__ is str else ParseErrorCode.TYPE for v in values]
+    codes = np.fromiter((p if p.__class__ is ParseErrorCode else 0 for p in parsed), dtype=np.uint8, count=len(parsed))
+    valid = codes == 0
+    bad = np.flatnonzero(~valid)
+    if len(bad) > 0:
+        parsed = [None if p.__class__ is ParseErrorCode else p for p in parsed]
+    messages = {}
+    if max_messages > 0 and len(bad) > 0:
+        sample = bad[np.linspace(0, len(bad) - 1, min(max_messages, len(bad))).astype(np.int64)]
+        messages = {i: _message(model_type, values[i]) for i in np.unique(sample).tolist()}
+    return ParseResult(parsed, valid, codes, messages)
+
+
+def _message(model_type: type[Model], value: object) -> str:
+    if value.__class__ is not str:
+        return f"{value!r} has type {value.__class__.__qualname__}, not str"
+    try:
+        model_type.from_str(value)
+    except _PARSE_ERRORS as e:
+        return f"{e.__class__.__qualname__}: {e}"
+    return f"{value!r} is invalid"  # only if _try_from_str and from_str disagree
@@ -25,6 +25,24 @@ class Resolution(enum.StrEnum):
     def decimals(self: Self) -> int:
         return {Resolution.SECOND: 0, Resolution.MILLISECOND: 3, Resolution.MICROSECOND: 6}[self]
 
+    @property
+    def timespec(self: Self) -> str:
+        """
+        The matching `timespec` for `datetime.isoformat`.
+        """
+        return self.value + "s"
+
+    @classmethod
+    def of_microseconds(cls: type[Self], microseconds: int) -> Self:
+        """
+        Returns the coarsest resolution that represents a fractional second of `microseconds` exactly.
+        """
+        if microseconds % 1000 != 0:
+            return Resolution.MICROSECOND
+        if microseconds != 0:
+            return Resolution.MILLISECOND
+        return Resolution.SECOND
+
 
 DEFAULT_MIN_RESOLUTION = Resolution.SECOND
 
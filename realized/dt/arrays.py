@@ -0,0 +1,684 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Columnar arrays of instants (int64 epoch microseconds) and durations (int64 microseconds).
+
+Requires NumPy (the `arrays` extra).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Self
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from realized.dt import Resolution
+from realized.dt.durations import (
+    ColonSeparatedDuration,
+    Duration,
+    IsoDuration,
+    _any_micros,
+)
+from realized.dt.instants import UTC, Instant, InstantUtc, InstantWithCity, InstantWithOffset, get_zone
+from realized.dt.zones import ZoneTable
+from realized.errors import RealizedParseError, ZoneMismatchError
+
+__all__ = ["DurationArray", "InstantArray"]
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+ONE_MICROSECOND = timedelta(microseconds=1)
+MICROS_PER_MINUTE = 60_000_000
+_DECIMALS_TO_RESOLUTION = {r.decimals: r for r in Resolution}
+_NUMPY_UNITS = {Resolution.SECOND: "s", Resolution.MILLISECOND: "ms", Resolution.MICROSECOND: "us"}
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+_OFFSET_LIMIT = 14 * 60
+_INT64 = np.iinfo(np.int64)
+
+
+@dataclass(slots=True, frozen=True)
+class _ParsedColumn:
+    """
+    The raw result of parsing a column of RFC 3339 timestamps.
+    Rows where `valid` is false contain garbage in the other columns.
+    """
+
+    micros: np.ndarray
+    offsets: np.ndarray
+    decimals: np.ndarray
+    valid: np.ndarray
+
+
+def _instant_micros(instant: Instant) -> int:
+    return instant._utc_micros
+
+
+def _zone_offsets(zone: ZoneInfo, micros: np.ndarray) -> np.ndarray:
+    """
+    Returns the UTC offset in minutes of `zone` at each UTC epoch microsecond.
+    """
+    if zone.key == "Etc/UTC":
+        return np.zeros(len(micros), dtype=np.int16)
+    return (ZoneTable.of(zone).utc_offsets(micros) // 60).astype(np.int16)
+
+
+def _as_byte_matrix(values: Iterable[str | bytes] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Packs strings into an `(n, width)` matrix of ASCII bytes, NUL-padded, plus the length of each row.
+    Non-ASCII characters other than U+2212 (minus) become `?` and fail validation later.
+    """
+    arr = np.asarray(values if isinstance(values, np.ndarray) else list(values))
+    if len(arr) == 0:  # an empty list has dtype float64
+        return np.zeros((0, 0), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+    if arr.dtype.kind == "U":
+        arr = np.char.encode(np.char.replace(arr, "−", "-"), "ascii", "replace")
+    elif arr.dtype.kind != "S":
+        msg = f"Cannot parse values of dtype {arr.dtype}"
+        raise TypeError(msg)
+    if arr.dtype.itemsize == 0:
+        return np.zeros((len(arr), 0), dtype=np.uint8), np.zeros(len(arr), dtype=np.int64)
+    mat = np.ascontiguousarray(arr).view(np.uint8).reshape(len(arr), arr.dtype.itemsize)
+    nonzero = mat != 0
+    lengths = np.where(nonzero.any(axis=1), mat.shape[1] - np.argmax(nonzero[:, ::-1], axis=1), 0)
+    return mat, lengths.astype(np.int64)
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    # Howard Hinnant's algorithm, valid for the proleptic Gregorian calendar
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _digit_fields(m: np.ndarray, digits: np.ndarray) -> tuple[list[np.ndarray], np.ndarray]:
+    """
+    Extracts year, month, day, hour, minute, and second from their fixed positions,
+    with whether every digit and separator is in place.
+    """
+    valid = np.ones(len(m), dtype=bool)
+    for p, c in ((4, "-"), (7, "-"), (10, "T"), (13, ":"), (16, ":")):
+        valid &= m[:, p] == ord(c)
+    fields = []
+    for positions in ((0, 1, 2, 3), (5, 6), (8, 9), (11, 12), (14, 15), (17, 18)):
+        x = np.zeros(len(m), dtype=np.int64)
+        for p in positions:
+            valid &= (digits[:, p] >= 0) & (digits[:, p] <= 9)
+            x = 10 * x + digits[:, p]
+        fields.append(x)
+    return fields, valid
+
+
+def _fraction(m: np.ndarray, digits: np.ndarray, frac_len: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the fraction in microseconds, given the length of `.fff` or `.ffffff` (0 if absent) in each row,
+    and whether it is well-formed.
+    """
+    valid = (frac_len == 0) | (frac_len == 4) | (frac_len == 7)
+    valid &= (frac_len == 0) | (m[:, 19] == ord("."))
+    micros = np.zeros(len(m), dtype=np.int64)
+    for i in range(6):
+        d = digits[:, 20 + i]
+        used = frac_len > i + 1
+        valid &= ~used | ((d >= 0) & (d <= 9))
+        micros = 10 * micros + np.where(used, d, 0)  # unused digits pad with zeros
+    return micros, valid
+
+
+def _offset_minutes(m: np.ndarray, digits: np.ndarray, end: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the `±HH:MM` offset that ends each row, in minutes, and whether it is well-formed and in range.
+    """
+    rows = np.arange(len(m))
+    sign_char = m[rows, end - 6]
+    valid = (sign_char == ord("+")) | (sign_char == ord("-"))
+    valid &= m[rows, end - 3] == ord(":")
+    d = [digits[rows, end - k] for k in (5, 4, 2, 1)]
+    for x in d:
+        valid &= (x >= 0) & (x <= 9)
+    oh = 10 * d[0] + d[1]
+    om = 10 * d[2] + d[3]
+    offsets = np.where(sign_char == ord("-"), -1, 1) * (60 * oh + om)
+    valid &= (om < 60) & (np.abs(offsets) <= _OFFSET_LIMIT)
+    # negative zero ('-00:00') is forbidden
+    valid &= ~((sign_char == ord("-")) & (offsets == 0))
+    return offsets, valid
+
+
+def _calendar_valid(fields: list[np.ndarray]) -> np.ndarray:
+    year, month, day, hour, minute, second = fields
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_days = _DAYS_IN_MONTH[np.clip(month, 0, 12)] + ((month == 2) & leap)
+    valid = (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= month_days)
+    return valid & (hour <= 23) & (minute <= 59) & (second <= 59)
+
+
+def _parse_rfc3339_matrix(mat: np.ndarray, lengths: np.ndarray, *, utc: bool) -> _ParsedColumn:
+    """
+    Parses rows of `YYYY-MM-DDTHH:MM:SS[.fff|.ffffff]` followed by `Z` (if `utc`) or `±HH:MM`.
+    Every check is done column-wise; nothing is allocated per row.
+    """
+    n = len(mat)
+    width = mat.shape[1]
+    # pad so that fixed positions never go out of bounds
+    if width < 32:
+        mat = np.pad(mat, ((0, 0), (0, 32 - width)))
+    m = mat.astype(np.int64)
+    digits = m - 48
+    fields, valid = _digit_fields(m, digits)
+    year, month, day, hour, minute, second = fields
+    # the suffix determines where the fraction ends
+    suffix_len = 1 if utc else 6
+    frac_len = lengths - 19 - suffix_len
+    micros, frac_valid = _fraction(m, digits, frac_len)
+    end = np.clip(lengths, suffix_len, None)
+    if utc:
+        offsets = np.zeros(n, dtype=np.int64)
+        suffix_valid = m[np.arange(n), end - 1] == ord("Z")
+    else:
+        offsets, suffix_valid = _offset_minutes(m, digits, end)
+    valid &= frac_valid & suffix_valid & _calendar_valid(fields)
+    days = _days_from_civil(year, month, day)
+    seconds = ((days * 24 + hour) * 60 + minute) * 60 + second - offsets * 60
+    return _ParsedColumn(
+        micros=seconds * 1_000_000 + micros,
+        offsets=offsets.astype(np.int16),
+        decimals=np.maximum(frac_len - 1, 0),
+        valid=valid,
+    )
+
+
+def _raise_first_invalid(values: Sequence[Any] | np.ndarray, valid: np.ndarray, what: str) -> None:
+    if not valid.all():
+        i = int(np.argmin(valid))
+        msg = f"Row {i} ('{values[i]}') is not a valid {what}"
+        raise RealizedParseError(msg, value=values[i])
+
+
+def _int64_micros(micros: int, row: int, value: object) -> int:
+    # durations can parse to more microseconds than an int64 column holds
+    if not _INT64.min <= micros <= _INT64.max:
+        msg = f"Row {row} ('{value}') is out of range for int64 microseconds"
+        raise RealizedParseError(msg, value=value)
+    return micros
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class InstantArray:
+    """
+    A column of instants of one `Instant` subclass, without a Python object per element.
+
+    Stores int64 UTC epoch microseconds plus either one shared zone (`InstantUtc`, `InstantWithCity`)
+    or a per-row column of UTC offsets in minutes (`InstantWithOffset`).
+    Slicing returns views; indexing with an int returns an `Instant`.
+    Comparison operators are elementwise and return boolean arrays.
+    """
+
+    micros: np.ndarray
+    instant_type: type[Instant]
+    resolution: Resolution = field(default_factory=Resolution.default)
+    zone: ZoneInfo | None = UTC
+    offsets: np.ndarray | None = None
+
+    def __post_init__(self: Self) -> None:
+        if self.micros.ndim != 1 or self.micros.dtype != np.int64:
+            msg = f"micros must be a 1-D int64 array, not {self.micros.ndim}-D {self.micros.dtype}"
+            raise TypeError(msg)
+        if self.instant_type is InstantWithOffset:
+            if self.offsets is None or len(self.offsets) != len(self.micros):
+                msg = "InstantWithOffset arrays need exactly one offset per row"
+                raise ValueError(msg)
+            if self.zone is not None:
+                object.__setattr__(self, "zone", None)
+        elif self.zone is None or self.offsets is not None:
+            msg = f"{self.instant_type.__name__} arrays need one shared zone and no offsets"
+            raise ValueError(msg)
+        elif self.instant_type is InstantUtc and self.zone.key != "Etc/UTC":
+            msg = f"Zone '{self.zone.key}' is not Etc/UTC"
+            raise ZoneMismatchError(msg)
+
+    @classmethod
+    def from_instants(cls: type[Self], instants: Sequence[Instant], resolution: Resolution | None = None) -> Self:
+        """
+        Packs instants that all have the same type (and, except for `InstantWithOffset`, the same zone).
+        If `resolution` is `None`, uses the coarsest resolution that keeps every value exact.
+        """
+        if len(instants) == 0:
+            msg = "Cannot infer the instant type of an empty sequence"
+            raise ValueError(msg)
+        instant_type = type(instants[0])
+        if any(type(i) is not instant_type for i in instants):
+            msg = f"Not all instants are {instant_type.__name__}"
+            raise TypeError(msg)
+        micros = np.fromiter((_instant_micros(i) for i in instants), dtype=np.int64, count=len(instants))
+        resolution = resolution or cls._infer_resolution(micros)
+        if instant_type is InstantWithOffset:
+            offsets = np.fromiter((i._offset_minutes for i in instants), dtype=np.int16, count=len(instants))
+            return cls(micros, instant_type, resolution, None, offsets)
+        zone = instants[0].zone
+        if any(i.zone != zone for i in instants):
+            msg = f"Not all instants are in zone {zone}"
+            raise ZoneMismatchError(msg)
+        return cls(micros, instant_type, resolution, zone)
+
+    @classmethod
+    def from_strs(
+        cls: type[Self],
+        values: Iterable[str | bytes] | np.ndarray,
+        instant_type: type[Instant],
+        resolution: Resolution | None = None,
+    ) -> Self:
+        """
+        Parses the `as_str` forms of `instant_type` in bulk.
+        Rows may differ in resolution; if `resolution` is `None`, the finest one found is used.
+        `InstantWithCity` values must all share one zone.
+
+        Raises:
+            RealizedParseError: If any row is malformed
+            ZoneMismatchError: If an `InstantWithCity` row names a different zone or has the wrong offset
+        """
+        values = values if isinstance(values, np.ndarray) else list(values)
+        if len(values) == 0:
+            offsets = np.zeros(0, dtype=np.int16) if instant_type is InstantWithOffset else None
+            return cls(np.zeros(0, dtype=np.int64), instant_type, resolution or Resolution.default(), UTC, offsets)
+        zone = UTC
+        stamps = values
+        if instant_type is InstantWithCity:
+            stamps, zone = cls._split_city(values)
+        mat, lengths = _as_byte_matrix(stamps)
+        parsed = _parse_rfc3339_matrix(mat, lengths, utc=instant_type is InstantUtc)
+        _raise_first_invalid(values, parsed.valid, instant_type.__name__)
+        if resolution is None:
+            resolution = _DECIMALS_TO_RESOLUTION[int(parsed.decimals.max(initial=0))]
+        if instant_type is InstantWithOffset:
+            return cls(parsed.micros, instant_type, resolution, None, parsed.offsets)
+        if instant_type is InstantWithCity:
+            agrees = _zone_offsets(zone, parsed.micros) == parsed.offsets
+            if not agrees.all():
+                i = int(np.argmin(agrees))
+                msg = f"Offset of row {i} ('{values[i]}') disagrees with {zone.key}"
+                raise ZoneMismatchError(msg)
+        return cls(parsed.micros, instant_type, resolution, zone)
+
+    @classmethod
+    def _split_city(cls: type[Self], values: Sequence[str | bytes] | np.ndarray) -> tuple[np.ndarray, ZoneInfo]:
+        arr = np.asarray(values)
+        if arr.dtype.kind == "S":
+            arr = np.char.decode(arr, "ascii", "replace")
+        stamps, _, zones = np.char.partition(arr, " ").T
+        if len(zones) == 0:
+            return stamps, UTC
+        first = str(zones[0])
+        same = zones == first
+        if not same.all():
+            i = int(np.argmin(same))
+            msg = f"Row {i} ('{values[i]}') is not in the same zone as row 0 ({first})"
+            raise ZoneMismatchError(msg)
+        if not (first.startswith("[") and first.endswith("]")):
+            msg = f"Row 0 ('{values[0]}') has no [zone] suffix"
+            raise RealizedParseError(msg, value=values[0])
+        return stamps, get_zone(first[1:-1])
+
+    @classmethod
+    def _infer_resolution(cls: type[Self], micros: np.ndarray) -> Resolution:
+        if (micros % 1000 != 0).any():
+            return Resolution.MICROSECOND
+        if (micros % 1_000_000 != 0).any():
+            return Resolution.MILLISECOND
+        return Resolution.SECOND
+
+    def __len__(self: Self) -> int:
+        return len(self.micros)
+
+    def __iter__(self: Self) -> Iterator[Instant]:
+        return iter(self.to_instants())
+
+    def __getitem__(self: Self, i: int | slice | np.ndarray) -> Instant | Self:
+        if isinstance(i, int | np.integer):
+            offset = None if self.offsets is None else int(self.offsets[i])
+            return self._instant(int(self.micros[i]), offset)
+        offsets = None if self.offsets is None else self.offsets[i]
+        return self.__class__(self.micros[i], self.instant_type, self.resolution, self.zone, offsets)
+
+    def __eq__(self: Self, other: Self | Instant) -> np.ndarray:
+        return self.micros == self._other_micros(other)
+
+    def __ne__(self: Self, other: Self | Instant) -> np.ndarray:
+        return self.micros != self._other_micros(other)
+
+    def __lt__(self: Self, other: Self | Instant) -> np.ndarray:
+        return self.micros < self._other_micros(other)
+
+    def __le__(self: Self, other: Self | Instant) -> np.ndarray:
+        return self.micros <= self._other_micros(other)
+
+    def __gt__(self: Self, other: Self | Instant) -> np.ndarray:
+        return self.micros > self._other_micros(other)
+
+    def __ge__(self: Self, other: Self | Instant) -> np.ndarray:
+        return self.micros >= self._other_micros(other)
+
+    __hash__ = None
+
+    def argsort(self: Self) -> np.ndarray:
+        """
+        Returns the stable order of the rows by UTC instant.
+        """
+        return np.argsort(self.micros, kind="stable")
+
+    def sorted(self: Self) -> Self:
+        return self[self.argsort()]
+
+    @property
+    def is_sorted(self: Self) -> bool:
+        return bool((self.micros[1:] >= self.micros[:-1]).all())
+
+    @property
+    def local_offsets(self: Self) -> np.ndarray:
+        """
+        The UTC offset of every row, in minutes.
+        """
+        if self.offsets is not None:
+            return self.offsets
+        return _zone_offsets(self.zone, self.micros)
+
+    @property
+    def local_micros(self: Self) -> np.ndarray:
+        """
+        Wall-clock microseconds since 1970-01-01T00:00:00 (local time).
+        """
+        return self.micros + self.local_offsets.astype(np.int64) * MICROS_PER_MINUTE
+
+    @classmethod
+    def from_local_micros(
+        cls: type[Self],
+        local_micros: np.ndarray,
+        zone: ZoneInfo | str,
+        resolution: Resolution | None = None,
+        *,
+        fold: int = 0,
+    ) -> Self:
+        """
+        Creates an `InstantWithCity` array from wall-clock microseconds in `zone`.
+        Ambiguous and skipped wall times are resolved as `datetime` resolves them for `fold`.
+        """
+        table = ZoneTable.of(zone)
+        micros = table.to_utc(local_micros, fold=fold)
+        return cls(micros, InstantWithCity, resolution or cls._infer_resolution(micros), table.zone)
+
+    def to_zone(self: Self, zone: ZoneInfo | str) -> Self:
+        """
+        Returns the same instants as an `InstantWithCity` array in `zone` (or an `InstantUtc` array for `Etc/UTC`).
+        No values are copied; only the offsets used for display change.
+        """
+        zone = get_zone(zone) if isinstance(zone, str) else zone
+        instant_type = InstantUtc if zone.key == "Etc/UTC" else InstantWithCity
+        return self.__class__(self.micros, instant_type, self.resolution, zone)
+
+    def with_resolution(self: Self, resolution: Resolution) -> Self:
+        return self.__class__(self.micros, self.instant_type, resolution, self.zone, self.offsets)
+
+    def as_strs(self: Self, resolution: Resolution | None = None) -> np.ndarray:
+        """
+        Formats every row in the form of `instant_type.as_str`, returning a NumPy array of `str`.
+        Unlike `as_str`, one resolution (by default `self.resolution`) is used for every row,
+        so `...:00Z` in a millisecond column becomes `...:00.000Z`.
+        Values finer than the resolution are truncated toward the past.
+        """
+        if len(self.micros) == 0:
+            return np.array([], dtype=str)
+        resolution = resolution or self.resolution
+        unit = _NUMPY_UNITS[resolution]
+        offsets = self.local_offsets.astype(np.int64)
+        local = (self.micros + offsets * MICROS_PER_MINUTE).astype("datetime64[us]")
+        stamps = np.datetime_as_string(local, unit=unit)
+        if self.instant_type is InstantUtc:
+            return np.char.add(stamps, "Z")
+        sign = np.where(offsets < 0, "-", "+")
+        hours = np.char.zfill((np.abs(offsets) // 60).astype(str), 2)
+        minutes = np.char.zfill((np.abs(offsets) % 60).astype(str), 2)
+        stamps = np.char.add(np.char.add(np.char.add(stamps, sign), np.char.add(hours, ":")), minutes)
+        if self.instant_type is InstantWithCity:
+            stamps = np.char.add(stamps, f" [{self.zone.key}]")
+        return stamps
+
+    def to_instants(self: Self) -> list[Instant]:
+        """
+        Unpacks to one `Instant` per row.
+        """
+        if self.offsets is None:
+            return [self._instant(m, None) for m in self.micros.tolist()]
+        return [self._instant(m, o) for m, o in zip(self.micros.tolist(), self.offsets.tolist(), strict=True)]
+
+    def _instant(self: Self, micros: int, offset: int | None) -> Instant:
+        dt = EPOCH + timedelta(microseconds=micros)
+        tz = self.zone if offset is None else timezone(timedelta(minutes=offset))
+        return self.instant_type._unchecked(dt.astimezone(tz))
+
+    def _other_micros(self: Self, other: Self | Instant) -> np.ndarray | int:
+        if isinstance(other, InstantArray):
+            return other.micros
+        if isinstance(other, Instant):
+            return _instant_micros(other)
+        msg = f"Cannot compare {self.__class__.__qualname__} to {other.__class__.__qualname__}"
+        raise TypeError(msg)
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DurationArray:
+    """
+    A column of durations as int64 microseconds, without a Python object per element.
+
+    Arithmetic with other arrays, `Duration`s, `timedelta`s, and numbers is elementwise.
+    As with `timedelta`, multiplying or dividing by a float rounds half to even.
+    Comparison operators are elementwise and return boolean arrays.
+    """
+
+    micros: np.ndarray
+    duration_type: type[Duration] = IsoDuration
+
+    def __post_init__(self: Self) -> None:
+        if self.micros.ndim != 1 or self.micros.dtype != np.int64:
+            msg = f"micros must be a 1-D int64 array, not {self.micros.ndim}-D {self.micros.dtype}"
+            raise TypeError(msg)
+
+    @classmethod
+    def from_durations(cls: type[Self], durations: Sequence[Duration | timedelta]) -> Self:
+        """
+        Packs durations, keeping the type of the first (`IsoDuration` if there are none or they are `timedelta`s).
+        """
+        micros = np.fromiter((_duration_micros(d) for d in durations), dtype=np.int64, count=len(durations))
+        first = durations[0] if len(durations) > 0 else None
+        return cls(micros, first.__class__ if isinstance(first, Duration) else IsoDuration)
+
+    @classmethod
+    def from_strs(
+        cls: type[Self], values: Iterable[str] | np.ndarray, duration_type: type[Duration] = IsoDuration
+    ) -> Self:
+        """
+        Parses ISO 8601 (`PT1H2M3.5S`) or colon-separated (`01:02:03.500`) strings, detecting the format per row.
+        Each distinct string is parsed once, which is fast for the few distinct values typical of a column.
+
+        Raises:
+            RealizedParseError: If any row is in neither format, or out of range
+        """
+        values = values if isinstance(values, np.ndarray) else np.asarray(list(values), dtype=str)
+        uniques, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+        parsed = np.fromiter(
+            (_int64_micros(_any_micros(v), i, v) for v, i in zip(uniques.tolist(), first.tolist(), strict=True)),
+            dtype=np.int64,
+            count=len(uniques),
+        )
+        return cls(parsed[inverse.reshape(-1)], duration_type)
+
+    def __len__(self: Self) -> int:
+        return len(self.micros)
+
+    def __iter__(self: Self) -> Iterator[Duration]:
+        return iter(self.to_durations())
+
+    def __getitem__(self: Self, i: int | slice | np.ndarray) -> Duration | Self:
+        if isinstance(i, int | np.integer):
+            return self._duration(int(self.micros[i]))
+        return self.__class__(self.micros[i], self.duration_type)
+
+    def __add__(self: Self, other: Self | Duration | timedelta) -> Self:
+        return self._new(self.micros + self._other_micros(other))
+
+    def __radd__(self: Self, other: Duration | timedelta) -> Self:
+        return self + other
+
+    def __sub__(self: Self, other: Self | Duration | timedelta) -> Self:
+        return self._new(self.micros - self._other_micros(other))
+
+    def __rsub__(self: Self, other: Duration | timedelta) -> Self:
+        return self._new(self._other_micros(other) - self.micros)
+
+    def __mul__(self: Self, other: float | np.ndarray) -> Self:
+        return self._new(self._scaled(np.multiply, other))
+
+    def __rmul__(self: Self, other: float | np.ndarray) -> Self:
+        return self * other
+
+    def __truediv__(self: Self, other: Self | Duration | timedelta | float | np.ndarray) -> Self | np.ndarray:
+        if isinstance(other, DurationArray | Duration | timedelta):
+            return self.micros / self._other_micros(other)  # a ratio
+        return self._new(self._scaled(np.true_divide, other))
+
+    def __floordiv__(self: Self, other: Self | Duration | timedelta | int | np.ndarray) -> Self | np.ndarray:
+        if isinstance(other, DurationArray | Duration | timedelta):
+            return self.micros // self._other_micros(other)  # a count
+        return self._new(self.micros // np.asarray(other, dtype=np.int64))
+
+    def __neg__(self: Self) -> Self:
+        return self._new(-self.micros)
+
+    def __abs__(self: Self) -> Self:
+        return self._new(np.abs(self.micros))
+
+    def __eq__(self: Self, other: Self | Duration | timedelta) -> np.ndarray:
+        return self.micros == self._other_micros(other)
+
+    def __ne__(self: Self, other: Self | Duration | timedelta) -> np.ndarray:
+        return self.micros != self._other_micros(other)
+
+    def __lt__(self: Self, other: Self | Duration | timedelta) -> np.ndarray:
+        return self.micros < self._other_micros(other)
+
+    def __le__(self: Self, other: Self | Duration | timedelta) -> np.ndarray:
+        return self.micros <= self._other_micros(other)
+
+    def __gt__(self: Self, other: Self | Duration | timedelta) -> np.ndarray:
+        return self.micros > self._other_micros(other)
+
+    def __ge__(self: Self, other: Self | Duration | timedelta) -> np.ndarray:
+        return self.micros >= self._other_micros(other)
+
+    __hash__ = None
+
+    def sum(self: Self) -> Duration:
+        return self._duration(int(self.micros.sum()))
+
+    def mean(self: Self) -> Duration:
+        # exact integer sum, then one rounding (half to even, as timedelta rounds)
+        return self._duration(_round_half_even(int(self.micros.sum()), len(self.micros)))
+
+    def min(self: Self) -> Duration:
+        return self._duration(int(self.micros.min()))
+
+    def max(self: Self) -> Duration:
+        return self._duration(int(self.micros.max()))
+
+    def quantile(self: Self, q: float | Sequence[float] | np.ndarray) -> Duration | Self:
+        """
+        Returns the `q`-th quantile(s), linearly interpolated and rounded half to even.
+        """
+        values = np.rint(np.quantile(self.micros, q)).astype(np.int64)
+        if values.ndim == 0:
+            return self._duration(int(values))
+        return self._new(values)
+
+    def median(self: Self) -> Duration:
+        return self.quantile(0.5)
+
+    def as_iso8601(self: Self) -> np.ndarray:
+        """
+        Formats every row as `Duration.as_iso8601` would, returning a NumPy array of `str`.
+        """
+        sign, h, m, s, fraction = self._fields()
+        hours = np.where(h > 0, np.char.add(h.astype(str), "H"), "")
+        minutes = np.where(m > 0, np.char.add(m.astype(str), "M"), "")
+        seconds = np.where((s > 0) | (fraction != ""), np.char.add(np.char.add(s.astype(str), fraction), "S"), "")
+        out = np.char.add(np.char.add(np.char.add(sign, "PT"), np.char.add(hours, minutes)), seconds)
+        return np.where(self.micros == 0, "PT0S", out)
+
+    def as_colon_separated(self: Self) -> np.ndarray:
+        """
+        Formats every row as `Duration.as_colon_separated` would, returning a NumPy array of `str`.
+        """
+        sign, h, m, s, fraction = self._fields()
+        hms = np.char.add(
+            np.char.add(np.char.zfill(h.astype(str), 2), ":"),
+            np.char.add(np.char.add(np.char.zfill(m.astype(str), 2), ":"), np.char.zfill(s.astype(str), 2)),
+        )
+        return np.char.add(np.char.add(sign, hms), fraction)
+
+    def as_strs(self: Self) -> np.ndarray:
+        """
+        Formats every row as `duration_type.as_str` would.
+        """
+        if issubclass(self.duration_type, ColonSeparatedDuration):
+            return self.as_colon_separated()
+        return self.as_iso8601()
+
+    def to_durations(self: Self) -> list[Duration]:
+        return [self._duration(m) for m in self.micros.tolist()]
+
+    def _fields(self: Self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # sign, hours, minutes, seconds, and the fraction with as few digits as are exact (none, 3, or 6)
+        sign = np.where(self.micros < 0, "-", "")
+        s, u = np.divmod(np.abs(self.micros), 1_000_000)
+        h, s = np.divmod(s, 3600)
+        m, s = np.divmod(s, 60)
+        millis = np.char.add(".", np.char.zfill((u // 1000).astype(str), 3))
+        micros = np.char.add(".", np.char.zfill(u.astype(str), 6))
+        fraction = np.where(u == 0, "", np.where(u % 1000 == 0, millis, micros))
+        return sign, h, m, s, fraction
+
+    def _duration(self: Self, micros: int) -> Duration:
+        return self.duration_type._from_raw(micros)
+
+    def _new(self: Self, micros: np.ndarray) -> Self:
+        return self.__class__(micros, self.duration_type)
+
+    def _scaled(self: Self, op: np.ufunc, other: float | np.ndarray) -> np.ndarray:
+        other = np.asarray(other)
+        if other.dtype.kind in "iub" and op is np.multiply:
+            return self.micros * other.astype(np.int64)
+        return np.rint(op(self.micros, other)).astype(np.int64)
+
+    def _other_micros(self: Self, other: Self | Duration | timedelta) -> np.ndarray | int:
+        if isinstance(other, DurationArray):
+            return other.micros
+        if isinstance(other, Duration | timedelta):
+            return _duration_micros(other)
+        msg = f"Cannot combine {self.__class__.__qualname__} with {other.__class__.__qualname__}"
+        raise TypeError(msg)
+
+
+def _duration_micros(d: Duration | timedelta) -> int:
+    return (d.delta if isinstance(d, Duration) else d) // ONE_MICROSECOND
+
+
+def _round_half_even(n: int, d: int) -> int:
+    q, r = divmod(n, d)
+    if 2 * r > d or 2 * r == d and q % 2 == 1:
+        return q + 1
+    return q
@@ -0,0 +1,309 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Column files of instants or durations, read through `mmap` without loading them.
+
+A file is a 4096-byte header followed by the rows packed with `BinaryLayout`:
+int64 UTC epoch (or duration) microseconds, plus an int16 UTC offset for `InstantWithOffset`.
+The header is `MAGIC`, a little-endian uint32 length, and that many bytes of JSON,
+which holds `BinaryLayout.describe()` (including the zone of UTC and city columns),
+the number of rows, whether they are sorted, and the finest resolution used.
+
+Requires NumPy (the `arrays` extra).
+"""
+
+from __future__ import annotations
+
+import itertools
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+from os import PathLike
+from pathlib import Path
+from typing import Any, BinaryIO, Generic, Self, TypeVar
+
+import numpy as np
+import orjson
+
+from realized.binary import BinaryLayout
+from realized.dt import Resolution
+from realized.dt.arrays import (
+    _DECIMALS_TO_RESOLUTION,
+    DurationArray,
+    InstantArray,
+    _duration_micros,
+    _instant_micros,
+)
+from realized.dt.durations import ColonSeparatedDuration, Duration, IsoDuration
+from realized.dt.instants import UTC, Instant, InstantUtc, InstantWithCity, InstantWithOffset
+from realized.errors import RealizedParseError
+
+__all__ = ["ColumnFile", "write_column"]
+T = TypeVar("T", Instant, Duration)
+MAGIC = b"RLZCOL01"
+HEADER_SIZE = 4096  # also keeps the rows page-aligned
+CHUNK_SIZE = 1 << 16
+_LENGTH = struct.Struct("<I")
+_TYPES = {t.__name__: t for t in (InstantUtc, InstantWithOffset, InstantWithCity, IsoDuration, ColonSeparatedDuration)}
+
+
+def _decimals(micros: np.ndarray) -> int:
+    if (micros % 1000 != 0).any():
+        return 6
+    return 3 if (micros % 1_000_000 != 0).any() else 0
+
+
+def _bound(v: Instant | Duration | timedelta | int) -> int:
+    if isinstance(v, Instant):
+        return _instant_micros(v)
+    if isinstance(v, Duration | timedelta):
+        return _duration_micros(v)
+    return int(v)
+
+
+def write_column(
+    path: str | PathLike[str],
+    values: InstantArray | DurationArray | Iterable[T],
+    *,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """
+    Writes instants or durations, all of one type, to a column file.
+    Models are packed `chunk_size` at a time, so an iterable of any length can be written.
+    The rows are written to a temporary file beside `path`, which replaces `path` only once complete,
+    so an error leaves any existing file as it was.
+
+    Returns:
+        The number of rows written
+
+    Raises:
+        TypeError: If the values are not instants or durations, or not all of one type
+        ValueError: If `InstantWithCity` values are not all in one zone
+    """
+    if isinstance(values, InstantArray | DurationArray):
+        chunks, layout = _array_chunks(values, chunk_size)
+    else:
+        chunks, layout = _model_chunks(iter(values), chunk_size)
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            n_rows = _write_rows(f, chunks, layout)
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return n_rows
+
+
+def _write_rows(f: BinaryIO, chunks: Iterable[bytes], layout: BinaryLayout) -> int:
+    n_rows, is_sorted, decimals, last = 0, True, 0, None
+    f.truncate(HEADER_SIZE)  # the header is padded to full size even if there are no rows
+    f.seek(HEADER_SIZE)
+    for data in chunks:
+        micros = np.frombuffer(data, dtype=layout.numpy_dtype())["micros"]
+        if len(micros) > 0:
+            in_order = (micros[1:] >= micros[:-1]).all() and (last is None or micros[0] >= last)
+            is_sorted = is_sorted and bool(in_order)
+            decimals = max(decimals, _decimals(micros))
+            last = int(micros[-1])
+        n_rows += len(micros)
+        f.write(data)
+    header = {
+        **layout.describe(),
+        "rows": n_rows,
+        "sorted": is_sorted,
+        "resolution": _DECIMALS_TO_RESOLUTION[decimals].value,
+    }
+    encoded = orjson.dumps(header)
+    if len(MAGIC) + _LENGTH.size + len(encoded) > HEADER_SIZE:
+        msg = f"Header of {len(encoded)} bytes does not fit in {HEADER_SIZE}"
+        raise ValueError(msg)
+    f.seek(0)
+    f.write(MAGIC + _LENGTH.pack(len(encoded)) + encoded)
+    return n_rows
+
+
+def _layout(model_type: type[T], zone: Any = None) -> BinaryLayout[T]:
+    if not issubclass(model_type, Instant | Duration):
+        msg = f"Column files hold instants or durations, not {model_type.__qualname__}"
+        raise TypeError(msg)
+    return BinaryLayout.of(model_type, zone)
+
+
+def _array_chunks(values: InstantArray | DurationArray, chunk_size: int) -> tuple[Iterable[bytes], BinaryLayout]:
+    if isinstance(values, DurationArray):
+        layout = _layout(values.duration_type)
+    else:
+        layout = _layout(values.instant_type, values.zone)
+    records = np.empty(len(values.micros), dtype=layout.numpy_dtype())
+    records["micros"] = values.micros
+    if "offset_minutes" in records.dtype.names:
+        records["offset_minutes"] = values.offsets
+    return (records[i : i + chunk_size].tobytes() for i in range(0, len(records), chunk_size)), layout
+
+
+def _model_chunks(values: Iterable[T], chunk_size: int) -> tuple[Iterable[bytes], BinaryLayout]:
+    first = list(itertools.islice(values, chunk_size))
+    if not first:
+        msg = "Cannot infer the type of an empty column; write an InstantArray or DurationArray instead"
+        raise TypeError(msg)
+    model_type = first[0].__class__
+    layout = _layout(model_type, first[0].zone if issubclass(model_type, InstantWithCity) else None)
+
+    def chunks() -> Iterable[bytes]:
+        chunk = first
+        while chunk:
+            if any(m.__class__ is not model_type for m in chunk):
+                msg = f"Values are not all {model_type.__name__}"
+                raise TypeError(msg)
+            yield layout.encode(chunk)
+            chunk = list(itertools.islice(values, chunk_size))
+
+    return chunks(), layout
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class ColumnFile(Generic[T]):
+    """
+    A column file mapped into memory, read-only.
+
+    Arrays from `records`, `micros`, and `to_array` are views of the mapping, created in constant time;
+    pages are read from disk as they are touched, so only the scanned range of a large file is loaded.
+    `search` and `between` use binary search, for files written in ascending order.
+
+    Example:
+        with ColumnFile.open("timestamps.col") as column:
+            window = column.between(start, end)  # an InstantArray over the mapped rows
+            counts = np.bincount(window.micros // 3_600_000_000 % 24)
+    """
+
+    layout: BinaryLayout[T]
+    n_rows: int
+    is_sorted: bool
+    resolution: Resolution
+    _mmap: mmap.mmap
+
+    @classmethod
+    def open(cls: type[Self], path: str | PathLike[str], model_type: type[T] | None = None) -> Self:
+        """
+        Maps a column file written by `write_column`.
+        `model_type` overrides the type named in the header, e.g. for a subclass.
+
+        Raises:
+            RealizedParseError: If the file is not a column file
+        """
+        path = Path(path)
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER_SIZE:  # mmap cannot map an empty file
+                msg = f"{path} is not a column file"
+                raise RealizedParseError(msg, value=str(path))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls._of_mapping(mapped, path, model_type)
+        except BaseException:
+            mapped.close()
+            raise
+
+    @classmethod
+    def _of_mapping(cls: type[Self], mapped: mmap.mmap, path: Path, model_type: type[T] | None) -> Self:
+        if mapped[: len(MAGIC)] != MAGIC:
+            msg = f"{path} is not a column file"
+            raise RealizedParseError(msg, value=str(path))
+        (length,) = _LENGTH.unpack_from(mapped, len(MAGIC))
+        start = len(MAGIC) + _LENGTH.size
+        try:
+            header = orjson.loads(mapped[start : start + length])
+            model_type = model_type or _TYPES[header["type"]]
+            zone = header["zone"] if issubclass(model_type, InstantWithCity) else None
+            n_rows, is_sorted, struct_format = header["rows"], header["sorted"], header["struct"]
+            resolution = Resolution(header["resolution"])
+        except (ValueError, LookupError, TypeError) as e:  # including orjson.JSONDecodeError
+            msg = f"{path} has an invalid header"
+            raise RealizedParseError(msg, value=str(path)) from e
+        layout = _layout(model_type, zone)
+        if len(mapped) != HEADER_SIZE + n_rows * layout.size or layout.struct_format != struct_format:
+            msg = f"{path} does not match its header {header}"
+            raise RealizedParseError(msg, value=str(path))
+        return cls(layout, n_rows, is_sorted, resolution, mapped)
+
+    def __len__(self: Self) -> int:
+        return self.n_rows
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *args: object) -> None:
+        self.close()
+
+    def close(self: Self) -> None:
+        """
+        Unmaps the file.
+
+        Raises:
+            BufferError: If arrays from this file are still referenced
+        """
+        self._mmap.close()
+
+    @property
+    def model_type(self: Self) -> type[T]:
+        return self.layout.model_type
+
+    @property
+    def records(self: Self) -> np.ndarray:
+        """
+        A read-only structured array of the rows, as in `BinaryLayout.dtype_descr`.
+        """
+        return np.frombuffer(self._mmap, dtype=self.layout.numpy_dtype(), count=self.n_rows, offset=HEADER_SIZE)
+
+    @property
+    def micros(self: Self) -> np.ndarray:
+        """
+        A read-only int64 array of the UTC epoch or duration microseconds.
+        """
+        return self.records["micros"]
+
+    def to_array(self: Self) -> InstantArray | DurationArray:
+        """
+        Returns all rows as an `InstantArray` or `DurationArray` over the mapping, without copying.
+        """
+        records = self.records
+        if issubclass(self.model_type, Duration):
+            return DurationArray(records["micros"], self.model_type)
+        if issubclass(self.model_type, InstantWithOffset):
+            return InstantArray(records["micros"], self.model_type, self.resolution, None, records["offset_minutes"])
+        return InstantArray(records["micros"], self.model_type, self.resolution, self.layout.zone or UTC)
+
+    def __getitem__(self: Self, i: int | slice) -> T | InstantArray | DurationArray:
+        return self.to_array()[i]
+
+    def search(
+        self: Self, start: Instant | Duration | timedelta | int, end: Instant | Duration | timedelta | int
+    ) -> slice:
+        """
+        Returns the slice of rows in `[start, end)`, in O(log n) page reads.
+        Bounds are models or raw microseconds.
+
+        Raises:
+            ValueError: If the rows are not sorted
+        """
+        if not self.is_sorted:
+            msg = "Rows are not sorted, so ranges cannot be found by binary search"
+            raise ValueError(msg)
+        micros = self.micros
+        lo = int(np.searchsorted(micros, _bound(start), side="left"))
+        hi = int(np.searchsorted(micros, _bound(end), side="left"))
+        return slice(lo, max(lo, hi))
+
+    def between(
+        self: Self, start: Instant | Duration | timedelta | int, end: Instant | Duration | timedelta | int
+    ) -> InstantArray | DurationArray:
+        """
+        Returns the rows in `[start, end)` as a view (see `search`).
+        """
+        return self.to_array()[self.search(start, end)]
@@ -6,29 +6,125 @@ from __future__ import annotations
 
 import functools
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Self
 
 from pocketutils import ValueIllegalError
 
-from realized._core import Model
-from realized.errors import RealizedParseError
+from realized._core import Model, _check_key, _from_raw, _int64_key, _int64_of_key
+from realized.errors import ParseErrorCode, RealizedParseError
 
 __all__ = ["Duration", "IsoDuration", "ColonSeparatedDuration", "Hmsu"]
 DURATION_MICROSEC_REGEX = re.compile(
-    r"PT"
-    r"(?:(?P<hours>[1-9]|1[0-9]|2[0-3])H)??"
-    r"(?:(?P<minutes>[1-9]|[1-5][0-9])M)??"
-    r"(?:(?P<seconds>[1-9]|[1-5][0-9])S)??"
-    r"(?:\.(?P<microseconds>\d{1,6})?S)??"
+    r"(?P<sign>-)?P"
+    r"(?:(?P<days>\d+)D)?"
+    r"(?:T"
+    r"(?:(?P<hours>\d+)H)?"
+    r"(?:(?P<minutes>\d+)M)?"
+    r"(?:(?P<seconds>\d+)(?:\.(?P<fraction>\d{1,6}))?S)?"
+    r")?"
 )
 DURATION_HMSU_REGEX = re.compile(
+    r"(?P<sign>-)?"
     r"(?P<hours>\d+)"
     r":(?P<minutes>[0-5]\d|60)"
     r":(?P<seconds>[0-5]\d|60)"
-    r"(?:\.(?P<microseconds>\d{3}|\d{6}))?"
+    r"(?:\.(?P<fraction>\d{3}|\d{6}))?"
 )
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_MIN_MICROS, _MAX_MICROS = timedelta.min // _ONE_MICROSECOND, timedelta.max // _ONE_MICROSECOND
+_MICROS_PER = {"days": 86_400_000_000, "hours": 3_600_000_000, "minutes": 60_000_000, "seconds": 1_000_000}
+
+
+def _match_micros(match: re.Match[str]) -> int:
+    groups = match.groupdict()
+    micros = sum(int(groups[k]) * per for k, per in _MICROS_PER.items() if groups.get(k) is not None)
+    if groups["fraction"] is not None:
+        micros += int(groups["fraction"].ljust(6, "0"))
+    return -micros if groups["sign"] else micros
+
+
+def _iso8601_micros(v: str) -> int:
+    """
+    Parses `[-]P[nD][T[nH][nM][n[.f]S]]`, with up to 6 fractional digits, to microseconds.
+    """
+    match = DURATION_MICROSEC_REGEX.fullmatch(v)
+    # reject the empty forms "P" and "PT", and a "T" with nothing after it
+    if match is None or v.endswith(("P", "T")):
+        msg = f"'{v}' is not in ISO8601 format"
+        raise RealizedParseError(msg, value=v)
+    return _match_micros(match)
+
+
+def _try_micros(regex: re.Pattern[str], v: str) -> int | ParseErrorCode:
+    match = regex.fullmatch(v)
+    if match is None or regex is DURATION_MICROSEC_REGEX and v.endswith(("P", "T")):
+        return ParseErrorCode.SYNTAX
+    micros = _match_micros(match)
+    return micros if _MIN_MICROS <= micros <= _MAX_MICROS else ParseErrorCode.RANGE
+
+
+def _colon_separated_micros(v: str) -> int:
+    match = DURATION_HMSU_REGEX.fullmatch(v)
+    if match is None:
+        msg = f"'{v}' is not in HH:MM:SS[.iii[iii]] format"
+        raise RealizedParseError(msg, value=v)
+    return _match_micros(match)
+
+
+def _any_micros(v: str) -> int:
+    """
+    Parses either format, choosing by the leading `P` rather than by trying each parser in turn.
+    """
+    if v.startswith(("P", "-P")):
+        return _iso8601_micros(v)
+    match = DURATION_HMSU_REGEX.fullmatch(v)
+    if match is None:
+        msg = f"'{v}' is in neither ISO8601 nor colon-separated format"
+        raise RealizedParseError(msg, value=v)
+    return _match_micros(match)
+
+
+def _delta(micros: int, v: str) -> timedelta:
+    try:
+        return timedelta(microseconds=micros)
+    except OverflowError as e:
+        msg = f"'{v}' is out of range for a duration"
+        raise RealizedParseError(msg, value=v) from e
+
+
+def _fraction(u: int) -> str:
+    # as few digits as are exact: none, 3, or 6
+    if u == 0:
+        return ""
+    if u % 1000 == 0:
+        return f".{u // 1000:03}"
+    return f".{u:06}"
+
+
+def _iso8601_str(micros: int) -> str:
+    sign = "-" if micros < 0 else ""
+    s, u = divmod(abs(micros), 1_000_000)
+    h, s = divmod(s, 3600)
+    m, s = divmod(s, 60)
+    if h == m == s == u == 0:
+        return "PT0S"
+    return (
+        f"{sign}PT"
+        + (f"{h}H" if h > 0 else "")
+        + (f"{m}M" if m > 0 else "")
+        + (f"{s}{_fraction(u)}S" if s > 0 or u > 0 else "")
+    )
+
+
+def _colon_separated_str(micros: int) -> str:
+    sign = "-" if micros < 0 else ""
+    s, u = divmod(abs(micros), 1_000_000)
+    h, s = divmod(s, 3600)
+    m, s = divmod(s, 60)
+    return f"{sign}{h:02}:{m:02}:{s:02}{_fraction(u)}"
 
 
 @functools.total_ordering
@@ -84,6 +180,35 @@ class Duration:
         if self.delta.days < 0 and self.delta == timedelta(0):
             raise ValueIllegalError("Duration is negative 0", value=-0.0)
 
+    @classmethod
+    def _from_raw(cls: type[Self], micros: int) -> Self:
+        """
+        Trusted constructor from microseconds, for unpickling and decoding.
+        """
+        if Model._checks_trusted:
+            return cls(timedelta(microseconds=micros))
+        duration = object.__new__(cls)
+        object.__setattr__(duration, "delta", timedelta(microseconds=micros))
+        return duration
+
+    def __reduce__(self: Self) -> tuple[Callable[..., Self], tuple]:
+        return _from_raw, (self.__class__, self.delta // _ONE_MICROSECOND)
+
+    @property
+    def as_sort_key(self: Self) -> bytes:
+        """
+        The microseconds as a biased big-endian int64.
+        """
+        return _int64_key(self.delta // _ONE_MICROSECOND)
+
+    @classmethod
+    def from_sort_key(cls: type[Self], key: bytes) -> Self:
+        _check_key(cls, key, 8)
+        return cls._from_raw(_int64_of_key(key))
+
+    def __mul__(self: Self, v: float) -> Self:
+        return self.__class__(self.delta * v)
+
     def __truediv__(self: Self, v: float | Self | timedelta) -> Self:
         v = v.delta if isinstance(v, Duration) else v
         return self.__class__(self.delta / v)
@@ -105,36 +230,15 @@ class Duration:
 
     @classmethod
     def from_any(cls: type[Self], v: str) -> Self:
-        for fn in (cls.from_iso8601, cls.from_colon_separated):
-            try:
-                return fn(v)
-            except RealizedParseError:
-                pass
-        msg = f"'{v}' is in neither ISO8601 nor colon-separated format"
-        raise RealizedParseError(msg)
+        return cls(_delta(_any_micros(v), v))
 
     @classmethod
     def from_iso8601(cls: type[Self], v: str) -> Self:
-        match = DURATION_MICROSEC_REGEX.fullmatch(v)
-        if match is None:
-            msg = f"'{v}' is not in ISO8601 format"
-            raise RealizedParseError(msg, value=v)
-        delta = timedelta(**{k: int(v) for k, v in match.groupdict().items()})
-        return cls(delta)
+        return cls(_delta(_iso8601_micros(v), v))
 
     @classmethod
     def from_colon_separated(cls: type[Self], v: str) -> Self:
-        match = DURATION_HMSU_REGEX.fullmatch(v)
-        if not match:
-            msg = f"'{v} is not in HH:MM:SS[.iiiiii] format"
-            raise RealizedParseError(msg)
-        return Hmsu(
-            sign=1,
-            h=int(match.group(1)),
-            m=int(match.group(2)),
-            s=int(match.group(3)),
-            u=int(match.group(4)),
-        )
+        return cls(_delta(_colon_separated_micros(v), v))
 
     @classmethod
     def from_seconds(cls: type[Self], v: int) -> Self:
@@ -151,26 +255,15 @@ class Duration:
     @property
     def as_microseconds(self: Self) -> int:
         # always exact
-        return int(1000000 * self.delta.total_seconds())
+        return self.delta // _ONE_MICROSECOND
 
     @property
     def as_iso8601(self: Self) -> str:
-        x = self.as_hmsu
-        return (
-            "PT"
-            + (f"{x.h}H" if x.h > 0 else "")
-            + (f"{x.m}M" if x.m > 0 else "")
-            + (f"{x.s}S" if x.s > 0 and x.u == 0 else "")
-            + (f"{x.s}.{x.u}S" if x.u > 0 else "")
-        )
+        return _iso8601_str(self.as_microseconds)
 
     @property
     def as_colon_separated(self: Self) -> str:
-        x = self.as_hmsu
-        h = f"{x.h:02}" if len(str(x.h)) < 2 else str(x.h)
-        if x.u > 0:
-            return f"{h}:{x.m:02}:{x.s:02}.{x.u}"
-        return f"{h}:{x.m:02}:{x.s:02}"
+        return _colon_separated_str(self.as_microseconds)
 
     @property
     def as_hmsu(self: Self) -> Hmsu:
@@ -196,6 +289,11 @@ class IsoDuration(Duration, Model):
     def from_str(cls: type[Self], v: str) -> Self:
         return cls.from_iso8601(v)
 
+    @classmethod
+    def _try_from_str(cls: type[Self], v: str) -> Self | ParseErrorCode:
+        micros = _try_micros(DURATION_MICROSEC_REGEX, v)
+        return micros if micros.__class__ is ParseErrorCode else cls(timedelta(microseconds=micros))
+
     @property
     def as_str(self: Self) -> str:
         return self.as_iso8601
@@ -208,6 +306,11 @@ class ColonSeparatedDuration(Duration, Model):
     def from_str(cls: type[Self], v: str) -> Self:
         return cls.from_colon_separated(v)
 
+    @classmethod
+    def _try_from_str(cls: type[Self], v: str) -> Self | ParseErrorCode:
+        micros = _try_micros(DURATION_HMSU_REGEX, v)
+        return micros if micros.__class__ is ParseErrorCode else cls(timedelta(microseconds=micros))
+
     @property
     def as_str(self: Self) -> str:
         return self.as_colon_separated
@@ -4,17 +4,119 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import functools
+import zoneinfo
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Self
 from zoneinfo import ZoneInfo
 
 from realized import Resolution
-from realized._core import Model, JsonType
+from realized._core import JsonType, Model, _check_key, _from_raw, _int64_key, _int64_of_key
 from realized.dt.durations import Duration
-from realized.errors import DatetimeMissingZoneError, ZoneMismatchError
+from realized.errors import DatetimeMissingZoneError, ParseErrorCode, RealizedParseError, ZoneMismatchError
 
 __all__ = ["Instant", "InstantUtc", "InstantWithOffset", "InstantWithCity"]
+UTC = ZoneInfo("Etc/UTC")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_ONE_MINUTE = timedelta(minutes=1)
+_MAX_OFFSET = timedelta(hours=14)
+# Every digit maps to 'd', so a value's "shape" is a fixed-position template of its format
+_SHAPE = bytes.maketrans(b"0123456789", b"dddddddddd")
+_BODY_SHAPES = (b"dddd-dd-ddTdd:dd:dd", b"dddd-dd-ddTdd:dd:dd.ddd", b"dddd-dd-ddTdd:dd:dd.dddddd")
+_UTC_SHAPES = frozenset(b + b"Z" for b in _BODY_SHAPES)
+_OFFSET_SHAPES = frozenset(b + sign + b"dd:dd" for b in _BODY_SHAPES for sign in (b"+", b"-"))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_zone(key: str) -> ZoneInfo:
+    """
+    Returns the `ZoneInfo` for an IANA key, also accepting `UTC` for `Etc/UTC`.
+    Cached, which is much faster than the `ZoneInfo` constructor's own cache.
+    """
+    return ZoneInfo("Etc/UTC" if key == "UTC" else key)
+
+
+@functools.lru_cache(maxsize=256)
+def _fixed_offset(minutes: int) -> timezone:
+    return timezone(timedelta(minutes=minutes))
+
+
+def _in_zone(dt: datetime, zone: ZoneInfo) -> datetime | None:
+    """
+    Returns `dt` with its zone replaced by `zone` if the offset agrees, using `fold=1` for the second of two
+    repeated wall times; otherwise `None`.
+    """
+    local = dt.replace(tzinfo=zone)
+    if local.utcoffset() == dt.utcoffset():
+        return local
+    local = local.replace(fold=1)
+    return local if local.utcoffset() == dt.utcoffset() else None
+
+
+def _rfc3339_ascii(s: str | bytes | bytearray | memoryview) -> bytes:
+    try:
+        return s.encode("ascii") if isinstance(s, str) else bytes(s)
+    except UnicodeEncodeError:
+        return s.replace("−", "-").encode("ascii", "replace")
+
+
+def _has_rfc3339_shape(b: bytes, *, utc: bool) -> bool:
+    """
+    Checks the layout against fixed templates with one `bytes.translate` call, and the offset's range.
+    """
+    ok = b.translate(_SHAPE) in (_UTC_SHAPES if utc else _OFFSET_SHAPES)
+    if ok and not utc:
+        offset = b[-5:]
+        ok = offset <= b"14:00" and offset[3] < 0x36 and b[-6:] != b"-00:00"  # 0x36 is '6'
+    return ok
+
+
+def _rfc3339_datetime(b: bytes, *, utc: bool) -> datetime:
+    if not utc:
+        return datetime.fromisoformat(b.decode("ascii"))
+    d = datetime.fromisoformat(b[:-1].decode("ascii"))
+    # much faster than d.replace(tzinfo=UTC)
+    return datetime(d.year, d.month, d.day, d.hour, d.minute, d.second, d.microsecond, UTC)
+
+
+def _parse_rfc3339(s: str | bytes | bytearray | memoryview, *, utc: bool) -> datetime:
+    """
+    Parses the restricted RFC 3339 subset without regex.
+
+    Accepts `YYYY-MM-DDTHH:MM:SS`, optionally followed by `.fff` or `.ffffff`,
+    then either `Z` (if `utc`) or a `±HH:MM` offset up to 14:00, other than `-00:00`.
+    The minus sign may also be U+2212.
+    The layout is checked against fixed templates with one `bytes.translate` call;
+    then `datetime.fromisoformat` converts the fields and checks their ranges.
+    The result always passes `Instant.__post_init__`.
+    """
+    b = _rfc3339_ascii(s)
+    if not _has_rfc3339_shape(b, utc=utc):
+        msg = f"{s!r} is not an RFC 3339 timestamp"
+        raise RealizedParseError(msg, value=s)
+    try:
+        return _rfc3339_datetime(b, utc=utc)
+    except ValueError as e:
+        msg = f"{s!r} is not a valid date and time"
+        raise RealizedParseError(msg, value=s) from e
+
+
+def _try_parse_rfc3339(s: str | bytes | bytearray | memoryview, *, utc: bool) -> datetime | ParseErrorCode:
+    """
+    Like `_parse_rfc3339`, but returns an error code instead of raising.
+    Only values in the right layout reach `datetime`, whose plain `ValueError` is cheap next to ours.
+    """
+    b = _rfc3339_ascii(s)
+    if not _has_rfc3339_shape(b, utc=utc):
+        return ParseErrorCode.SYNTAX
+    try:
+        return _rfc3339_datetime(b, utc=utc)
+    except ValueError:
+        return ParseErrorCode.RANGE
 
 
 @dataclass(slots=True, frozen=True, order=True)
@@ -22,25 +124,90 @@ class Instant:
     """
     An instant in time with either second or microsecond resolution.
     Must be zoned with a UTC offset or an IANA timezone name.
+
+    The UTC epoch microseconds and the UTC offset in minutes are computed once, on construction.
+    Equality, ordering, hashing, and subtracting instants are integer operations on the former,
+    so two instants are equal exactly when they are the same instant, even across a fold.
     """
 
-    dt: datetime
+    dt: datetime = field(compare=False)
+    _utc_micros: int = field(init=False, repr=False)
+    _offset_minutes: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self: Self) -> None:
-        if self.dt.tzinfo is None or not isinstance(self.dt.tzinfo, ZoneInfo):
-            raise DatetimeMissingZoneError(f"Non-zoned {self}")
-        f = self.dt.utcoffset().total_seconds()
-        if f % 60 != 0 or abs(f) > 14 * 3600:
+        if not isinstance(self.dt.tzinfo, (ZoneInfo, timezone)):
+            raise DatetimeMissingZoneError(f"Non-zoned {self.dt}")
+        f = self.dt.utcoffset()
+        if f.seconds % 60 != 0 or f.microseconds != 0 or abs(f) > _MAX_OFFSET:
             raise AssertionError(str(f))
+        object.__setattr__(self, "_utc_micros", (self.dt - _EPOCH) // _ONE_MICROSECOND)
+        object.__setattr__(self, "_offset_minutes", f // _ONE_MINUTE)
+
+    @classmethod
+    def _unchecked(cls: type[Self], dt: datetime) -> Self:
+        return cls._of_parsed(dt)
+
+    @classmethod
+    def _of_parsed(cls: type[Self], dt: datetime) -> Self:
+        # skips __post_init__ for datetimes from _parse_rfc3339 and stored values, which are already valid
+        return cls._of_fields(dt, (dt - _EPOCH) // _ONE_MICROSECOND, dt.utcoffset() // _ONE_MINUTE)
+
+    @classmethod
+    def _of_fields(cls: type[Self], dt: datetime, utc_micros: int, offset_minutes: int) -> Self:
+        # for callers that already know the integer fields; all trusted construction ends here
+        if Model._checks_trusted:
+            instant = cls(dt)
+            if (instant._utc_micros, instant._offset_minutes) != (utc_micros, offset_minutes):
+                msg = f"{dt} is not {utc_micros} µs with offset {offset_minutes} min"
+                raise AssertionError(msg)
+            return instant
+        instant = object.__new__(cls)
+        object.__setattr__(instant, "dt", dt)
+        object.__setattr__(instant, "_utc_micros", utc_micros)
+        object.__setattr__(instant, "_offset_minutes", offset_minutes)
+        return instant
+
+    @property
+    def as_sort_key(self: Self) -> bytes:
+        """
+        The UTC epoch microseconds as a biased big-endian int64, then a type tag and the offset or zone key.
+        Keys of all instant types sort by instant first, so they can share one index.
+        """
+        return _int64_key(self._utc_micros) + self._sort_key_suffix
+
+    @classmethod
+    def from_sort_key(cls: type[Self], key: bytes) -> Self:
+        """
+        Decodes a key of `cls` or, when called on `Instant`, of any instant type.
+        """
+        _check_key(cls, key, 9, exact=False)
+        return cls._of_sort_key(_int64_of_key(key), key[8:])
+
+    @classmethod
+    def _of_sort_key(cls: type[Self], micros: int, suffix: bytes) -> Self:
+        instant_type = _SORT_KEY_TAGS.get(suffix[:1])
+        if instant_type is None or not issubclass(instant_type, cls):
+            msg = f"{suffix!r} is not a sort key suffix for {cls.__qualname__}"
+            raise RealizedParseError(msg, value=suffix)
+        return instant_type._of_sort_key_payload(micros, suffix[1:])
+
+    @property
+    def _sort_key_suffix(self: Self) -> bytes:
+        raise NotImplementedError()
 
     def __add__(self: Self, delta: Duration | timedelta) -> Self:
         if isinstance(delta, timedelta):
             return self.__class__(self.dt + delta)
         return self.__class__(self.dt + delta.delta)
 
-    def __sub__(self: Self, delta: Duration | timedelta) -> Self:
+    def __sub__(self: Self, delta: Duration | timedelta | Instant) -> Self | Duration:
+        """
+        Subtracts a duration, or returns the `Duration` elapsed since another instant.
+        """
         if isinstance(delta, timedelta):
             return self.__class__(self.dt - delta)
+        if isinstance(delta, Instant):
+            return Duration._from_raw(self._utc_micros - delta._utc_micros)
         return self.__class__(self.dt - delta.delta)
 
     @property
@@ -48,12 +215,14 @@ class Instant:
         return self.to_rfc3339(Resolution.default())
 
     def to_rfc3339(self: Self, min_resolution: Resolution) -> str:
-        return self.dt.isoformat(timespec=min_resolution)
+        exact = Resolution.of_microseconds(self.dt.microsecond)
+        resolution = exact if exact.decimals > min_resolution.decimals else min_resolution
+        return self.dt.isoformat(timespec=resolution.timespec)
 
     @property
     def ctime_utc(self: Self) -> str:
         # noinspection PyTypeChecker
-        return self.dt.astimezone(ZoneInfo("Etc/UTC")).ctime()
+        return self.dt.astimezone(UTC).ctime()
 
     @property
     def zone(self: Self) -> ZoneInfo:
@@ -66,26 +235,53 @@ class Instant:
 
     @property
     def offset_str(self: Self) -> str:
-        f = self.dt.utcoffset().total_seconds()
-        return "-" if f < 0 else "+" + f"{abs(f)//3600:02}:{abs(f)//60:02}"
+        m = self._offset_minutes
+        return ("-" if m < 0 else "+") + f"{abs(m) // 60:02}:{abs(m) % 60:02}"
 
     @property
     def _raw_timestamp(self: Self) -> str:
-        return self.dt.isoformat(timespec=Resolution.default())
+        return self.to_rfc3339(Resolution.default())
 
 
 @dataclass(slots=True, frozen=True, order=True)
 class InstantUtc(Instant, Model):
 
     def __post_init__(self: Self) -> None:
-        super().__post_init__()
-        if self.zone_name != "Etc/UTC":
-            raise ZoneMismatchError(f"Zone '{self}' is not Etc/UTC")
+        Instant.__post_init__(self)
+        if getattr(self.dt.tzinfo, "key", None) != "Etc/UTC":
+            raise ZoneMismatchError(f"Zone '{self.dt.tzinfo}' is not Etc/UTC")
 
     @classmethod
-    def from_str(cls: type[Self], s: str) -> Self:
-        s = s.replace("−", "-").replace("Z", "+00:00")
-        return cls(datetime.fromisoformat(s))
+    def from_str(cls: type[Self], s: str | bytes | bytearray | memoryview) -> Self:
+        return cls._of_parsed(_parse_rfc3339(s, utc=True))
+
+    @classmethod
+    def from_bytes(cls: type[Self], v: bytes | bytearray | memoryview) -> Self:
+        return cls._of_parsed(_parse_rfc3339(v, utc=True))
+
+    @classmethod
+    def _try_from_str(cls: type[Self], v: str) -> Self | ParseErrorCode:
+        dt = _try_parse_rfc3339(v, utc=True)
+        return dt if dt.__class__ is ParseErrorCode else cls._of_parsed(dt)
+
+    @classmethod
+    def _from_raw(cls: type[Self], micros: int) -> Self:
+        """
+        Trusted constructor from UTC epoch microseconds, for unpickling.
+        """
+        return cls._of_fields(_EPOCH + timedelta(microseconds=micros), micros, 0)
+
+    def __reduce__(self: Self) -> tuple[Callable[..., Self], tuple]:
+        return _from_raw, (self.__class__, self._utc_micros)
+
+    @property
+    def _sort_key_suffix(self: Self) -> bytes:
+        return b"\x00"
+
+    @classmethod
+    def _of_sort_key_payload(cls: type[Self], micros: int, payload: bytes) -> Self:
+        _check_key(cls, payload, 0)
+        return cls._from_raw(micros)
 
     @property
     def as_str(self: Self) -> str:
@@ -100,8 +296,37 @@ class InstantUtc(Instant, Model):
 class InstantWithOffset(Instant, Model):
 
     @classmethod
-    def from_str(cls: type[Self], s: str) -> Self:
-        return cls(datetime.fromisoformat(s.replace("−", "-")))
+    def from_str(cls: type[Self], s: str | bytes | bytearray | memoryview) -> Self:
+        return cls._of_parsed(_parse_rfc3339(s, utc=False))
+
+    @classmethod
+    def from_bytes(cls: type[Self], v: bytes | bytearray | memoryview) -> Self:
+        return cls._of_parsed(_parse_rfc3339(v, utc=False))
+
+    @classmethod
+    def _try_from_str(cls: type[Self], v: str) -> Self | ParseErrorCode:
+        dt = _try_parse_rfc3339(v, utc=False)
+        return dt if dt.__class__ is ParseErrorCode else cls._of_parsed(dt)
+
+    @classmethod
+    def _from_raw(cls: type[Self], micros: int, offset_minutes: int) -> Self:
+        """
+        Trusted constructor from UTC epoch microseconds and a UTC offset in minutes, for unpickling.
+        """
+        local = _NAIVE_EPOCH + timedelta(minutes=offset_minutes, microseconds=micros)
+        return cls._of_fields(local.replace(tzinfo=_fixed_offset(offset_minutes)), micros, offset_minutes)
+
+    def __reduce__(self: Self) -> tuple[Callable[..., Self], tuple]:
+        return _from_raw, (self.__class__, self._utc_micros, self._offset_minutes)
+
+    @property
+    def _sort_key_suffix(self: Self) -> bytes:
+        return b"\x01" + (self._offset_minutes + 0x8000).to_bytes(2, "big")
+
+    @classmethod
+    def _of_sort_key_payload(cls: type[Self], micros: int, payload: bytes) -> Self:
+        _check_key(cls, payload, 2)
+        return cls._from_raw(micros, int.from_bytes(payload, "big") - 0x8000)
 
     @property
     def as_str(self: Self) -> str:
@@ -118,18 +343,69 @@ class InstantWithOffset(Instant, Model):
 class InstantWithCity(Instant, Model):
 
     def __post_init__(self: Self) -> None:
-        super().__post_init__()
+        Instant.__post_init__(self)
+        if not isinstance(self.dt.tzinfo, ZoneInfo):
+            raise DatetimeMissingZoneError(f"{self.dt} has zone {self.dt.tzinfo}, which is not an IANA zone")
         if self.dt.tzinfo.tzname(self.dt) is None:
             raise DatetimeMissingZoneError(f"{self.dt} has zone {self.dt.tzinfo} with no name")
 
     @classmethod
     def from_str(cls: type[Self], s: str) -> Self:
         s0, s1 = s.split(" ")
-        zi = ZoneInfo(s1.replace("UTC", "Etc/UTC").strip_suffix("]").strip_prefix("["))
-        dt = datetime.fromisoformat(s0.replace("−", "-"))
-        if dt.tzinfo.utcoffset(dt) != zi.utcoffset(dt):
+        return cls._of_parts(s0, s1.removesuffix("]").removeprefix("["))
+
+    @classmethod
+    def from_bytes(cls: type[Self], v: bytes | bytearray | memoryview) -> Self:
+        s0, s1 = bytes(v).split(b" ")
+        return cls._of_parts(s0, s1.removesuffix(b"]").removeprefix(b"[").decode("ascii", errors="replace"))
+
+    @classmethod
+    def _try_from_str(cls: type[Self], v: str) -> Self | ParseErrorCode:
+        timestamp, space, key = v.partition(" ")
+        if not space or not key.startswith("[") or not key.endswith("]"):
+            return ParseErrorCode.SYNTAX
+        dt = _try_parse_rfc3339(timestamp, utc=timestamp.endswith("Z"))
+        if dt.__class__ is ParseErrorCode:
+            return dt
+        try:
+            zi = get_zone(key[1:-1])
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            return ParseErrorCode.ZONE
+        local = _in_zone(dt, zi)
+        return ParseErrorCode.ZONE if local is None else cls._of_parsed(local)
+
+    @classmethod
+    def _from_raw(cls: type[Self], local_micros: int, fold: int, key: str) -> Self:
+        """
+        Trusted constructor from wall-clock microseconds since 1970-01-01T00:00, `fold`, and an IANA key,
+        for unpickling.
+        """
+        local = _NAIVE_EPOCH + timedelta(microseconds=local_micros)
+        return cls._of_parsed(local.replace(tzinfo=get_zone(key), fold=fold))
+
+    def __reduce__(self: Self) -> tuple[Callable[..., Self], tuple]:
+        # the wall time and fold, rather than the UTC instant, so that every datetime round-trips exactly
+        local = (self.dt.replace(tzinfo=None) - _NAIVE_EPOCH) // _ONE_MICROSECOND
+        return _from_raw, (self.__class__, local, self.dt.fold, self.zone_name)
+
+    @property
+    def _sort_key_suffix(self: Self) -> bytes:
+        return b"\x02" + self.zone_name.encode("utf-8")
+
+    @classmethod
+    def _of_sort_key_payload(cls: type[Self], micros: int, payload: bytes) -> Self:
+        _check_key(cls, payload, 1, exact=False)
+        zone = get_zone(payload.decode("utf-8"))
+        return cls._of_parsed((_EPOCH + timedelta(microseconds=micros)).astimezone(zone))
+
+    @classmethod
+    def _of_parts(cls: type[Self], timestamp: str | bytes, key: str) -> Self:
+        zi = get_zone(key)
+        dt = _parse_rfc3339(timestamp, utc=timestamp[-1:] in ("Z", b"Z"))
+        local = _in_zone(dt, zi)
+        if local is None:
             raise ZoneMismatchError(f"Mismatch offset for {dt} and {zi}")
-        return cls(dt.replace(tzinfo=zi))
+        return cls(local)
 
     @property
     def as_str(self: Self) -> str:
@@ -143,7 +419,7 @@ class InstantWithCity(Instant, Model):
 
     @property
     def zone_name(self: Self) -> str:
-        return self.dt.tzinfo.tzname(self.dt).replace("UTC", "Etc/UTC")
+        return self.dt.tzinfo.key
 
     @property
     def _json_data(self: Self) -> JsonType:
@@ -151,3 +427,10 @@ class InstantWithCity(Instant, Model):
             "timestamp": self._raw_timestamp,
             "timezone": self.zone_name
         }
+
+    @classmethod
+    def _from_json_data(cls: type[Self], data: JsonType) -> Self:
+        return cls.from_str(f"{data['timestamp']} [{data['timezone']}]")
+
+
+_SORT_KEY_TAGS = {b"\x00": InstantUtc, b"\x01": InstantWithOffset, b"\x02": InstantWithCity}
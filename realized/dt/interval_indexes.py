@@ -0,0 +1,232 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+An index of intervals for stabbing, overlap, and containment queries.
+
+Requires NumPy (the `arrays` extra).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Self
+
+import numpy as np
+from pocketutils import KeyReusedError
+
+from realized.dt.instants import Instant
+from realized.dt.intervals import Interval
+
+__all__ = ["IntervalIndex"]
+# padding that sorts after every real start and never extends a subtree's maximum end
+_PAD_START = np.iinfo(np.int64).max
+_PAD_END = np.iinfo(np.int64).min
+# subtrees of at most 2^(k+1) - 1 nodes are scanned rather than descended
+_SCAN_LEVEL = 2
+_MIN_REBUILD = 256
+
+Window = Interval | tuple[int, int]
+
+
+def _micros(instant: Instant | int) -> int:
+    if isinstance(instant, Instant):
+        return instant._utc_micros
+    return int(instant)
+
+
+def _window(window: Window) -> tuple[int, int]:
+    if isinstance(window, Interval):
+        return _micros(window.start), _micros(window.end)
+    return _micros(window[0]), _micros(window[1])
+
+
+@dataclass(slots=True, eq=False)
+class IntervalIndex:
+    """
+    Intervals keyed by integer ids, normalized to half-open `[start, end)` ranges of UTC epoch microseconds.
+
+    The indexed intervals are sorted by start and laid out as an implicit augmented binary search tree
+    (as in cgranges): position `x` at level `k` (its number of trailing one bits) is the root of the subtree
+    spanning `x - 2^k + 1` to `x + 2^k - 1`, and `_max_ends[x]` is the largest end in that subtree.
+    Queries take O(log n + k) time.
+
+    Insertions go to a small unsorted buffer and deletions to a set of tombstones.
+    The tree is rebuilt when the buffer exceeds 1/32 of its size or the tombstones 1/4.
+    """
+
+    _starts: np.ndarray
+    _ends: np.ndarray
+    _ids: np.ndarray
+    _max_ends: np.ndarray = field(init=False)
+    _levels: int = field(init=False)
+    # Python lists, since the query loop reads single elements
+    _start_list: list[int] = field(init=False)
+    _end_list: list[int] = field(init=False)
+    _max_list: list[int] = field(init=False)
+    _live: set[int] = field(init=False)
+    _pending: dict[int, tuple[int, int]] = field(init=False, default_factory=dict)
+    _deleted: set[int] = field(init=False, default_factory=set)
+    _next_id: int = field(init=False)
+
+    def __post_init__(self: Self) -> None:
+        self._live = set(self._ids.tolist())
+        if len(self._live) != len(self._ids):
+            uniques, counts = np.unique(self._ids, return_counts=True)
+            reused = frozenset(uniques[counts > 1].tolist())
+            msg = f"Interval ids {sorted(reused)} are used more than once"
+            raise KeyReusedError(msg, keys=reused)
+        self._next_id = max(self._live, default=-1) + 1
+        self._build()
+
+    @classmethod
+    def from_arrays(cls: type[Self], starts: np.ndarray, ends: np.ndarray, ids: np.ndarray | None = None) -> Self:
+        """
+        Builds an index from parallel arrays of UTC epoch microseconds.
+        Ids default to the row numbers.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        ids = np.arange(len(starts), dtype=np.int64) if ids is None else np.asarray(ids, dtype=np.int64)
+        if not len(starts) == len(ends) == len(ids) or starts.ndim != 1:
+            msg = f"Lengths differ: {len(starts)} starts, {len(ends)} ends, and {len(ids)} ids"
+            raise ValueError(msg)
+        if (ends < starts).any():
+            i = int(np.argmax(ends < starts))
+            msg = f"Interval {ids[i]} ends before it starts"
+            raise ValueError(msg)
+        order = np.argsort(starts, kind="stable")
+        return cls(starts[order], ends[order], ids[order])
+
+    @classmethod
+    def from_intervals(cls: type[Self], intervals: Iterable[Interval], ids: np.ndarray | None = None) -> Self:
+        bounds = [_window(i) for i in intervals]
+        starts = np.fromiter((b[0] for b in bounds), dtype=np.int64, count=len(bounds))
+        ends = np.fromiter((b[1] for b in bounds), dtype=np.int64, count=len(bounds))
+        return cls.from_arrays(starts, ends, ids)
+
+    def __len__(self: Self) -> int:
+        return len(self._live)
+
+    def __contains__(self: Self, id_: int) -> bool:
+        return id_ in self._live
+
+    def insert(self: Self, interval: Window, id_: int | None = None) -> int:
+        """
+        Adds an interval, returning its id (by default, one more than the largest id used so far).
+        """
+        start, end = _window(interval)
+        if end < start:
+            msg = f"Interval {interval} ends before it starts"
+            raise ValueError(msg)
+        if id_ is None:
+            id_ = self._next_id
+        elif id_ in self._live:
+            msg = f"Interval id {id_} is already used"
+            raise KeyReusedError(msg, keys=frozenset([id_]))
+        self._next_id = max(self._next_id, id_ + 1)
+        self._live.add(id_)
+        self._pending[id_] = start, end
+        self._maybe_rebuild()
+        return id_
+
+    def delete(self: Self, id_: int) -> None:
+        if id_ not in self._live:
+            raise KeyError(id_)
+        self._live.remove(id_)
+        if self._pending.pop(id_, None) is None:
+            self._deleted.add(id_)
+        self._maybe_rebuild()
+
+    def at(self: Self, instant: Instant | int) -> np.ndarray:
+        """
+        Returns the sorted ids of intervals that contain `instant` (`start <= instant < end`).
+        """
+        t = _micros(instant)
+        return self._query(t, t + 1)
+
+    def overlapping(self: Self, window: Window) -> np.ndarray:
+        """
+        Returns the sorted ids of intervals that share at least one microsecond with `window`.
+        """
+        start, end = _window(window)
+        return self._query(start, end)
+
+    def containing(self: Self, window: Window) -> np.ndarray:
+        """
+        Returns the sorted ids of intervals that contain all of `window` (`start <= window.start`, `window.end <= end`).
+        """
+        start, end = _window(window)
+        return self._query(end - 1, start + 1)
+
+    def _query(self: Self, lo: int, hi: int) -> np.ndarray:
+        # finds every interval with start < hi and end > lo
+        positions = self._search(lo, hi)
+        ids = self._ids[positions].tolist()
+        if self._deleted:
+            ids = [i for i in ids if i not in self._deleted]
+        ids += [i for i, (s, e) in self._pending.items() if s < hi and e > lo]
+        return np.sort(np.asarray(ids, dtype=np.int64))
+
+    def _search(self: Self, lo: int, hi: int) -> list[int]:
+        if self._levels == 0:
+            return []
+        starts, ends, max_ends = self._start_list, self._end_list, self._max_list
+        found = []
+        k = self._levels - 1
+        stack = [(k, (1 << k) - 1, False)]
+        while stack:
+            k, x, left_done = stack.pop()
+            if k <= _SCAN_LEVEL:
+                # small subtree: scan it in start order
+                i, stop = x - (1 << k) + 1, x + (1 << k)
+                while i < stop and starts[i] < hi:
+                    if ends[i] > lo:
+                        found.append(i)
+                    i += 1
+            elif not left_done:
+                if max_ends[x] <= lo:
+                    continue
+                stack.append((k, x, True))
+                stack.append((k - 1, x - (1 << (k - 1)), False))
+            elif starts[x] < hi:
+                if ends[x] > lo:
+                    found.append(x)
+                stack.append((k - 1, x + (1 << (k - 1)), False))
+        return found
+
+    def _maybe_rebuild(self: Self) -> None:
+        # every query scans the whole buffer, but tombstones only cost a check per match
+        n = len(self._ids)
+        if len(self._pending) > max(_MIN_REBUILD, n >> 5) or len(self._deleted) > max(_MIN_REBUILD, n >> 2):
+            self._rebuild()
+
+    def _rebuild(self: Self) -> None:
+        keep = ~np.isin(self._ids, np.fromiter(self._deleted, dtype=np.int64, count=len(self._deleted)))
+        pending_ids = np.fromiter(self._pending.keys(), dtype=np.int64, count=len(self._pending))
+        pending = np.asarray(list(self._pending.values()), dtype=np.int64).reshape(-1, 2)
+        starts = np.concatenate([self._starts[keep], pending[:, 0]])
+        ends = np.concatenate([self._ends[keep], pending[:, 1]])
+        ids = np.concatenate([self._ids[keep], pending_ids])
+        order = np.argsort(starts, kind="stable")
+        self._starts, self._ends, self._ids = starts[order], ends[order], ids[order]
+        self._pending.clear()
+        self._deleted.clear()
+        self._build()
+
+    def _build(self: Self) -> None:
+        n = len(self._starts)
+        self._levels = n.bit_length()
+        size = (1 << self._levels) - 1
+        starts = np.full(size, _PAD_START, dtype=np.int64)
+        ends = np.full(size, _PAD_END, dtype=np.int64)
+        starts[:n], ends[:n] = self._starts, self._ends
+        max_ends = ends.copy()
+        for k in range(1, self._levels):
+            x = np.arange((1 << k) - 1, size, 1 << (k + 1))
+            half = 1 << (k - 1)
+            max_ends[x] = np.maximum(max_ends[x], np.maximum(max_ends[x - half], max_ends[x + half]))
+        self._max_ends = max_ends
+        self._start_list, self._end_list, self._max_list = starts.tolist(), ends.tolist(), max_ends.tolist()
@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Sets of instants as coalesced intervals, with set algebra over boundary arrays.
+
+Requires NumPy (the `arrays` extra).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import timedelta, timezone
+from typing import Self
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from realized.dt.arrays import EPOCH, _instant_micros
+from realized.dt.durations import Duration
+from realized.dt.instants import UTC, Instant, InstantUtc
+from realized.dt.intervals import Interval
+
+__all__ = ["IntervalSet"]
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class IntervalSet:
+    """
+    A set of UTC epoch microseconds, stored as sorted, disjoint, non-adjacent half-open `[start, end)` ranges.
+
+    Set operations sweep the boundaries of both operands in O(n + m):
+    the four boundary arrays are already sorted, so the stable sort that merges them is linear.
+    No Python object is created per interval unless `to_intervals` is called.
+    """
+
+    starts: np.ndarray
+    ends: np.ndarray
+
+    @classmethod
+    def empty(cls: type[Self]) -> Self:
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    @classmethod
+    def from_arrays(cls: type[Self], starts: np.ndarray, ends: np.ndarray) -> Self:
+        """
+        Coalesces ranges in any order, dropping empty ones and merging ones that overlap or touch.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        if starts.shape != ends.shape or starts.ndim != 1:
+            msg = f"Shapes differ: {starts.shape} starts and {ends.shape} ends"
+            raise ValueError(msg)
+        if (ends < starts).any():
+            i = int(np.argmax(ends < starts))
+            msg = f"Range {i} ends before it starts"
+            raise ValueError(msg)
+        keep = ends > starts
+        starts, ends = starts[keep], ends[keep]
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], ends[order]
+        reach = np.maximum.accumulate(ends)
+        # a new range begins wherever the start is past everything before it
+        first = np.ones(len(starts), dtype=bool)
+        first[1:] = starts[1:] > reach[:-1]
+        blocks = np.flatnonzero(first)
+        return cls(starts[blocks], np.maximum.reduceat(ends, blocks) if len(blocks) else ends[:0])
+
+    @classmethod
+    def from_intervals(cls: type[Self], intervals: Iterable[Interval]) -> Self:
+        bounds = [(_instant_micros(i.start), _instant_micros(i.end)) for i in intervals]
+        array = np.asarray(bounds, dtype=np.int64).reshape(-1, 2)
+        return cls.from_arrays(array[:, 0], array[:, 1])
+
+    def __len__(self: Self) -> int:
+        return len(self.starts)
+
+    def __bool__(self: Self) -> bool:
+        return len(self.starts) > 0
+
+    def __eq__(self: Self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return np.array_equal(self.starts, other.starts) and np.array_equal(self.ends, other.ends)
+
+    __hash__ = None
+
+    def __contains__(self: Self, instant: Instant | int) -> bool:
+        t = _instant_micros(instant) if isinstance(instant, Instant) else instant
+        i = np.searchsorted(self.starts, t, side="right") - 1
+        return bool(i >= 0 and t < self.ends[i])
+
+    def __or__(self: Self, other: Self) -> Self:
+        return self._combine(other, np.logical_or)
+
+    def __and__(self: Self, other: Self) -> Self:
+        return self._combine(other, np.logical_and)
+
+    def __sub__(self: Self, other: Self) -> Self:
+        return self._combine(other, lambda a, b: a & ~b)
+
+    def __xor__(self: Self, other: Self) -> Self:
+        return self._combine(other, np.logical_xor)
+
+    def union(self: Self, other: Self) -> Self:
+        return self | other
+
+    def intersection(self: Self, other: Self) -> Self:
+        return self & other
+
+    def difference(self: Self, other: Self) -> Self:
+        return self - other
+
+    def complement(self: Self, bounds: Interval | tuple[int, int]) -> Self:
+        """
+        Returns the parts of `bounds` that are not in this set.
+        """
+        if isinstance(bounds, Interval):
+            bounds = _instant_micros(bounds.start), _instant_micros(bounds.end)
+        return self.from_arrays(np.array([bounds[0]]), np.array([bounds[1]])) - self
+
+    @property
+    def gaps(self: Self) -> Self:
+        """
+        The ranges between consecutive intervals.
+        """
+        return self.__class__(self.ends[:-1], self.starts[1:])
+
+    @property
+    def total_micros(self: Self) -> int:
+        return int((self.ends - self.starts).sum())
+
+    @property
+    def total(self: Self) -> Duration:
+        return Duration._from_raw(self.total_micros)
+
+    def to_intervals(
+        self: Self, instant_type: type[Instant] = InstantUtc, zone: ZoneInfo | timezone = UTC
+    ) -> list[Interval]:
+        """
+        Unpacks to one `Interval` per range, with instants of `instant_type` in `zone`:
+        an IANA zone for `InstantWithCity`, or a fixed offset (or IANA zone) for `InstantWithOffset`.
+
+        Raises:
+            ZoneMismatchError: If `instant_type` is `InstantUtc` and `zone` is not Etc/UTC
+            DatetimeMissingZoneError: If `instant_type` is `InstantWithCity` and `zone` is not an IANA zone
+        """
+        instant_type(EPOCH.astimezone(zone))  # checks the zone once, so that each instant can skip it
+        return [
+            Interval(self._instant(s, instant_type, zone), self._instant(e, instant_type, zone))
+            for s, e in zip(self.starts.tolist(), self.ends.tolist(), strict=True)
+        ]
+
+    @staticmethod
+    def _instant(micros: int, instant_type: type[Instant], zone: ZoneInfo | timezone) -> Instant:
+        return instant_type._unchecked((EPOCH + timedelta(microseconds=micros)).astimezone(zone))
+
+    def _combine(self: Self, other: Self, op: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> Self:
+        if not isinstance(other, IntervalSet):
+            msg = f"Cannot combine {self.__class__.__qualname__} with {other.__class__.__qualname__}"
+            raise TypeError(msg)
+        n, m = len(self.starts), len(other.starts)
+        points = np.concatenate([self.starts, self.ends, other.starts, other.ends])
+        # +1/-1 steps in coverage depth of self, then of other
+        steps = np.zeros((2, 2 * (n + m)), dtype=np.int64)
+        steps[0, :n], steps[0, n : 2 * n] = 1, -1
+        steps[1, 2 * n : 2 * n + m], steps[1, 2 * n + m :] = 1, -1
+        order = np.argsort(points, kind="stable")
+        points = points[order]
+        depths = np.cumsum(steps[:, order], axis=1)
+        # the state at a point is the one after its last event
+        last = np.ones(len(points), dtype=bool)
+        last[:-1] = points[1:] != points[:-1]
+        points, depths = points[last], depths[:, last]
+        inside = op(depths[0] > 0, depths[1] > 0)
+        before = np.concatenate([[False], inside[:-1]])
+        return self.__class__(points[inside & ~before], points[~inside & before])
@@ -3,13 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import typing
+from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import timedelta, timezone
 from typing import Any, Generic, Self, TypeVar
 from zoneinfo import ZoneInfo
 
-from realized._core import Model
-from realized.dt.instants import Instant
+from realized._core import JsonType, Model, _check_key, _from_raw, _int64_of_key
+from realized.dt.instants import Instant, InstantUtc, InstantWithCity, InstantWithOffset, get_zone
 from realized.dt.durations import Duration
 from realized.errors import ZoneMismatchError
 
@@ -27,13 +28,72 @@ class Interval(Model, Generic[I_co]):
     end: I_co
 
     @classmethod
-    def instant_type(cls: type[Self]) -> type[I_co]:
-        return typing.get_args(cls)[0]
+    def instant_type(cls: type[Self]) -> type[I_co] | None:
+        """
+        Returns the instant type bound by a subclass (e.g. `class UtcInterval(Interval[InstantUtc])`), if any.
+        """
+        for base in getattr(cls, "__orig_bases__", ()):
+            args = typing.get_args(base)
+            if args and isinstance(args[0], type) and issubclass(args[0], Instant):
+                return args[0]
+        return None
 
     @classmethod
     def from_str(cls: type[Self], s: str) -> Self:
         s1, s2 = s.split("--")
-        return cls(cls.instant_type().from_str(s1), cls.instant_type().from_str(s2))
+        return cls(cls._parse_instant(s1), cls._parse_instant(s2))
+
+    @classmethod
+    def from_bytes(cls: type[Self], v: bytes | bytearray | memoryview) -> Self:
+        s1, s2 = bytes(v).split(b"--")
+        return cls(cls._parse_instant(s1), cls._parse_instant(s2))
+
+    @classmethod
+    def _from_json_data(cls: type[Self], data: JsonType) -> Self:
+        return cls(cls._parse_instant(data["start"]), cls._parse_instant(data["end"]))
+
+    @classmethod
+    def _parse_instant(cls: type[Self], s: str | bytes) -> I_co:
+        instant_type = cls.instant_type()
+        if instant_type is None:
+            # fall back to the suffix, which is distinct for each instant type
+            suffix = s[-1:]
+            if suffix in ("]", b"]"):
+                instant_type = InstantWithCity
+            elif suffix in ("Z", b"Z"):
+                instant_type = InstantUtc
+            else:
+                instant_type = InstantWithOffset
+        if isinstance(s, bytes):
+            return instant_type.from_bytes(s)
+        return instant_type.from_str(s)
+
+    @classmethod
+    def _from_raw(cls: type[Self], start: I_co, end: I_co) -> Self:
+        """
+        Trusted constructor from two instants in the same zone, for unpickling.
+        """
+        return cls._unchecked(start, end)
+
+    def __reduce__(self: Self) -> tuple[Callable[..., Self], tuple]:
+        return _from_raw, (self.__class__, self.start, self.end)
+
+    @property
+    def as_sort_key(self: Self) -> bytes:
+        """
+        The start and end as UTC epoch microseconds, then the start's type tag and offset or zone.
+        Intervals therefore sort by start, then by end.
+        """
+        start = self.start.as_sort_key
+        return start[:8] + self.end.as_sort_key[:8] + start[8:]
+
+    @classmethod
+    def from_sort_key(cls: type[Self], key: bytes) -> Self:
+        _check_key(cls, key, 17, exact=False)
+        instant_type = cls.instant_type() or Instant
+        suffix = key[16:]
+        start = instant_type._of_sort_key(_int64_of_key(key), suffix)
+        return cls._from_raw(start, start._of_sort_key(_int64_of_key(key, 8), suffix))
 
     def __post_init__(self: Self) -> None:
         if self.start.zone != self.end.zone:
@@ -48,23 +108,34 @@ class Interval(Model, Generic[I_co]):
 
     @property
     def as_str(self: Self) -> str:
-        return self.start.to_str + "--" + self.end.to_str
+        return self.start.as_str + "--" + self.end.as_str
 
     @property
     def duration(self: Self) -> Duration:
-        return Duration(self.delta)
+        return Duration._from_raw(self.end._utc_micros - self.start._utc_micros)
 
     @property
     def delta(self: Self) -> timedelta:
-        return self.end.dt.astimezone(ZoneInfo("Etc/UTC")) - self.start.dt.astimezone(ZoneInfo("Etc/UTC"))
+        return timedelta(microseconds=self.end._utc_micros - self.start._utc_micros)
 
     def convert_to_zone(self: Self, zone: ZoneInfo | str) -> Self:
+        """
+        Returns the same interval in `zone`, keeping the type of its instants.
+        `InstantWithOffset` instants take the offset that `zone` has at each.
+
+        Raises:
+            ZoneMismatchError: If the instants are `InstantUtc` and `zone` is not Etc/UTC,
+                               or they are `InstantWithOffset` and `zone` has different offsets at start and end
+        """
         if isinstance(zone, str):
-            zone = ZoneInfo(zone)
+            zone = get_zone(zone)
+        instant_type = self.start.__class__
         start = self.start.dt.astimezone(zone)
         end = self.end.dt.astimezone(zone)
-        instance_type = self.instant_type()
-        return self.__class__(instance_type.from_dt(start), instance_type.from_dt(end))
+        if issubclass(instant_type, InstantWithOffset):
+            start = start.astimezone(timezone(start.utcoffset()))
+            end = end.astimezone(timezone(end.utcoffset()))
+        return self.__class__(instant_type(start), instant_type(end))
 
     @property
     def _json_data(self: Self) -> Any:
@@ -5,19 +5,122 @@
 
 import re
 import typing
-from collections.abc import Iterator
-from dataclasses import dataclass
-from datetime import timedelta
-from typing import Self, TypeVar, Generic, ClassVar
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Any, Self, TypeVar, Generic, ClassVar
 
 from realized.dt.durations import Duration
 from realized._core import Model, JsonType
-from realized.dt.instants import Instant
+from realized.dt.instants import UTC, Instant
+from realized.dt.intervals import Interval
 
-__all__ = ["RepeatInterval", "RepeatEvent", "RepeatDuration"]
+__all__ = ["RepeatInterval", "RepeatEvent", "RepeatDuration", "RepeatWindow"]
 REPEAT_REGEX = re.compile(r"^R(\d*)/(.+)$")
 I_co = TypeVar("I_co", bound=Instant, covariant=True)
 D_co = TypeVar("D_co", bound=Duration, covariant=True)
+T = TypeVar("T")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _micros(v: Instant | Duration | timedelta) -> int:
+    if isinstance(v, Instant):
+        return v._utc_micros
+    if isinstance(v, Duration):
+        return v.delta // _ONE_MICROSECOND
+    return v // _ONE_MICROSECOND
+
+
+@dataclass(slots=True, frozen=True)
+class _Progression:
+    """
+    The integers `first + k * step` for `k` from 0 to `last` (inclusive; unbounded if `None`).
+    Every query is O(1).
+    """
+
+    first: int
+    step: int
+    last: int | None
+
+    def __post_init__(self: Self) -> None:
+        if self.step <= 0:
+            msg = f"Repeat period must be positive, not {self.step} µs"
+            raise ValueError(msg)
+
+    def nth(self: Self, k: int) -> int:
+        if k < 0 or self.last is not None and k > self.last:
+            msg = f"Occurrence {k} is out of range 0-{self.last}"
+            raise IndexError(msg)
+        return self.first + k * self.step
+
+    def first_at_or_after(self: Self, t: int) -> int:
+        # the smallest k >= 0 with first + k * step >= t (which may be past last)
+        return max(0, -((self.first - t) // self.step))
+
+    def index_range(self: Self, lo: int, hi: int) -> range:
+        """
+        The indices of the values in `[lo, hi)`.
+        """
+        start = self.first_at_or_after(lo)
+        stop = self.first_at_or_after(hi)
+        if self.last is not None:
+            stop = min(stop, self.last + 1)
+        return range(start, max(start, stop))
+
+    def next_after(self: Self, t: int) -> int | None:
+        k = self.first_at_or_after(t + 1)
+        return None if self.last is not None and k > self.last else k
+
+    def previous_before(self: Self, t: int) -> int | None:
+        k = self.first_at_or_after(t) - 1
+        if k < 0:
+            return None
+        return k if self.last is None else min(k, self.last)
+
+
+@dataclass(slots=True, frozen=True)
+class RepeatWindow(Generic[T]):
+    """
+    The occurrences of a repeat that start within a window, generated lazily.
+
+    Attributes:
+        indices: The occurrence numbers
+        first: Start of occurrence 0, in UTC epoch microseconds (instants) or microseconds (durations)
+        step: Microseconds between the starts of consecutive occurrences
+    """
+
+    indices: range
+    first: int
+    step: int
+    _make: Callable[[int], T]
+    _numpy_unit: str
+
+    def __len__(self: Self) -> int:
+        return len(self.indices)
+
+    def __iter__(self: Self) -> Iterator[T]:
+        for k in self.indices:
+            yield self._make(k)
+
+    def __getitem__(self: Self, i: int | slice) -> "T | RepeatWindow[T]":
+        """
+        Returns one occurrence, or a narrower window for a slice.
+        """
+        if isinstance(i, slice):
+            return replace(self, indices=self.indices[i])
+        return self._make(self.indices[i])
+
+    def as_numpy(self: Self) -> Any:
+        """
+        Returns the starts as a NumPy `datetime64[us]` (instants) or `timedelta64[us]` (durations) array.
+
+        Requires NumPy (the `arrays` extra).
+        """
+        import numpy as np  # noqa: PLC0415 (optional arrays extra)
+
+        k = np.arange(self.indices.start, self.indices.stop, self.indices.step, dtype=np.int64)
+        return (self.first + k * self.step).astype(self._numpy_unit)
 
 
 @dataclass(slots=True, frozen=True, order=True)
@@ -35,8 +138,8 @@ class RepeatInterval(Model, Generic[I_co]):
     def from_str(cls: type[Self], s: str) -> Self:
         m = REPEAT_REGEX.fullmatch(s)
         repeat = m.group(1)
-        start, end = m.group(2).split("--")
-        return cls(start, end, repeat)
+        interval = Interval.from_str(m.group(2))
+        return cls(interval.start, interval.end, int(repeat) if repeat else None)
 
     @property
     def as_str(self: Self) -> str:
@@ -47,6 +150,48 @@ class RepeatInterval(Model, Generic[I_co]):
     def duration(self: Self) -> Duration:
         return Duration(self.end.dt - self.start.dt)
 
+    def nth(self: Self, n: int) -> tuple[I_co, I_co]:
+        """
+        Returns occurrence `n` (from 0), which is the first interval shifted by `n` durations of elapsed time.
+        """
+        start = self._progression.nth(n)
+        return self._instant(start), self._instant(start + self._progression.step)
+
+    def next_after(self: Self, instant: Instant) -> tuple[I_co, I_co] | None:
+        """
+        Returns the first occurrence that starts strictly after `instant`, if any.
+        """
+        k = self._progression.next_after(_micros(instant))
+        return None if k is None else self.nth(k)
+
+    def previous_before(self: Self, instant: Instant) -> tuple[I_co, I_co] | None:
+        """
+        Returns the last occurrence that starts strictly before `instant`, if any.
+        """
+        k = self._progression.previous_before(_micros(instant))
+        return None if k is None else self.nth(k)
+
+    def count_in(self: Self, start: Instant, end: Instant) -> int:
+        """
+        Counts the occurrences that start in `[start, end)`.
+        """
+        return len(self._progression.index_range(_micros(start), _micros(end)))
+
+    def window(self: Self, start: Instant, end: Instant) -> RepeatWindow[tuple[I_co, I_co]]:
+        """
+        Returns the occurrences that start in `[start, end)`, computed on demand.
+        """
+        p = self._progression
+        return RepeatWindow(p.index_range(_micros(start), _micros(end)), p.first, p.step, self.nth, "datetime64[us]")
+
+    @property
+    def _progression(self: Self) -> _Progression:
+        start = _micros(self.start)
+        return _Progression(start, _micros(self.end) - start, self.repeats)
+
+    def _instant(self: Self, micros: int) -> I_co:
+        return self.start._unchecked((_EPOCH + timedelta(microseconds=micros)).astimezone(self.start.zone))
+
     @property
     def _json_data(self: Self) -> JsonType:
         return {
@@ -109,6 +254,40 @@ class RepeatEvent(Model, Generic[D_co]):
         r = "" if self.repeats is None else self.repeats
         return f"R{r}/{self.duration}"
 
+    def nth(self: Self, n: int) -> D_co:
+        """
+        Returns the offset of occurrence `n` (from 0), which is `n` durations.
+        """
+        return self._duration(self._progression.nth(n))
+
+    def next_after(self: Self, offset: Duration | timedelta) -> D_co | None:
+        k = self._progression.next_after(_micros(offset))
+        return None if k is None else self.nth(k)
+
+    def previous_before(self: Self, offset: Duration | timedelta) -> D_co | None:
+        k = self._progression.previous_before(_micros(offset))
+        return None if k is None else self.nth(k)
+
+    def count_in(self: Self, start: Duration | timedelta, end: Duration | timedelta) -> int:
+        """
+        Counts the occurrences in `[start, end)`.
+        """
+        return len(self._progression.index_range(_micros(start), _micros(end)))
+
+    def window(self: Self, start: Duration | timedelta, end: Duration | timedelta) -> RepeatWindow[D_co]:
+        """
+        Returns the occurrences in `[start, end)`, computed on demand.
+        """
+        p = self._progression
+        return RepeatWindow(p.index_range(_micros(start), _micros(end)), p.first, p.step, self.nth, "timedelta64[us]")
+
+    @property
+    def _progression(self: Self) -> _Progression:
+        return _Progression(0, _micros(self.duration), self.repeats)
+
+    def _duration(self: Self, micros: int) -> D_co:
+        return self.duration.__class__(timedelta(microseconds=micros))
+
     @property
     def _json_data(self: Self) -> JsonType:
         return {
@@ -180,6 +359,49 @@ class RepeatDuration(Model, Generic[D_co]):
     def duration(self: Self) -> Duration:
         return self.end - self.start
 
+    def nth(self: Self, n: int) -> tuple[D_co, D_co]:
+        """
+        Returns occurrence `n` (from 0): `start` and `end`, each shifted by `n` times `end` (as in `__iter__`).
+        """
+        start = self._progression.nth(n)
+        return self._duration(start), self._duration(start + _micros(self.end) - _micros(self.start))
+
+    def next_after(self: Self, offset: Duration | timedelta) -> tuple[D_co, D_co] | None:
+        """
+        Returns the first occurrence that starts strictly after `offset`, if any.
+        """
+        k = self._progression.next_after(_micros(offset))
+        return None if k is None else self.nth(k)
+
+    def previous_before(self: Self, offset: Duration | timedelta) -> tuple[D_co, D_co] | None:
+        """
+        Returns the last occurrence that starts strictly before `offset`, if any.
+        """
+        k = self._progression.previous_before(_micros(offset))
+        return None if k is None else self.nth(k)
+
+    def count_in(self: Self, start: Duration | timedelta, end: Duration | timedelta) -> int:
+        """
+        Counts the occurrences that start in `[start, end)`.
+        """
+        return len(self._progression.index_range(_micros(start), _micros(end)))
+
+    def window(
+        self: Self, start: Duration | timedelta, end: Duration | timedelta
+    ) -> RepeatWindow[tuple[D_co, D_co]]:
+        """
+        Returns the occurrences that start in `[start, end)`, computed on demand.
+        """
+        p = self._progression
+        return RepeatWindow(p.index_range(_micros(start), _micros(end)), p.first, p.step, self.nth, "timedelta64[us]")
+
+    @property
+    def _progression(self: Self) -> _Progression:
+        return _Progression(_micros(self.start), _micros(self.end), self.repeats)
+
+    def _duration(self: Self, micros: int) -> D_co:
+        return self.start.__class__(timedelta(microseconds=micros))
+
     @property
     def _json_data(self: Self) -> JsonType:
         return {
@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Bulk expansion of repeating schedules anchored to an instant in an IANA zone.
+
+Requires NumPy (the `arrays` extra).
+"""
+
+from __future__ import annotations
+
+import enum
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Self
+
+import numpy as np
+
+from realized.dt import Resolution
+from realized.dt.arrays import ONE_MICROSECOND, InstantArray, _instant_micros
+from realized.dt.durations import Duration
+from realized.dt.instants import Instant, InstantWithCity
+from realized.dt.repeats import RepeatEvent
+from realized.dt.zones import ZoneTable
+from realized.errors import LocalTimeError
+
+__all__ = ["Clock", "FoldPolicy", "GapPolicy", "Schedule"]
+# no zone is more than 14 hours from UTC
+_MAX_OFFSET_MICROS = 14 * 3600 * 1_000_000
+
+
+class Clock(enum.StrEnum):
+    """
+    How the period between occurrences is measured.
+    """
+
+    WALL: Self = "wall"  # local time of day is kept, so elapsed time between occurrences changes across DST
+    ELAPSED: Self = "elapsed"  # occurrences are exactly one period apart, so local time of day drifts across DST
+
+
+class GapPolicy(enum.StrEnum):
+    """
+    What to do with a wall-clock occurrence that a zone transition skips (e.g. 02:30 when clocks go forward).
+    """
+
+    LATER: Self = "later"  # move it forward by the length of the gap, as datetime does with fold=0
+    EARLIER: Self = "earlier"  # move it back by the length of the gap, as datetime does with fold=1
+    SKIP: Self = "skip"
+    RAISE: Self = "raise"
+
+
+class FoldPolicy(enum.StrEnum):
+    """
+    What to do with a wall-clock occurrence that a zone transition repeats (e.g. 01:30 when clocks go back).
+    """
+
+    EARLIER: Self = "earlier"  # the first of the two instants (fold=0)
+    LATER: Self = "later"  # the second of the two instants (fold=1)
+    SKIP: Self = "skip"
+    RAISE: Self = "raise"
+
+
+@dataclass(slots=True, frozen=True)
+class Schedule:
+    """
+    Occurrences `anchor + k * period` for `k` from 0 to `repeats` (or without end if `None`).
+
+    Expansion is vectorized over the precomputed transition table of the anchor's zone.
+    With `Clock.WALL`, each occurrence is first computed as a local time and then resolved to an instant
+    according to `gaps` and `folds`; the anchor itself is always kept as is.
+    """
+
+    anchor: InstantWithCity
+    period: timedelta
+    repeats: int | None = None
+    clock: Clock = Clock.WALL
+    gaps: GapPolicy = GapPolicy.LATER
+    folds: FoldPolicy = FoldPolicy.EARLIER
+
+    def __post_init__(self: Self) -> None:
+        if isinstance(self.period, Duration):
+            object.__setattr__(self, "period", self.period.delta)
+        if self.period <= timedelta(0):
+            msg = f"Period must be positive, not {self.period}"
+            raise ValueError(msg)
+
+    @classmethod
+    def of(
+        cls: type[Self],
+        repeat: RepeatEvent,
+        anchor: InstantWithCity,
+        *,
+        clock: Clock = Clock.WALL,
+        gaps: GapPolicy = GapPolicy.LATER,
+        folds: FoldPolicy = FoldPolicy.EARLIER,
+    ) -> Self:
+        return cls(anchor, repeat.duration.delta, repeat.repeats, clock, gaps, folds)
+
+    def expand(self: Self, start: Instant | None = None, end: Instant | None = None) -> InstantArray:
+        """
+        Returns the occurrences in `[start, end)` as an `InstantWithCity` array, in order.
+        Either bound may be omitted if `repeats` is set.
+
+        Raises:
+            LocalTimeError: If an occurrence is skipped or repeated and the policy is `RAISE`
+        """
+        resolution = max(
+            Resolution.of_microseconds(self.anchor.dt.microsecond),
+            Resolution.of_microseconds(self.period.microseconds),
+            key=lambda r: r.decimals,
+        )
+        return InstantArray(self.expand_micros(start, end), InstantWithCity, resolution, self.anchor.zone)
+
+    def expand_micros(self: Self, start: Instant | None = None, end: Instant | None = None) -> np.ndarray:
+        """
+        Like `expand`, but returns int64 UTC epoch microseconds.
+        """
+        anchor = _instant_micros(self.anchor)
+        step = self.period // ONE_MICROSECOND
+        lo = anchor if start is None else _instant_micros(start)
+        if end is not None:
+            hi = _instant_micros(end)
+        elif self.repeats is not None:
+            hi = None
+        else:
+            msg = "An end is required for schedules that repeat without end"
+            raise ValueError(msg)
+        table = ZoneTable.of(self.anchor.zone)
+        if self.clock is Clock.ELAPSED:
+            k = self._indices(anchor, step, lo, hi)
+            micros = anchor + k * step
+        else:
+            local = anchor + (self.anchor.dt.utcoffset() // ONE_MICROSECOND)
+            # local times lie within 14 hours of their instants
+            k = self._indices(local, step, lo - _MAX_OFFSET_MICROS, None if hi is None else hi + _MAX_OFFSET_MICROS)
+            micros = self._resolve(table, local + k * step, k, anchor=anchor, window=(lo, hi))
+        keep = micros >= lo
+        if hi is not None:
+            keep &= micros < hi
+        return micros[keep]
+
+    def _indices(self: Self, first: int, step: int, lo: int, hi: int | None) -> np.ndarray:
+        # occurrence numbers whose value first + k * step lies in [lo, hi)
+        k_min = max(0, -((first - lo) // step))
+        k_max = self.repeats if self.repeats is not None else None
+        if hi is not None:
+            k_hi = -((first - hi) // step) - 1
+            k_max = k_hi if k_max is None else min(k_max, k_hi)
+        return np.arange(k_min, max(k_min, k_max + 1), dtype=np.int64)
+
+    def _resolve(
+        self: Self, table: ZoneTable, local: np.ndarray, k: np.ndarray, *, anchor: int, window: tuple[int, int | None]
+    ) -> np.ndarray:
+        lo, hi = window
+        early, late = table.to_utc(local, fold=0), table.to_utc(local, fold=1)
+        # in a gap, fold=0 gives the later instant and fold=1 the earlier one; in a fold, the reverse
+        # only occurrences that could fall in the window matter, and the anchor is never moved
+        relevant = (k != 0) & (np.maximum(early, late) >= lo)
+        if hi is not None:
+            relevant &= np.minimum(early, late) < hi
+        gap, fold = relevant & (early > late), relevant & (early < late)
+        micros = early.copy()
+        micros[k == 0] = anchor
+        keep = np.ones(len(local), dtype=bool)
+        if gap.any():
+            self._check(self.gaps is GapPolicy.RAISE, gap, k, "skips")
+            if self.gaps is GapPolicy.EARLIER:
+                micros[gap] = late[gap]
+            elif self.gaps is GapPolicy.SKIP:
+                keep &= ~gap
+        if fold.any():
+            self._check(self.folds is FoldPolicy.RAISE, fold, k, "repeats")
+            if self.folds is FoldPolicy.LATER:
+                micros[fold] = late[fold]
+            elif self.folds is FoldPolicy.SKIP:
+                keep &= ~fold
+        return micros[keep]
+
+    def _check(self: Self, raise_: bool, mask: np.ndarray, k: np.ndarray, what: str) -> None:
+        if raise_:
+            i = int(np.argmax(mask))
+            msg = f"Occurrence {k[i]} falls on a wall-clock time that {self.anchor.zone.key} {what}"
+            raise LocalTimeError(msg)
@@ -0,0 +1,264 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Column parsing that detects the format of a column once, from a sample, then applies one specialized parser.
+
+Requires NumPy (the `arrays` extra).
+"""
+
+from __future__ import annotations
+
+import enum
+from collections import Counter
+from collections.abc import Iterable
+from typing import Self
+
+import numpy as np
+
+from realized.dt import Resolution
+from realized.dt.arrays import (
+    _DECIMALS_TO_RESOLUTION,
+    _INT64,
+    DurationArray,
+    InstantArray,
+    _as_byte_matrix,
+    _int64_micros,
+    _parse_rfc3339_matrix,
+)
+from realized.dt.durations import (
+    DURATION_MICROSEC_REGEX,
+    ColonSeparatedDuration,
+    Duration,
+    IsoDuration,
+    _any_micros,
+    _match_micros,
+)
+from realized.dt.instants import UTC, Instant, InstantUtc, InstantWithCity, InstantWithOffset
+from realized.errors import RealizedParseError
+
+__all__ = [
+    "DurationFormat",
+    "parse_durations",
+    "parse_instants",
+    "sniff_durations",
+    "sniff_instants",
+]
+SAMPLE_SIZE = 64
+# hours beyond this many digits could overflow int64 microseconds; such rows take the per-element path
+_MAX_HOUR_DIGITS = 9
+
+
+class DurationFormat(enum.StrEnum):
+    ISO8601: Self = "iso8601"  # e.g. PT1H2M3.5S
+    COLON_SEPARATED: Self = "colon-separated"  # e.g. 01:02:03.500
+
+
+def _resolution_of(decimals: int) -> Resolution:
+    if decimals == 0:
+        return Resolution.SECOND
+    return Resolution.MILLISECOND if decimals <= 3 else Resolution.MICROSECOND
+
+
+def _sample(values: np.ndarray, sample_size: int) -> list[str]:
+    # evenly spaced rows, so sorted or blocked columns are represented from end to end
+    if len(values) <= sample_size:
+        return values.tolist()
+    return values[np.linspace(0, len(values) - 1, sample_size).astype(np.int64)].tolist()
+
+
+def _as_str_array(values: Iterable[str | bytes] | np.ndarray) -> np.ndarray:
+    arr = values if isinstance(values, np.ndarray) else np.asarray(list(values))
+    if arr.dtype.kind == "S":
+        return np.char.decode(arr, "ascii", "replace")
+    if arr.dtype.kind != "U" and len(arr) > 0:
+        msg = f"Cannot parse values of dtype {arr.dtype}"
+        raise TypeError(msg)
+    return arr.astype(str)
+
+
+def _sniff_duration(v: str) -> tuple[DurationFormat, int]:
+    fmt = DurationFormat.ISO8601 if v.startswith(("P", "-P")) else DurationFormat.COLON_SEPARATED
+    _, dot, fraction = v.rpartition(".")
+    return fmt, len(fraction.removesuffix("S")) if dot else 0
+
+
+def _sniff_instant(v: str) -> tuple[type[Instant], int]:
+    stamp, _, city = v.partition(" ")
+    if city.endswith("]"):
+        instant_type = InstantWithCity
+    elif stamp.endswith("Z"):
+        instant_type = InstantUtc
+    else:
+        instant_type = InstantWithOffset
+    if len(stamp) <= 19 or stamp[19] != ".":
+        return instant_type, 0
+    fraction = stamp[20:].rstrip("Z").partition("+")[0].partition("-")[0]
+    return instant_type, len(fraction)
+
+
+def sniff_durations(
+    values: Iterable[str | bytes] | np.ndarray, sample_size: int = SAMPLE_SIZE
+) -> tuple[DurationFormat, Resolution]:
+    """
+    Returns the most common format in a sample of a duration column, and the finest resolution among rows in it.
+    """
+    sample = _sample(_as_str_array(values), sample_size)
+    sniffed = [_sniff_duration(v) for v in sample]
+    fmt = Counter(f for f, _ in sniffed).most_common(1)[0][0] if sniffed else DurationFormat.ISO8601
+    return fmt, _resolution_of(max((d for f, d in sniffed if f is fmt), default=0))
+
+
+def sniff_instants(
+    values: Iterable[str | bytes] | np.ndarray, sample_size: int = SAMPLE_SIZE
+) -> tuple[type[Instant], Resolution]:
+    """
+    Returns the most common `Instant` type (by suffix: `Z`, `±HH:MM`, or ` [zone]`) in a sample of a column,
+    and the finest resolution among rows of that type.
+    """
+    sample = _sample(_as_str_array(values), sample_size)
+    sniffed = [_sniff_instant(v) for v in sample]
+    instant_type = Counter(t for t, _ in sniffed).most_common(1)[0][0] if sniffed else InstantUtc
+    return instant_type, _resolution_of(max((d for t, d in sniffed if t is instant_type), default=0))
+
+
+def parse_durations(
+    values: Iterable[str | bytes] | np.ndarray,
+    duration_type: type[Duration] | None = None,
+    *,
+    sample_size: int = SAMPLE_SIZE,
+) -> DurationArray:
+    """
+    Parses a column of durations with the one parser its sniffed format needs.
+
+    Colon-separated columns are parsed column-wise for the sniffed number of fractional digits;
+    ISO 8601 columns are matched once per distinct value.
+    Only rows that do not fit the sniffed format are parsed individually, in either format.
+    `duration_type` defaults to the type whose `as_str` is the sniffed format.
+
+    Raises:
+        RealizedParseError: If any row is in neither format
+    """
+    values = _as_str_array(values)
+    fmt, resolution = sniff_durations(values, sample_size)
+    if fmt is DurationFormat.COLON_SEPARATED:
+        micros, valid = _parse_colon_column(values, resolution)
+    else:
+        micros, valid = _parse_iso_column(values)
+    for i in np.flatnonzero(~valid).tolist():
+        try:
+            parsed = _any_micros(str(values[i]))
+        except RealizedParseError as e:
+            msg = f"Row {i} ('{values[i]}') is not a valid duration"
+            raise RealizedParseError(msg, value=values[i]) from e
+        micros[i] = _int64_micros(parsed, i, values[i])
+    if duration_type is None:
+        duration_type = ColonSeparatedDuration if fmt is DurationFormat.COLON_SEPARATED else IsoDuration
+    return DurationArray(micros, duration_type)
+
+
+def parse_instants(
+    values: Iterable[str | bytes] | np.ndarray,
+    instant_type: type[Instant] | None = None,
+    resolution: Resolution | None = None,
+    *,
+    sample_size: int = SAMPLE_SIZE,
+) -> InstantArray:
+    """
+    Parses a column of instants as the sniffed (or given) `Instant` type.
+
+    For UTC and offset columns, rows that use the other suffix are re-parsed individually:
+    `Z` is accepted as `+00:00` in an offset column, and `+00:00` as `Z` in a UTC column.
+    Other rows must match the column's type.
+
+    Raises:
+        RealizedParseError: If any row is malformed or cannot be represented as the column's type
+        ZoneMismatchError: If an `InstantWithCity` row names a different zone or has the wrong offset
+    """
+    values = _as_str_array(values)
+    if len(values) == 0:
+        return InstantArray.from_strs(values, instant_type or InstantUtc, resolution)
+    if instant_type is None:
+        instant_type, _ = sniff_instants(values, sample_size)
+    if instant_type is InstantWithCity:
+        return InstantArray.from_strs(values, instant_type, resolution)
+    utc = instant_type is InstantUtc
+    parsed = _parse_rfc3339_matrix(*_as_byte_matrix(values), utc=utc)
+    micros, offsets, decimals, valid = parsed.micros, parsed.offsets, parsed.decimals, parsed.valid
+    bad = np.flatnonzero(~valid)
+    if len(bad) > 0:
+        other = _parse_rfc3339_matrix(*_as_byte_matrix(values[bad]), utc=not utc)
+        fixed = other.valid & (other.offsets == 0)
+        micros[bad], offsets[bad], decimals[bad] = other.micros, other.offsets, other.decimals
+        valid[bad] = fixed
+    if not valid.all():
+        i = int(np.argmin(valid))
+        msg = f"Row {i} ('{values[i]}') is not a valid {instant_type.__name__}"
+        raise RealizedParseError(msg, value=values[i])
+    if resolution is None:
+        resolution = _DECIMALS_TO_RESOLUTION[int(decimals.max(initial=0))]
+    if utc:
+        return InstantArray(micros, instant_type, resolution, UTC)
+    return InstantArray(micros, instant_type, resolution, None, offsets)
+
+
+def _parse_iso_column(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    uniques, inverse = np.unique(values, return_inverse=True)
+    micros = np.zeros(len(uniques), dtype=np.int64)
+    valid = np.zeros(len(uniques), dtype=bool)
+    for i, v in enumerate(uniques.tolist()):
+        match = DURATION_MICROSEC_REGEX.fullmatch(v)
+        if match is not None and not v.endswith(("P", "T")):
+            parsed = _match_micros(match)
+            # out-of-range rows are left invalid, to be reported with their row number
+            if _INT64.min <= parsed <= _INT64.max:
+                micros[i], valid[i] = parsed, True
+    inverse = inverse.reshape(-1)
+    return micros[inverse], valid[inverse]
+
+
+def _parse_colon_column(values: np.ndarray, resolution: Resolution) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parses `[-]H+:MM:SS` plus exactly `resolution.decimals` fractional digits, working from the end of each row.
+    Rows laid out differently are marked invalid.
+    """
+    mat, lengths = _as_byte_matrix(values)
+    n, decimals = len(mat), resolution.decimals
+    width = max(mat.shape[1], 1)
+    m = np.pad(mat, ((0, 0), (0, width + 1 - mat.shape[1]))).astype(np.int64)
+    digits = m - 48
+    is_digit = (digits >= 0) & (digits <= 9)
+    rows = np.arange(n)
+    start = (m[:, 0] == ord("-")).astype(np.int64)
+    seconds_end = lengths - (decimals + 1 if decimals > 0 else 0)
+    hours_end = seconds_end - 6
+    valid = (hours_end > start) & (hours_end - start <= _MAX_HOUR_DIGITS)
+
+    def at(offset: np.ndarray) -> np.ndarray:
+        return np.clip(offset, 0, width)
+
+    def number(*positions: np.ndarray) -> np.ndarray:
+        nonlocal valid
+        x = np.zeros(n, dtype=np.int64)
+        for p in positions:
+            q = at(p)
+            valid &= is_digit[rows, q]
+            x = 10 * x + digits[rows, q]
+        return x
+
+    valid &= (m[rows, at(hours_end)] == ord(":")) & (m[rows, at(seconds_end - 3)] == ord(":"))
+    minutes = number(hours_end + 1, hours_end + 2)
+    seconds = number(seconds_end - 2, seconds_end - 1)
+    valid &= (minutes <= 60) & (seconds <= 60)
+    fraction = np.zeros(n, dtype=np.int64)
+    if decimals > 0:
+        valid &= m[rows, at(seconds_end)] == ord(".")
+        fraction = number(*(seconds_end + 1 + k for k in range(decimals))) * 10 ** (6 - decimals)
+    hours = np.zeros(n, dtype=np.int64)
+    for j in range(mat.shape[1]):
+        in_hours = (j >= start) & (j < hours_end)
+        valid &= ~in_hours | is_digit[:, j]
+        hours = np.where(in_hours, 10 * hours + digits[:, j], hours)
+    micros = ((hours * 60 + minutes) * 60 + seconds) * 1_000_000 + fraction
+    return np.where(start == 1, -micros, micros), valid
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Vectorized UTC-offset lookups from precomputed tzdata transition tables.
+
+Requires NumPy (the `arrays` extra).
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.resources
+import struct
+import zoneinfo
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Self
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from realized.dt.instants import UTC, get_zone
+
+__all__ = ["ZoneTable"]
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+MICROS_PER_SECOND = 1_000_000
+# Transitions after the last explicit one follow the TZif footer rule; they are found by probing until this instant
+HORIZON = datetime(2100, 1, 1, tzinfo=UTC)
+# Rule-based transitions are always more than this far apart, so probing at this step cannot miss one
+_PROBE_STEP = timedelta(days=7)
+_MIN_SECONDS = int((datetime(1, 1, 2, tzinfo=UTC) - EPOCH).total_seconds())
+_HEADER = struct.Struct(">4sc15x6l")
+
+
+def _read_tzif(key: str) -> bytes:
+    """
+    Reads the TZif file for `key` from the same places `zoneinfo` searches: `TZPATH`, then the `tzdata` package.
+    """
+    for root in zoneinfo.TZPATH:
+        path = Path(root, key)
+        if path.is_file():
+            return path.read_bytes()
+    try:
+        return importlib.resources.files("tzdata.zoneinfo").joinpath(*key.split("/")).read_bytes()
+    except (ImportError, FileNotFoundError) as e:
+        msg = f"No time zone found with key {key}"
+        raise zoneinfo.ZoneInfoNotFoundError(msg) from e
+
+
+def _tzif_transitions(data: bytes) -> list[int]:
+    """
+    Returns the UTC transition times, in epoch seconds, from the 64-bit (v2+) block of a TZif file.
+    Falls back to the 32-bit block for version 1 files.
+    """
+    magic, version, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = _HEADER.unpack_from(data)
+    if magic != b"TZif":
+        msg = "Not a TZif file"
+        raise ValueError(msg)
+    if version == b"\x00":
+        return list(struct.unpack_from(f">{timecnt}l", data, _HEADER.size))
+    # skip the v1 block to reach the second header
+    start = _HEADER.size + timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt
+    _, _, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = _HEADER.unpack_from(data, start)
+    return list(struct.unpack_from(f">{timecnt}q", data, start + _HEADER.size))
+
+
+def _offset_at(zone: ZoneInfo, seconds: int) -> int:
+    dt = (EPOCH + timedelta(seconds=seconds)).astimezone(zone)
+    return dt.utcoffset() // timedelta(seconds=1)
+
+
+@dataclass(slots=True, frozen=True)
+class ZoneTable:
+    """
+    The UTC offsets of one IANA zone as a step function of UTC time.
+
+    `offsets[0]` applies before `transitions[0]`, and `offsets[i + 1]` from `transitions[i]` (inclusive).
+    Transition times come from the zone's TZif file, extended to `HORIZON` by probing its footer rule;
+    every offset is taken from `ZoneInfo` itself, so lookups agree exactly with `datetime.astimezone`.
+    Values at or after `horizon` are looked up one at a time.
+    """
+
+    zone: ZoneInfo
+    transitions: np.ndarray  # int64 UTC epoch microseconds
+    offsets: np.ndarray  # int32 seconds
+    horizon: int  # UTC epoch microseconds
+
+    @classmethod
+    def of(cls: type[Self], zone: ZoneInfo | str) -> Self:
+        """
+        Returns the (cached) table for a zone or zone key.
+        """
+        return _table(zone if isinstance(zone, str) else zone.key)
+
+    @classmethod
+    def _build(cls: type[Self], key: str) -> Self:
+        zone = get_zone(key)
+        horizon = int((HORIZON - EPOCH).total_seconds())
+        explicit = [t for t in _tzif_transitions(_read_tzif(key)) if _MIN_SECONDS < t < horizon]
+        first = explicit[0] if explicit else horizon
+        offsets = [_offset_at(zone, first - 1)]
+        transitions = []
+        for t in explicit:
+            offset = _offset_at(zone, t)
+            if offset != offsets[-1]:
+                transitions.append(t)
+                offsets.append(offset)
+        # probe the rule-based tail, bisecting each change down to the second
+        step = int(_PROBE_STEP.total_seconds())
+        t = explicit[-1] if explicit else 0
+        while t < horizon:
+            nxt = min(t + step, horizon)
+            offset = _offset_at(zone, nxt)
+            if offset != offsets[-1]:
+                lo, hi = t, nxt
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if _offset_at(zone, mid) == offsets[-1]:
+                        lo = mid
+                    else:
+                        hi = mid
+                transitions.append(hi)
+                offsets.append(offset)
+            t = nxt
+        return cls(
+            zone,
+            np.asarray(transitions, dtype=np.int64) * MICROS_PER_SECOND,
+            np.asarray(offsets, dtype=np.int32),
+            horizon * MICROS_PER_SECOND,
+        )
+
+    def utc_offsets(self: Self, utc_micros: np.ndarray) -> np.ndarray:
+        """
+        Returns the UTC offset in seconds (int32) at each UTC epoch microsecond.
+        """
+        utc_micros = np.asarray(utc_micros, dtype=np.int64)
+        result = self.offsets[np.searchsorted(self.transitions, utc_micros, side="right")]
+        late = utc_micros >= self.horizon
+        if late.any():
+            result[late] = [_offset_at(self.zone, u // MICROS_PER_SECOND) for u in utc_micros[late].tolist()]
+        return result
+
+    def to_local(self: Self, utc_micros: np.ndarray) -> np.ndarray:
+        """
+        Converts UTC epoch microseconds to wall-clock microseconds since 1970-01-01T00:00:00 (local).
+        """
+        utc_micros = np.asarray(utc_micros, dtype=np.int64)
+        return utc_micros + self.utc_offsets(utc_micros).astype(np.int64) * MICROS_PER_SECOND
+
+    def to_utc(self: Self, local_micros: np.ndarray, *, fold: int = 0) -> np.ndarray:
+        """
+        Converts wall-clock microseconds to UTC epoch microseconds.
+
+        Resolves ambiguous and skipped wall times the way `datetime` does:
+        `fold=0` uses the offset from before the transition, and `fold=1` uses the offset from after it.
+        """
+        local_micros = np.asarray(local_micros, dtype=np.int64)
+        before, after = self.offsets[:-1].astype(np.int64), self.offsets[1:].astype(np.int64)
+        shift = np.maximum(before, after) if fold == 0 else np.minimum(before, after)
+        walls = self.transitions + shift * MICROS_PER_SECOND
+        offsets = self.offsets[np.searchsorted(walls, local_micros, side="right")].astype(np.int64)
+        result = local_micros - offsets * MICROS_PER_SECOND
+        # the last offset is only trusted up to the horizon, and no offset exceeds 14 hours
+        late = local_micros + 14 * 3600 * MICROS_PER_SECOND >= self.horizon
+        if late.any():
+            result[late] = [self._to_utc_one(u, fold) for u in local_micros[late].tolist()]
+        return result
+
+    def _to_utc_one(self: Self, local_micros: int, fold: int) -> int:
+        local = datetime(1970, 1, 1) + timedelta(microseconds=local_micros)
+        return (local.replace(tzinfo=self.zone, fold=fold) - EPOCH) // timedelta(microseconds=1)
+
+
+@functools.cache
+def _table(key: str) -> ZoneTable:
+    return ZoneTable._build(key)
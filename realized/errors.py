@@ -7,12 +7,15 @@ Exception classes for suretime.
 Model and utility classes for suretime.
 """
 
+import enum
 from typing import Self, Unpack, Any
 
 from pocketutils import Error
 
 __all__ = [
     "DatetimeMissingZoneError",
+    "LocalTimeError",
+    "ParseErrorCode",
     "ZoneMismatchError",
     "RealizedParseError",
 ]
@@ -30,6 +33,24 @@ class ZoneMismatchError(Error):
     """
 
 
+class LocalTimeError(Error):
+    """
+    Raised when a wall-clock time is skipped or repeated in a zone and no policy resolves it.
+    """
+
+
+class ParseErrorCode(enum.IntEnum):
+    """
+    Why a value failed to parse, as returned by non-raising parsers in place of an exception.
+    """
+
+    OK: Self = 0
+    SYNTAX: Self = 1  # not in the format at all
+    RANGE: Self = 2  # in the format, but a field is out of range (e.g. February 30)
+    ZONE: Self = 3  # an unknown zone, or an offset that disagrees with the zone
+    TYPE: Self = 4  # not a str
+
+
 class RealizedParseError(Error):
     """
     Raised on failure to parse a format.
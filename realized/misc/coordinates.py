@@ -11,12 +11,29 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Self
 
-from realized._core import Model
+from realized._core import Model, _check_key, _int64_key, _int64_of_key
+from realized.errors import RealizedParseError
 
 RECTANGLE_XY_REGEX = re.compile(r"\((?P<left>\d+),(?P<top>\d+)\)x\((?P<right>\d+),(?P<bottom>\d+)\)")
 SCALE_XY_REGEX = re.compile(r"\((?P<x>\d+),(?P<y>\d+)\)")
 
 
+def _integral(v: Decimal) -> int:
+    if v != v.to_integral_value():
+        msg = f"{v} is not an integer"
+        raise ValueError(msg)
+    return int(v)
+
+
+def _int64_keys(*values: Decimal) -> bytes:
+    return b"".join(_int64_key(_integral(v)) for v in values)
+
+
+def _decimals_of_key(cls: type, key: bytes, n: int) -> list[Decimal]:
+    _check_key(cls, key, 8 * n)
+    return [Decimal(_int64_of_key(key, 8 * i)) for i in range(n)]
+
+
 @dataclass(slots=True, frozen=True, order=True)
 class XY(Model):
 
@@ -26,6 +43,9 @@ class XY(Model):
     @classmethod
     def from_str(cls: type[Self], v: str) -> Self:
         match = SCALE_XY_REGEX.fullmatch(v)
+        if match is None:
+            msg = f"'{v}' is not in (x,y) format"
+            raise RealizedParseError(msg, value=v)
         return cls(**{k: Decimal(i) for k, i in match.groupdict().items()})
 
     def __mul__(self: Self, other: Decimal | float | Self) -> Self:
@@ -52,6 +72,20 @@ class XY(Model):
     def as_str(self: Self) -> str:
         return f"({self.x},{self.y})"
 
+    @property
+    def as_sort_key(self: Self) -> bytes:
+        """
+        `x` then `y` as biased big-endian int64s.
+
+        Raises:
+            ValueError: If a coordinate is not an integer
+        """
+        return _int64_keys(self.x, self.y)
+
+    @classmethod
+    def from_sort_key(cls: type[Self], key: bytes) -> Self:
+        return cls(*_decimals_of_key(cls, key, 2))
+
 
 @dataclass(slots=True, frozen=True, order=True)
 class Rectangle(Model, metaclass=abc.ABCMeta):
@@ -64,6 +98,9 @@ class Rectangle(Model, metaclass=abc.ABCMeta):
     @classmethod
     def from_str(cls: type[Self], v: str) -> Self:
         match = RECTANGLE_XY_REGEX.fullmatch(v)
+        if match is None:
+            msg = f"'{v}' is not in (left,top)x(right,bottom) format"
+            raise RealizedParseError(msg, value=v)
         return cls(**{k: Decimal(i) for k, i in match.groupdict().items()})
 
     def __rshift__(self: Self, other: Decimal | float | XY) -> Self:
@@ -141,6 +178,20 @@ class Rectangle(Model, metaclass=abc.ABCMeta):
     def as_str(self: Self) -> str:
         return f"({self.left},{self.top})x({self.right},{self.bottom})"
 
+    @property
+    def as_sort_key(self: Self) -> bytes:
+        """
+        `left`, `top`, `right`, then `bottom` as biased big-endian int64s.
+
+        Raises:
+            ValueError: If a coordinate is not an integer
+        """
+        return _int64_keys(self.left, self.top, self.right, self.bottom)
+
+    @classmethod
+    def from_sort_key(cls: type[Self], key: bytes) -> Self:
+        return cls(*_decimals_of_key(cls, key, 4))
+
     @property
     def center(self: Self) -> XY:
         return XY(self.left + self.width / 2, self.top + self.height / 2)
@@ -4,13 +4,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
 from decimal import Decimal
 from dataclasses import dataclass
-from typing import Self, TYPE_CHECKING, Unpack, Any
+from typing import Self, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from pint import UnitRegistry, Quantity, Unit
+    from pint import Quantity, Unit, UnitRegistry
 
 from realized._core import JsonType, Model
 
@@ -19,11 +18,13 @@ __all__ = ["Dimensioned"]
 
 class LazyUnitRegistry:
 
-    ureg: UnitRegistry | None
-    Q: Quantity | None
+    ureg: UnitRegistry | None = None
+    Q: type[Quantity] | None = None
 
-    def __call__(self: Self, *args: Any, **kwargs: Unpack[Mapping[str, Any]]):
+    def __call__(self: Self, *args: Any, **kwargs: Any) -> Quantity:
         if self.Q is None:
+            from pint import UnitRegistry  # noqa: PLC0415 (optional quantities extra)
+
             self.ureg = UnitRegistry(non_int_type=Decimal)
             self.Q = self.ureg.Quantity
             self.Q.separate_format_defaults = True
@@ -42,6 +43,10 @@ class Dimensioned(Model):
     def from_str(cls: type[Self], v: str) -> Self:
         return cls(UNIT_REGISTRY(v))
 
+    @classmethod
+    def _from_json_data(cls: type[Self], data: JsonType) -> Self:
+        return cls(UNIT_REGISTRY(Decimal(data["magnitude"]), data["units"]))
+
     def __add__(self: Self, other: Quantity) -> Self:
         return self.__class__(self.quantity + other)
 
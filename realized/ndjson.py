@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Streaming newline-delimited JSON for models.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import BinaryIO, Generic, Self, TypeVar
+
+import orjson
+
+from realized._core import _PARSE_ERRORS, ORJSON_OPTS, Model, _json_default
+from realized.errors import RealizedParseError
+
+__all__ = ["NdjsonCodec"]
+M = TypeVar("M", bound=Model)
+
+
+@dataclass(slots=True, frozen=True)
+class NdjsonCodec(Generic[M]):
+    """
+    Reads and writes one model per line, each line holding the model's JSON data.
+
+    Memory is bounded by `chunk_size` records when writing and `read_size` bytes (plus one line) when reading.
+
+    Example:
+        codec = NdjsonCodec(InstantWithCity)
+        with path.open("wb") as f:
+            codec.write(instants, f)
+        with path.open("rb") as f:
+            for instant in codec.read(f):
+                ...
+    """
+
+    model_type: type[M]
+    chunk_size: int = 1024
+    read_size: int = 1 << 20
+
+    def __post_init__(self: Self) -> None:
+        if self.chunk_size < 1 or self.read_size < 1:
+            msg = f"chunk_size ({self.chunk_size}) and read_size ({self.read_size}) must be positive"
+            raise ValueError(msg)
+
+    def encode(self: Self, models: Iterable[M]) -> Iterator[bytes]:
+        """
+        Yields chunks of up to `chunk_size` encoded lines.
+        """
+        buffer = bytearray()
+        for i, model in enumerate(models, 1):
+            buffer += orjson.dumps(model, default=_json_default, option=ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE)
+            if i % self.chunk_size == 0:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    def write(self: Self, models: Iterable[M], fp: BinaryIO) -> int:
+        """
+        Writes `models` to a binary file, flushing every `chunk_size` records.
+
+        Returns:
+            The number of models written
+        """
+        buffer = bytearray()
+        n = 0
+        for n, model in enumerate(models, 1):
+            buffer += orjson.dumps(model, default=_json_default, option=ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE)
+            if n % self.chunk_size == 0:
+                fp.write(buffer)
+                buffer.clear()
+        if buffer:
+            fp.write(buffer)
+        return n
+
+    def decode(self: Self, chunks: Iterable[bytes]) -> Iterator[M]:
+        """
+        Yields models from chunks of bytes, which may split lines at any point.
+        Blank lines are skipped.
+
+        Raises:
+            RealizedParseError: If a line is not valid JSON or not valid for the model type
+        """
+        # the pieces of a line that spans chunks, joined once it ends, so that a long line is copied once
+        partial: list[bytes] = []
+        line_no = 0
+        for chunk in chunks:
+            lines = chunk.split(b"\n")
+            tail = lines.pop()
+            if lines and partial:
+                partial.append(lines[0])
+                lines[0] = b"".join(partial)
+                partial.clear()
+            if tail:
+                partial.append(tail)
+            for line in lines:
+                line_no += 1
+                if line.strip():
+                    yield self._load(line, line_no)
+        tail = b"".join(partial)
+        if tail.strip():
+            yield self._load(tail, line_no + 1)
+
+    def read(self: Self, fp: BinaryIO) -> Iterator[M]:
+        """
+        Yields models from a binary file, reading `read_size` bytes at a time.
+        """
+        return self.decode(iter(functools.partial(fp.read, self.read_size), b""))
+
+    def _load(self: Self, line: bytes, line_no: int) -> M:
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            msg = f"Line {line_no} is not valid JSON: {e}"
+            raise RealizedParseError(msg, value=line.decode("utf-8", errors="replace")) from e
+        try:
+            return self.model_type._from_json_data(data)
+        except _PARSE_ERRORS as e:
+            msg = f"Line {line_no} is not a valid {self.model_type.__name__}: {e!r}"
+            raise RealizedParseError(msg, value=line.decode("utf-8", errors="replace")) from e
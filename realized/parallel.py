@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parsing and formatting on all cores, passing models between processes as packed buffers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+from realized._core import _PARSE_ERRORS, Model
+from realized.binary import BinaryLayout, BinaryView
+from realized.biochem.registries import WELL_TYPES
+from realized.biochem.well_sets import WellSet
+from realized.biochem.wells import Well
+from realized.dt.instants import InstantWithCity
+from realized.errors import ParseErrorCode, RealizedParseError
+
+__all__ = ["format_many", "parse_many"]
+M = TypeVar("M", bound=Model)
+CHUNK_SIZE = 100_000
+# a model type, or (kind, rows, cols) for the well types, which are created at runtime and cannot be pickled by name
+_TypeRef = type | tuple[str, int, int]
+
+
+def _type_ref(model_type: type[M]) -> _TypeRef:
+    if issubclass(model_type, Well):
+        return "well", model_type._n_rows, model_type._n_cols
+    if issubclass(model_type, WellSet):
+        return "well_set", model_type._n_rows, model_type._n_cols
+    return model_type
+
+
+def _resolve(ref: _TypeRef) -> type[M]:
+    if isinstance(ref, type):
+        return ref
+    kind, rows, cols = ref
+    return WELL_TYPES.well_type(rows, cols) if kind == "well" else WELL_TYPES.well_set_type(rows, cols)
+
+
+def _layout(model_type: type[M], models: Sequence[M]) -> BinaryLayout[M] | None:
+    """
+    Returns the layout for packing `models`, or `None` if they must be pickled instead:
+    the type has no layout, or the models are not all exactly `model_type`.
+    """
+    if any(m.__class__ is not model_type for m in models):
+        return None
+    zone = models[0].zone if issubclass(model_type, InstantWithCity) and models else None
+    try:
+        return BinaryLayout.of(model_type, zone)
+    except TypeError:
+        return None
+
+
+def _parse_chunk(ref: _TypeRef, values: Sequence[str]) -> int | tuple[str | None, bytes] | list[M]:
+    """
+    Returns the index of the first invalid value; otherwise the packed models and their column zone,
+    or the models themselves if they cannot be packed.
+    """
+    model_type = _resolve(ref)
+    try_from_str = model_type._try_from_str
+    models = []
+    for i, v in enumerate(values):
+        m = try_from_str(v) if v.__class__ is str else ParseErrorCode.TYPE
+        if m.__class__ is ParseErrorCode:
+            return i
+        models.append(m)
+    layout = _layout(model_type, models)
+    if layout is None:
+        return models
+    try:
+        data = layout.encode(models)
+    except ValueError:  # an InstantWithCity chunk with more than one zone
+        return models
+    return (None if layout.zone is None else layout.zone.key), data
+
+
+def _format_chunk(ref: _TypeRef, zone: str | None, data: bytes | list[M]) -> list[str]:
+    if isinstance(data, list):
+        return [m.as_str for m in data]
+    return [m.as_str for m in BinaryLayout.of(_resolve(ref), zone).decode(data)]
+
+
+def _map(fn: Any, workers: int | None, n_chunks: int, *args: list) -> list:
+    if n_chunks <= 1 or workers == 1:
+        return list(map(fn, *args))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, *args))
+
+
+def parse_many(
+    model_type: type[M],
+    values: Sequence[str],
+    *,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Sequence[M]:
+    """
+    Parses values with `model_type.from_str` in a pool of `workers` processes, in chunks of `chunk_size`.
+
+    Each worker returns its chunk packed with `BinaryLayout`, so no model is pickled, and the parent only joins
+    the buffers. The result is then a lazy `BinaryView`, in input order, which creates each model when accessed.
+    Types without a binary layout, and `InstantWithCity` values in more than one zone, come back as a list.
+    A single chunk, or `workers=1`, is parsed in this process.
+
+    Args:
+        model_type: Any `Model` subclass
+        values: The `as_str` forms
+        workers: Number of processes; defaults to the number of CPUs
+        chunk_size: Values per task; larger chunks have less overhead, smaller ones balance load better
+
+    Raises:
+        RealizedParseError: For the first invalid value, chained from the error that `from_str` raises for it
+
+    Example:
+        instants = parse_many(InstantUtc, lines, workers=32)
+        micros = instants.as_numpy()["micros"]
+    """
+    if chunk_size < 1:
+        msg = f"chunk_size must be positive, not {chunk_size}"
+        raise ValueError(msg)
+    values = values if isinstance(values, list | tuple) else list(values)
+    starts = range(0, len(values), chunk_size)
+    chunks = [values[i : i + chunk_size] for i in starts]
+    results = _map(_parse_chunk, workers, len(chunks), [_type_ref(model_type)] * len(chunks), chunks)
+    for start, result in zip(starts, results, strict=True):
+        if isinstance(result, int):
+            _raise_for(model_type, start + result, values[start + result])
+    zones = {r[0] for r in results if isinstance(r, tuple)}
+    if len(zones) == 1 and all(isinstance(r, tuple) for r in results):
+        return BinaryLayout.of(model_type, zones.pop()).decode(b"".join(r[1] for r in results))
+    models = []
+    for r in results:
+        models += r if isinstance(r, list) else BinaryLayout.of(model_type, r[0]).decode(r[1])
+    return models
+
+
+def _raise_for(model_type: type[M], row: int, value: object) -> None:
+    msg = f"Row {row} ({value!r}) is not a valid {model_type.__name__}"
+    try:
+        model_type.from_str(value)
+    except _PARSE_ERRORS as e:
+        raise RealizedParseError(msg, value=value) from e
+    raise RealizedParseError(msg, value=value)  # only if _try_from_str and from_str disagree
+
+
+def format_many(
+    models: Sequence[M],
+    *,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> list[str]:
+    """
+    Returns `as_str` for every model, in order, formatting chunks in a pool of `workers` processes.
+
+    A `BinaryView` (such as from `parse_many`) is sent as slices of its buffer.
+    Other sequences are packed by this process first, if all of one type with a binary layout; otherwise pickled.
+    """
+    if chunk_size < 1:
+        msg = f"chunk_size must be positive, not {chunk_size}"
+        raise ValueError(msg)
+    if len(models) == 0:
+        return []
+    starts = range(0, len(models), chunk_size)
+    if isinstance(models, BinaryView):
+        layout = models.layout
+        size = layout.size
+        chunks = [bytes(models.buffer[i * size : (i + chunk_size) * size]) for i in starts]
+    else:
+        models = models if isinstance(models, list | tuple) else list(models)
+        layout = _layout(models[0].__class__, models)
+        chunks = [models[i : i + chunk_size] for i in starts]
+        if layout is not None:
+            try:
+                chunks = [layout.encode(c) for c in chunks]
+            except ValueError:  # InstantWithCity values in more than one zone
+                layout = None
+    ref = _type_ref(models[0].__class__ if layout is None else layout.model_type)
+    zone = None if layout is None or layout.zone is None else layout.zone.key
+    n = len(chunks)
+    formatted = _map(_format_chunk, workers, n, [ref] * n, [zone] * n, chunks)
+    return [s for strs in formatted for s in strs]
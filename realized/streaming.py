@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Asynchronous parsing of line-oriented streams, in batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Generic, Self, TypeVar
+
+from realized._core import _PARSE_ERRORS, Model
+from realized.errors import RealizedParseError
+from realized.parallel import _resolve, _type_ref, _TypeRef
+
+__all__ = ["AsyncLineParser"]
+M = TypeVar("M", bound=Model)
+
+
+def _parse_batch(ref: _TypeRef, lines: list[bytes], first_line: int) -> list[M]:
+    """
+    Parses lines numbered from `first_line`, skipping blank ones.
+    A module-level function, so that it can run in a process pool.
+    """
+    model_type = _resolve(ref)
+    from_bytes = model_type.from_bytes
+    models = []
+    for i, line in enumerate(lines):
+        text = line.strip()
+        if not text:
+            continue
+        try:
+            models.append(from_bytes(text))
+        except _PARSE_ERRORS as e:
+            msg = f"Line {first_line + i} ({text!r}) is not a valid {model_type.__name__}"
+            raise RealizedParseError(msg, value=text.decode("utf-8", errors="replace")) from e
+    return models
+
+
+@dataclass(slots=True)
+class _LineBuffer:
+    """
+    Complete lines not yet yielded, the incomplete last line, and the number of the first buffered line.
+    """
+
+    lines: list[bytes] = field(default_factory=list)
+    tail: bytes = b""
+    first_line: int = 1
+
+    def feed(self: Self, chunk: bytes) -> None:
+        parts = (self.tail + chunk).split(b"\n") if self.tail else chunk.split(b"\n")
+        self.tail = parts.pop()
+        self.lines += parts
+
+    def take(self: Self, n: int) -> tuple[list[bytes], int]:
+        lines, first_line = self.lines[:n], self.first_line
+        self.lines = self.lines[n:]
+        self.first_line += len(lines)
+        return lines, first_line
+
+    def finish(self: Self) -> None:
+        if self.tail:
+            self.lines.append(self.tail)
+            self.tail = b""
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncLineParser(Generic[M]):
+    """
+    Parses a stream in which each line is the `as_str` form of one model, yielding lists of up to `batch_size`.
+
+    The source is an `asyncio.StreamReader` or any async iterable of byte chunks, which may split lines anywhere.
+    Reading is driven by the consumer: nothing more is read until it asks for the next batch,
+    so a slow consumer slows the socket or file rather than filling memory.
+
+    Without an `executor`, each batch is parsed in the event loop, which then runs other tasks before reading on.
+    With one, batches are parsed there (threads keep the loop responsive; processes also use other cores),
+    and up to `max_pending` batches are parsed while the next ones are read.
+    If `max_wait` is set, a partial batch is yielded once its first line has waited that many seconds,
+    for sources such as sockets that can go quiet.
+
+    Example:
+        parser = AsyncLineParser(InstantUtc, batch_size=4096, max_wait=0.5)
+        async for batch in parser.batches(reader):
+            await store(batch)
+    """
+
+    model_type: type[M]
+    batch_size: int = 1024
+    read_size: int = 1 << 16
+    max_wait: float | None = None
+    executor: Executor | None = None
+    max_pending: int = 2
+
+    def __post_init__(self: Self) -> None:
+        if self.batch_size < 1 or self.read_size < 1 or self.max_pending < 1:
+            msg = (
+                f"batch_size ({self.batch_size}), read_size ({self.read_size}),"
+                f" and max_pending ({self.max_pending}) must be positive"
+            )
+            raise ValueError(msg)
+        if self.max_wait is not None and self.max_wait <= 0:
+            msg = f"max_wait must be positive, not {self.max_wait}"
+            raise ValueError(msg)
+
+    async def models(self: Self, source: asyncio.StreamReader | AsyncIterable[bytes]) -> AsyncIterator[M]:
+        """
+        Yields models one by one, still reading and parsing in batches.
+        """
+        async for batch in self.batches(source):
+            for model in batch:
+                yield model
+
+    async def batches(self: Self, source: asyncio.StreamReader | AsyncIterable[bytes]) -> AsyncIterator[list[M]]:
+        """
+        Yields lists of parsed models in stream order. Blank lines are skipped.
+
+        Raises:
+            RealizedParseError: For the first invalid line, with its line number
+        """
+        loop = asyncio.get_running_loop()
+        ref = _type_ref(self.model_type)
+        pending: deque[asyncio.Future[list[M]]] = deque()
+        try:
+            async for lines, first_line, flush in self._line_batches(source):
+                if self.executor is None:
+                    models = _parse_batch(ref, lines, first_line)
+                    if models:
+                        yield models
+                    await asyncio.sleep(0)
+                    continue
+                pending.append(loop.run_in_executor(self.executor, _parse_batch, ref, lines, first_line))
+                while pending and (flush or len(pending) >= self.max_pending):
+                    models = await pending.popleft()
+                    if models:
+                        yield models
+            while pending:
+                models = await pending.popleft()
+                if models:
+                    yield models
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _line_batches(
+        self: Self, source: asyncio.StreamReader | AsyncIterable[bytes]
+    ) -> AsyncIterator[tuple[list[bytes], int, bool]]:
+        """
+        Yields complete lines in batches, each with the number of its first line and whether it is a partial flush.
+        """
+        read = self._reader(source)
+        buffer = _LineBuffer()
+        deadline = 0.0
+        task: asyncio.Future[bytes] | None = None
+        try:
+            while True:
+                if task is None:
+                    # kept across timeouts rather than cancelled, so no chunk is lost
+                    task = asyncio.ensure_future(read())
+                done, _ = await asyncio.wait((task,), timeout=self._timeout(buffer, deadline))
+                if not done:
+                    yield (*buffer.take(len(buffer.lines)), True)
+                    continue
+                chunk, task = task.result(), None
+                if not chunk:
+                    break
+                if not buffer.lines:
+                    deadline = self._deadline()
+                buffer.feed(chunk)
+                while len(buffer.lines) >= self.batch_size:
+                    yield (*buffer.take(self.batch_size), False)
+                    deadline = self._deadline()
+        finally:
+            if task is not None:
+                task.cancel()
+        buffer.finish()
+        if buffer.lines:
+            yield (*buffer.take(len(buffer.lines)), True)
+
+    def _deadline(self: Self) -> float:
+        # when the oldest buffered line must be flushed
+        return 0.0 if self.max_wait is None else asyncio.get_running_loop().time() + self.max_wait
+
+    def _timeout(self: Self, buffer: _LineBuffer, deadline: float) -> float | None:
+        if self.max_wait is None or not buffer.lines:
+            return None
+        return max(0.0, deadline - asyncio.get_running_loop().time())
+
+    def _reader(self: Self, source: asyncio.StreamReader | AsyncIterable[bytes]) -> Callable[[], Awaitable[bytes]]:
+        # returns a function that reads the next chunk, or b"" at the end
+        if isinstance(source, asyncio.StreamReader):
+            return functools.partial(source.read, self.read_size)
+        chunks = aiter(source)
+
+        async def read() -> bytes:
+            async for chunk in chunks:
+                if chunk:
+                    return bytes(chunk)
+            return b""
+
+        return read
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from typing import Self
+
+import pytest
+from pocketutils import KeyReusedError, ValueIllegalError
+
+from realized import Well8x12, Well16x24, WellSet8x12, WellSet32x48
+
+
+class TestWellSet:
+    def test_parse(self: Self) -> None:
+        assert len(WellSet8x12.from_str("A01-A12")) == 12
+        assert len(WellSet8x12.from_str("A01-H01")) == 8
+        assert len(WellSet8x12.from_str("B02*D04")) == 9
+        assert [w.as_str for w in WellSet8x12.from_str("A11...B02")] == ["A11", "A12", "B01", "B02"]
+        assert len(WellSet32x48.from_str("AA01*BF48")) == 1536
+
+    @pytest.mark.parametrize("value", [b"A01-A03,B01*C02", bytearray(b"A11...B02"), memoryview(b" H12 ")])
+    def test_from_bytes(self: Self, value: bytes | bytearray | memoryview) -> None:
+        assert WellSet8x12.from_bytes(value) == WellSet8x12.from_str(bytes(value).decode("ascii"))
+
+    def test_algebra(self: Self) -> None:
+        row = WellSet8x12.from_str("A01-A12")
+        col = WellSet8x12.from_str("A01-H01")
+        assert len(row | col) == 19
+        assert (row & col).wells == [Well8x12.from_str("A01")]
+        assert Well8x12.from_str("A05") in row - col
+        assert Well8x12.from_str("A01") not in row ^ col
+        assert WellSet8x12((row | col).wells) == row | col
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("A01-A03,B01*C02", "A01*C02,A03"),  # from the README
+            ("A05", "A05"),
+            ("A01-A12", "A01-A12"),
+            ("A01-H01", "A01-H01"),
+            ("A11...B02", "A11...B02"),
+            ("A01*H12", "A01*H12"),
+            ("", ""),
+        ],
+    )
+    def test_as_str(self: Self, value: str, expected: str) -> None:
+        assert WellSet8x12.from_str(value).as_str == expected
+
+    def test_empty(self: Self) -> None:
+        empty = WellSet8x12([])
+        assert empty.is_empty
+        assert WellSet8x12.from_str(empty.as_str) == empty
+        assert WellSet8x12.from_bytes(b"") == empty
+
+    def test_full_plate(self: Self) -> None:
+        full = WellSet32x48.from_mask((1 << 1536) - 1)
+        assert full.as_str == "AA01*BF48"
+        assert WellSet32x48.from_str(full.as_str) == full
+
+    def test_round_trip(self: Self) -> None:
+        rng = random.Random(0)
+        for _ in range(200):
+            well_set = WellSet8x12.from_mask(rng.getrandbits(96) & rng.getrandbits(96))
+            assert WellSet8x12.from_str(well_set.as_str) == well_set
+
+    def test_other_plate(self: Self) -> None:
+        with pytest.raises(ValueIllegalError):
+            WellSet8x12([Well16x24.from_str("P24")])
+        with pytest.raises(ValueIllegalError):
+            WellSet8x12.from_mask(1 << 96)
+
+    def test_duplicates(self: Self) -> None:
+        with pytest.raises(KeyReusedError):
+            WellSet8x12.from_str("A01-A03,A02")
+        with pytest.raises(KeyReusedError):
+            WellSet8x12([Well8x12.from_index(1), Well8x12.from_index(1)])
+
+
+if __name__ == "__main__":
+    pytest.main()
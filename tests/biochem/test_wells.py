@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Self
+
+import pytest
+from pocketutils import ValueIllegalError
+
+from realized import Well2x3, Well8x12, Well48x72
+from realized.errors import RealizedParseError
+
+
+class TestWell:
+    def test_labels(self: Self) -> None:
+        assert Well8x12.from_index(1).as_str == "A01"
+        assert Well8x12.from_rc(2, 3).as_str == "B03"
+        assert Well2x3.from_index(6).as_str == "B3"
+        assert Well48x72.from_index(48 * 72).as_str == "BV72"
+        assert Well48x72.from_str("AA01").letter == "AA"
+
+    def test_interned(self: Self) -> None:
+        well = Well8x12.from_str("H12")
+        assert well is Well8x12.from_index(96)
+        assert well is Well8x12.from_rc(8, 12)
+
+    def test_from_bytes(self: Self) -> None:
+        assert Well8x12.from_bytes(b"H12") is Well8x12.from_index(96)
+        assert Well48x72.from_bytes(memoryview(b"AA01")) is Well48x72.from_str("AA01")
+        with pytest.raises(RealizedParseError):
+            Well8x12.from_bytes(bytearray(b"A13"))
+
+    @pytest.mark.parametrize("label", ["A1", "I01", "A13", "a01", ""])
+    def test_invalid_label(self: Self, label: str) -> None:
+        with pytest.raises(RealizedParseError):
+            Well8x12.from_str(label)
+
+    def test_out_of_bounds(self: Self) -> None:
+        with pytest.raises(ValueIllegalError):
+            Well8x12.from_index(97)
+        with pytest.raises(ValueIllegalError):
+            Well8x12.from_rc(0, 1)
+
+
+if __name__ == "__main__":
+    pytest.main()
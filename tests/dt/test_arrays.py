@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import timedelta
+from typing import Self
+
+import numpy as np
+import pytest
+
+from realized.dt import Resolution
+from realized.dt.arrays import DurationArray, InstantArray
+from realized.dt.durations import ColonSeparatedDuration, IsoDuration
+from realized.dt.instants import InstantUtc, InstantWithCity, InstantWithOffset
+from realized.errors import RealizedParseError, ZoneMismatchError
+
+
+class TestInstantArray:
+    def test_utc(self: Self) -> None:
+        values = ["2022-09-01T00:22:56Z", "1969-12-31T23:59:59.500Z", "2024-02-29T12:00:00Z"]
+        array = InstantArray.from_strs(values, InstantUtc)
+        assert array.resolution is Resolution.MILLISECOND
+        assert array.micros.tolist() == [1661991776000000, -500000, 1709208000000000]
+        assert array.sorted().as_strs().tolist() == [
+            "1969-12-31T23:59:59.500Z",
+            "2022-09-01T00:22:56.000Z",
+            "2024-02-29T12:00:00.000Z",
+        ]
+
+    def test_round_trip(self: Self) -> None:
+        values = ["2022-09-01T00:22:56+02:00", "2022-09-01T00:22:56−05:30"]
+        array = InstantArray.from_strs(values, InstantWithOffset)
+        assert array.offsets.tolist() == [120, -330]
+        again = InstantArray.from_instants(array.to_instants())
+        assert (again == array).all()
+        assert again.as_strs().tolist() == ["2022-09-01T00:22:56+02:00", "2022-09-01T00:22:56-05:30"]
+
+    def test_city(self: Self) -> None:
+        values = ["2022-09-01T00:22:56-07:00 [America/Los_Angeles]", "2022-01-01T00:00:00-08:00 [America/Los_Angeles]"]
+        array = InstantArray.from_strs(values, InstantWithCity)
+        assert array.zone.key == "America/Los_Angeles"
+        assert array.as_strs().tolist() == values
+        assert (array < array[0]).tolist() == [False, True]
+        assert isinstance(array[1], InstantWithCity)
+        assert len(array[1:]) == 1
+
+    @pytest.mark.parametrize("instant_type", [InstantUtc, InstantWithOffset, InstantWithCity])
+    def test_empty(self: Self, instant_type: type) -> None:
+        array = InstantArray.from_strs([], instant_type)
+        assert len(array) == 0
+        assert array.instant_type is instant_type
+        assert array.as_strs().tolist() == []
+
+    def test_slices_are_views(self: Self) -> None:
+        array = InstantArray.from_strs(["2022-09-01T00:22:56Z"] * 4, InstantUtc)
+        assert np.shares_memory(array[1:3].micros, array.micros)
+
+    @pytest.mark.parametrize(
+        "value",
+        ["2022-02-30T00:00:00Z", "2022-09-01T00:22:56", "2022-09-01T24:00:00Z", "2022-09-01T00:22:56.12Z"],
+    )
+    def test_invalid(self: Self, value: str) -> None:
+        with pytest.raises(RealizedParseError):
+            InstantArray.from_strs(["2022-09-01T00:22:56Z", value], InstantUtc)
+
+    def test_wrong_offset(self: Self) -> None:
+        with pytest.raises(ZoneMismatchError):
+            InstantArray.from_strs(["2022-09-01T00:22:56-08:00 [America/Los_Angeles]"], InstantWithCity)
+
+
+class TestDurationArray:
+    def test_from_strs(self: Self) -> None:
+        array = DurationArray.from_strs(["PT1H2M3.5S", "00:00:01.000250", "P1DT1S", "-PT30M", "PT1H2M3.5S"])
+        assert array.micros.tolist() == [3723500000, 1000250, 86401000000, -1800000000, 3723500000]
+
+    def test_formats_like_scalars(self: Self) -> None:
+        micros = [0, 1, 1000, 999999, 60000000, 3723500000, 90061000001, -1800000000, -1]
+        array = DurationArray(np.array(micros, dtype=np.int64))
+        durations = array.to_durations()
+        assert array.as_iso8601().tolist() == [d.as_iso8601 for d in durations]
+        assert array.as_colon_separated().tolist() == [d.as_colon_separated for d in durations]
+        assert (DurationArray.from_strs(array.as_strs()) == array).all()
+
+    def test_round_trip(self: Self) -> None:
+        durations = [ColonSeparatedDuration.from_str("01:02:03"), ColonSeparatedDuration.from_str("00:00:00.500")]
+        array = DurationArray.from_durations(durations)
+        assert array.duration_type is ColonSeparatedDuration
+        assert array.to_durations() == durations
+        assert array.as_strs().tolist() == ["01:02:03", "00:00:00.500"]
+
+    def test_arithmetic(self: Self) -> None:
+        array = DurationArray(np.array([1, 2, 3, 5], dtype=np.int64))
+        assert (array + array).micros.tolist() == [2, 4, 6, 10]
+        assert (array - timedelta(microseconds=1)).micros.tolist() == [0, 1, 2, 4]
+        assert (timedelta(microseconds=10) - array).micros.tolist() == [9, 8, 7, 5]
+        assert (array * 3).micros.tolist() == [3, 6, 9, 15]
+        # half to even, as timedelta rounds
+        assert (array * 0.5).micros.tolist() == [0, 1, 2, 2]
+        assert (array / 2).micros.tolist() == [0, 1, 2, 2]
+        assert (array // 2).micros.tolist() == [0, 1, 1, 2]
+        assert (array / IsoDuration(timedelta(microseconds=2))).tolist() == [0.5, 1.0, 1.5, 2.5]
+        assert (-array).micros.tolist() == [-1, -2, -3, -5]
+        assert (array > timedelta(microseconds=2)).tolist() == [False, False, True, True]
+
+    def test_statistics(self: Self) -> None:
+        array = DurationArray.from_strs(["PT1S", "PT2S", "PT4S", "PT5S"])
+        assert array.sum() == IsoDuration(timedelta(seconds=12))
+        assert array.mean() == IsoDuration(timedelta(seconds=3))
+        assert array.min() == IsoDuration(timedelta(seconds=1))
+        assert array.max() == IsoDuration(timedelta(seconds=5))
+        assert array.median() == IsoDuration(timedelta(seconds=3))
+        assert array.quantile([0, 1]).micros.tolist() == [1000000, 5000000]
+
+    @pytest.mark.parametrize("value", ["P", "PT", "P1DT", "1:2:3", "01:61:00", "PT1.1234567S", "01:00:00.12"])
+    def test_invalid(self: Self, value: str) -> None:
+        with pytest.raises(RealizedParseError):
+            DurationArray.from_strs(["PT1S", value])
+
+    @pytest.mark.parametrize("value", ["PT9999999999999999H", "-PT9999999999999999H", "9999999999999999:00:00"])
+    def test_out_of_range(self: Self, value: str) -> None:
+        with pytest.raises(RealizedParseError, match="Row 1"):
+            DurationArray.from_strs(["PT1S", value], IsoDuration)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+import pytest
+
+from realized.dt import Resolution
+from realized.dt.arrays import DurationArray, InstantArray
+from realized.dt.columns import ColumnFile, write_column
+from realized.dt.durations import IsoDuration
+from realized.dt.instants import InstantUtc, InstantWithCity, InstantWithOffset
+from realized.errors import RealizedParseError
+
+UTC_VALUES = [f"2022-09-{d:02}T{h:02}:22:56.500Z" for d in range(1, 29) for h in range(0, 24, 5)]
+
+
+class TestColumnFile:
+    def test_round_trip(self: Self, tmp_path: Path) -> None:
+        path = tmp_path / "utc.col"
+        instants = [InstantUtc.from_str(v) for v in UTC_VALUES]
+        assert write_column(path, instants, chunk_size=16) == len(instants)
+        with ColumnFile.open(path) as column:
+            assert len(column) == len(instants)
+            assert column.is_sorted
+            assert column.resolution is Resolution.MILLISECOND
+            assert not column.micros.flags.writeable
+            assert [column[i] for i in range(len(column))] == instants
+
+    def test_between(self: Self, tmp_path: Path) -> None:
+        path = tmp_path / "utc.col"
+        write_column(path, InstantArray.from_strs(UTC_VALUES, InstantUtc))
+        column = ColumnFile.open(path)
+        start, end = InstantUtc.from_str("2022-09-03T00:00:00Z"), InstantUtc.from_str("2022-09-04T10:22:56.500Z")
+        window = column.between(start, end)
+        assert [i.as_str for i in window.to_instants()] == [v for v in UTC_VALUES if "09-03" in v or "09-04T0" in v]
+        assert np.shares_memory(window.micros, column.micros)
+        empty = column.search(end, start)
+        assert empty.start == empty.stop
+
+    def test_offsets(self: Self, tmp_path: Path) -> None:
+        values = ["2022-09-01T00:22:56-05:30", "2022-09-01T07:52:57+02:00", "2022-09-01T05:52:58Z"]
+        instants = [InstantWithOffset.from_str(v.replace("Z", "+00:00")) for v in values]
+        path = tmp_path / "offset.col"
+        write_column(path, instants)
+        column = ColumnFile.open(path)
+        assert column.to_array().to_instants() == instants
+        assert [i.offset_str for i in column.to_array().to_instants()] == ["-05:30", "+02:00", "+00:00"]
+
+    def test_city(self: Self, tmp_path: Path) -> None:
+        instants = [
+            InstantWithCity.from_str("2022-11-06T01:30:00-07:00 [America/Los_Angeles]"),
+            InstantWithCity.from_str("2022-11-06T01:30:00-08:00 [America/Los_Angeles]"),
+        ]
+        path = tmp_path / "city.col"
+        write_column(path, instants)
+        assert ColumnFile.open(path).to_array().to_instants() == instants
+
+    def test_durations(self: Self, tmp_path: Path) -> None:
+        durations = [IsoDuration.from_str(v) for v in ["PT5S", "-PT1H", "PT0.000001S"]]
+        path = tmp_path / "durations.col"
+        write_column(path, DurationArray.from_durations(durations))
+        column = ColumnFile.open(path)
+        assert not column.is_sorted
+        assert column.to_array().to_durations() == durations
+        with pytest.raises(ValueError):
+            column.search(0, 1)
+
+    def test_empty(self: Self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.col"
+        assert write_column(path, InstantArray.from_strs([], InstantUtc)) == 0
+        with ColumnFile.open(path) as column:
+            assert len(column) == 0
+            assert column.model_type is InstantUtc
+            assert len(column.to_array()) == 0
+
+    def test_invalid(self: Self, tmp_path: Path) -> None:
+        path = tmp_path / "bad.col"
+        path.write_bytes(b"not a column" * 400)
+        with pytest.raises(RealizedParseError):
+            ColumnFile.open(path)
+        with pytest.raises(TypeError):
+            write_column(path, [InstantUtc.from_str(UTC_VALUES[0]), IsoDuration.from_str("PT1S")])
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"RLZCOL01",
+            b"RLZCOL01" + (5).to_bytes(4, "little") + b"{oops",
+            b"RLZCOL01" + (2).to_bytes(4, "little") + b"[]",
+            b"RLZCOL01" + (15).to_bytes(4, "little") + b'{"type":"Nope"}',
+        ],
+    )
+    def test_invalid_header(self: Self, tmp_path: Path, data: bytes) -> None:
+        path = tmp_path / "bad.col"
+        path.write_bytes(data.ljust(4096, b"\0") if len(data) > 8 else data)
+        with pytest.raises(RealizedParseError):
+            ColumnFile.open(path)
+
+    def test_failed_write(self: Self, tmp_path: Path) -> None:
+        path = tmp_path / "utc.col"
+        write_column(path, [InstantUtc.from_str(v) for v in UTC_VALUES])
+        before = path.read_bytes()
+        mixed = [InstantUtc.from_str(v) for v in UTC_VALUES] + [IsoDuration.from_str("PT1S")]
+        with pytest.raises(TypeError):
+            write_column(path, mixed, chunk_size=16)
+        assert path.read_bytes() == before
+        assert [p.name for p in tmp_path.iterdir()] == ["utc.col"]
+        with pytest.raises(TypeError):
+            write_column(tmp_path / "new.col", mixed, chunk_size=16)
+        assert not (tmp_path / "new.col").exists()
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Callable
+from typing import Self
+
+import pytest
+
+from realized.dt.durations import ColonSeparatedDuration, Duration, IsoDuration
+from realized.errors import ParseErrorCode, RealizedParseError
+
+
+class TestDuration:
+    @pytest.mark.parametrize(
+        ("parse", "value"),
+        [
+            (IsoDuration.from_str, "PT99999999999999H"),
+            (IsoDuration.from_str, "-P1000000000D"),
+            (Duration.from_any, "PT99999999999999H"),
+            (ColonSeparatedDuration.from_str, "99999999999999:00:00"),
+            (Duration.from_any, "99999999999999:00:00"),
+        ],
+    )
+    def test_out_of_range(self: Self, parse: Callable[[str], Duration], value: str) -> None:
+        with pytest.raises(RealizedParseError):
+            parse(value)
+
+    def test_try_out_of_range(self: Self) -> None:
+        assert IsoDuration._try_from_str("PT99999999999999H") is ParseErrorCode.RANGE
+
+
+if __name__ == "__main__":
+    pytest.main()
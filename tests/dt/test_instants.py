@@ -6,7 +6,10 @@ from typing import Self
 
 import pytest
 
-from realized.dt.instants import Instant
+from realized.dt.durations import Duration
+from realized.dt.instants import Instant, InstantUtc, InstantWithCity, InstantWithOffset
+from realized.dt.intervals import Interval
+from realized.errors import RealizedParseError, ZoneMismatchError
 
 
 class InstantsTest:
@@ -14,5 +17,110 @@ class InstantsTest:
         pass
 
 
+class TestRfc3339:
+    @pytest.mark.parametrize(
+        "value",
+        ["2022-09-01T00:22:56Z", b"2022-09-01T00:22:56.123Z", memoryview(b"2022-09-01T00:22:56.123456Z")],
+    )
+    def test_utc(self: Self, value: str | bytes | memoryview) -> None:
+        instant = InstantUtc.from_str(value)
+        assert instant.dt.tzinfo.key == "Etc/UTC"
+        assert instant.dt.isoformat().startswith("2022-09-01T00:22:56")
+
+    def test_offset(self: Self) -> None:
+        assert InstantWithOffset.from_str("2022-09-01T00:22:56−05:30").offset.total_seconds() == -19800
+        assert InstantWithOffset.from_str(b"2022-09-01T00:22:56+14:00").offset.total_seconds() == 50400
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2022-09-01T00:22:56+00:00",
+            "2022-09-01 00:22:56Z",
+            "2023-02-29T00:00:00Z",
+            "2022-09-01T00:22:56.1234Z",
+            "2022-09-01T00:22:60Z",
+        ],
+    )
+    def test_invalid_utc(self: Self, value: str) -> None:
+        with pytest.raises(RealizedParseError):
+            InstantUtc.from_str(value)
+
+    @pytest.mark.parametrize(
+        "value",
+        ["2022-09-01T00:22:56Z", "2022-09-01T00:22:56-00:00", "2022-09-01T00:22:56+14:01", "2022-09-01T00:22:56+5:00"],
+    )
+    def test_invalid_offset(self: Self, value: str) -> None:
+        with pytest.raises(RealizedParseError):
+            InstantWithOffset.from_str(value)
+
+
+class TestEpochFields:
+    def test_fields(self: Self) -> None:
+        instant = InstantWithOffset.from_str("1969-12-31T19:00:00.000001-05:00")
+        assert instant._utc_micros == 1
+        assert instant._offset_minutes == -300
+        assert InstantWithOffset(instant.dt) == instant
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2022-09-01T00:22:56-05:30", "-05:30"),
+            ("2022-09-01T00:22:56+14:00", "+14:00"),
+            ("2022-09-01T00:22:56+00:45", "+00:45"),
+        ],
+    )
+    def test_offset_str(self: Self, value: str, expected: str) -> None:
+        assert InstantWithOffset.from_str(value).offset_str == expected
+
+    def test_same_instant_across_offsets(self: Self) -> None:
+        a = InstantWithOffset.from_str("2022-09-01T07:52:56+02:00")
+        b = InstantWithOffset.from_str("2022-09-01T00:22:56-05:30")
+        assert a == b
+        assert hash(a) == hash(b)
+        assert a < InstantWithOffset.from_str("2022-09-01T05:52:56.000001+00:00")
+
+    def test_fold(self: Self) -> None:
+        # datetime ignores fold when comparing in one zone; these are an hour apart
+        first = InstantWithCity.from_str("2022-11-06T01:30:00-07:00 [America/Los_Angeles]")
+        second = InstantWithCity.from_str("2022-11-06T01:30:00-08:00 [America/Los_Angeles]")
+        assert first != second
+        assert first < second
+        assert (second - first).delta.total_seconds() == 3600
+
+    def test_subtract(self: Self) -> None:
+        a = InstantUtc.from_str("2022-09-01T00:00:00Z")
+        b = InstantUtc.from_str("2022-09-01T00:00:01.500Z")
+        assert b - a == Duration.from_any("PT1.500S")
+        assert (a - b).delta.total_seconds() == -1.5
+        interval = Interval(a, b)
+        assert interval.duration == b - a
+        assert interval.delta.total_seconds() == 1.5
+
+
+class TestConvertToZone:
+    def test_city(self: Self) -> None:
+        a = InstantWithCity.from_str("2022-09-01T00:00:00-07:00 [America/Los_Angeles]")
+        b = InstantWithCity.from_str("2022-09-01T01:00:00-07:00 [America/Los_Angeles]")
+        converted = Interval(a, b).convert_to_zone("Europe/Paris")
+        assert converted.as_str == (
+            "2022-09-01T09:00:00+02:00 [Europe/Paris]--2022-09-01T10:00:00+02:00 [Europe/Paris]"
+        )
+
+    def test_offset(self: Self) -> None:
+        a = InstantWithOffset.from_str("2022-09-01T00:00:00+00:00")
+        b = InstantWithOffset.from_str("2022-09-01T01:00:00+00:00")
+        converted = Interval(a, b).convert_to_zone("America/New_York")
+        assert isinstance(converted.start, InstantWithOffset)
+        assert converted.as_str == "2022-08-31T20:00:00-04:00--2022-08-31T21:00:00-04:00"
+        assert converted == Interval(a, b)
+
+    def test_utc(self: Self) -> None:
+        a = InstantUtc.from_str("2022-09-01T00:00:00Z")
+        interval = Interval(a, a)
+        assert interval.convert_to_zone("Etc/UTC") == interval
+        with pytest.raises(ZoneMismatchError):
+            interval.convert_to_zone("Europe/Paris")
+
+
 if __name__ == "__main__":
     pytest.main()
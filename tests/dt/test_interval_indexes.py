@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Self
+
+import numpy as np
+import pytest
+from pocketutils import KeyReusedError
+
+from realized.dt.instants import InstantUtc
+from realized.dt.interval_indexes import IntervalIndex
+from realized.dt.intervals import Interval
+
+
+class TestIntervalIndex:
+    def test_matches_scan(self: Self) -> None:
+        rng = np.random.default_rng(0)
+        starts = rng.integers(0, 10_000, 1000)
+        ends = starts + rng.integers(0, 500, 1000)
+        index = IntervalIndex.from_arrays(starts, ends)
+        live = dict(enumerate(zip(starts.tolist(), ends.tolist(), strict=True)))
+        for _ in range(500):
+            if rng.random() < 0.5:
+                start = int(rng.integers(0, 10_000))
+                end = start + int(rng.integers(0, 300))
+                live[index.insert((start, end))] = start, end
+            else:
+                i = int(rng.choice(list(live)))
+                index.delete(i)
+                del live[i]
+            lo = int(rng.integers(0, 10_000))
+            hi = lo + int(rng.integers(1, 400))
+            assert index.overlapping((lo, hi)).tolist() == sorted(i for i, (s, e) in live.items() if s < hi and e > lo)
+            assert index.at(lo).tolist() == sorted(i for i, (s, e) in live.items() if s <= lo < e)
+            assert index.containing((lo, hi)).tolist() == sorted(i for i, (s, e) in live.items() if s <= lo and hi <= e)
+        assert len(index) == len(live)
+
+    def test_intervals(self: Self) -> None:
+        runs = [
+            Interval.from_str("2022-09-01T00:00:00Z--2022-09-01T06:00:00Z"),
+            Interval.from_str("2022-09-01T04:00:00+02:00--2022-09-01T09:00:00+02:00"),
+        ]
+        index = IntervalIndex.from_intervals(runs, ids=np.array([10, 20]))
+        assert index.at(InstantUtc.from_str("2022-09-01T03:00:00Z")).tolist() == [10, 20]
+        assert index.at(InstantUtc.from_str("2022-09-01T06:00:00Z")).tolist() == [20]
+        assert index.containing(runs[1]).tolist() == [20]
+        assert index.insert(runs[0]) == 21
+
+    def test_duplicate_ids(self: Self) -> None:
+        with pytest.raises(KeyReusedError):
+            IntervalIndex.from_arrays(np.array([0, 1]), np.array([2, 3]), ids=np.array([5, 5]))
+        index = IntervalIndex.from_arrays(np.array([0]), np.array([2]))
+        with pytest.raises(KeyReusedError):
+            index.insert((1, 2), 0)
+        with pytest.raises(KeyError):
+            index.delete(1)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import timedelta, timezone
+from typing import Self
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from realized.dt.instants import InstantUtc, InstantWithCity, InstantWithOffset
+from realized.dt.interval_sets import IntervalSet
+from realized.dt.intervals import Interval
+from realized.errors import DatetimeMissingZoneError, ZoneMismatchError
+
+
+def _random_set(rng: np.random.Generator) -> tuple[IntervalSet, set[int]]:
+    starts = rng.integers(0, 200, 15)
+    ends = starts + rng.integers(0, 20, 15)
+    covered = {t for s, e in zip(starts.tolist(), ends.tolist(), strict=True) for t in range(s, e)}
+    return IntervalSet.from_arrays(starts, ends), covered
+
+
+def _covered(intervals: IntervalSet) -> set[int]:
+    return {t for s, e in zip(intervals.starts.tolist(), intervals.ends.tolist(), strict=True) for t in range(s, e)}
+
+
+class TestIntervalSet:
+    def test_matches_sets(self: Self) -> None:
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            (a, x), (b, y) = _random_set(rng), _random_set(rng)
+            assert _covered(a) == x
+            assert (a.ends[:-1] < a.starts[1:]).all()
+            assert _covered(a | b) == x | y
+            assert _covered(a & b) == x & y
+            assert _covered(a - b) == x - y
+            assert _covered(a ^ b) == x ^ y
+            assert _covered(a.complement((50, 150))) == set(range(50, 150)) - x
+            assert a.total_micros == len(x)
+
+    def test_uptime(self: Self) -> None:
+        uptime = IntervalSet.from_intervals([Interval.from_str("2022-09-01T00:00:00Z--2022-09-02T00:00:00Z")])
+        maintenance = IntervalSet.from_intervals(
+            [
+                Interval.from_str("2022-09-01T02:00:00Z--2022-09-01T03:00:00Z"),
+                Interval.from_str("2022-09-01T02:30:00Z--2022-09-01T04:00:00Z"),
+                Interval.from_str("2022-09-01T23:00:00Z--2022-09-02T01:00:00Z"),
+            ]
+        )
+        available = uptime - maintenance
+        assert available.total.delta == timedelta(hours=21)
+        assert available.gaps.total.delta == timedelta(hours=2)
+        assert [i.as_str for i in available.to_intervals()] == [
+            "2022-09-01T00:00:00Z--2022-09-01T02:00:00Z",
+            "2022-09-01T04:00:00Z--2022-09-01T23:00:00Z",
+        ]
+        assert InstantUtc.from_str("2022-09-01T03:00:00Z") not in available
+        assert InstantUtc.from_str("2022-09-01T04:00:00Z") in available
+
+    def test_to_intervals_in_zone(self: Self) -> None:
+        intervals = IntervalSet.from_intervals([Interval.from_str("2022-09-01T00:00:00Z--2022-09-01T02:00:00Z")])
+        paris = ZoneInfo("Europe/Paris")
+        assert [i.as_str for i in intervals.to_intervals(InstantWithCity, paris)] == [
+            "2022-09-01T02:00:00+02:00 [Europe/Paris]--2022-09-01T04:00:00+02:00 [Europe/Paris]"
+        ]
+        minus_five = timezone(timedelta(hours=-5))
+        assert [i.as_str for i in intervals.to_intervals(InstantWithOffset, minus_five)] == [
+            "2022-08-31T19:00:00-05:00--2022-08-31T21:00:00-05:00"
+        ]
+        with pytest.raises(ZoneMismatchError):
+            intervals.to_intervals(InstantUtc, paris)
+        with pytest.raises(DatetimeMissingZoneError):
+            intervals.to_intervals(InstantWithCity, minus_five)
+
+
+if __name__ == "__main__":
+    pytest.main()
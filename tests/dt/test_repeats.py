@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import timedelta
+from typing import Self
+
+import numpy as np
+import pytest
+
+from realized.dt.durations import IsoDuration
+from realized.dt.instants import InstantUtc
+from realized.dt.repeats import RepeatDuration, RepeatEvent, RepeatInterval
+
+
+def _minutes(n: int) -> IsoDuration:
+    return IsoDuration(timedelta(minutes=n))
+
+
+class TestRepeatEvent:
+    def test_lookup(self: Self) -> None:
+        event = RepeatEvent(_minutes(15), 10_000_000)
+        assert event.nth(4_000_000) == _minutes(60_000_000)
+        assert event.next_after(_minutes(30)) == _minutes(45)
+        assert event.previous_before(_minutes(30)) == _minutes(15)
+        assert event.previous_before(_minutes(0)) is None
+        assert event.count_in(_minutes(0), _minutes(60)) == 4
+        assert event.next_after(_minutes(150_000_000)) is None
+        with pytest.raises(IndexError):
+            event.nth(10_000_001)
+
+    def test_window(self: Self) -> None:
+        event = RepeatEvent(_minutes(15), None)
+        window = event.window(_minutes(1_000_000), _minutes(1_000_031))
+        assert list(window) == [_minutes(1_000_005), _minutes(1_000_020)]
+        assert window.as_numpy().tolist() == [timedelta(minutes=1_000_005), timedelta(minutes=1_000_020)]
+        assert list(event.window(_minutes(0), _minutes(31))) == list(RepeatEvent(_minutes(15), 2))
+
+
+class TestRepeatDuration:
+    def test_lookup(self: Self) -> None:
+        repeat = RepeatDuration(_minutes(5), _minutes(20), 3)
+        assert repeat.nth(2) == (_minutes(45), _minutes(60))
+        assert repeat.next_after(_minutes(5)) == (_minutes(25), _minutes(40))
+        assert repeat.count_in(_minutes(0), _minutes(1000)) == 4
+
+
+class TestRepeatInterval:
+    def test_lookup(self: Self) -> None:
+        repeat = RepeatInterval.from_str("R/2022-09-01T00:00:00Z--2022-09-01T06:00:00Z")
+        assert repeat.nth(4) == (
+            InstantUtc.from_str("2022-09-02T00:00:00Z"),
+            InstantUtc.from_str("2022-09-02T06:00:00Z"),
+        )
+        t = InstantUtc.from_str("2023-01-01T01:00:00Z")
+        assert repeat.previous_before(t)[0] == InstantUtc.from_str("2023-01-01T00:00:00Z")
+        assert repeat.next_after(t)[0] == InstantUtc.from_str("2023-01-01T06:00:00Z")
+        window = repeat.window(t, InstantUtc.from_str("2023-01-02T01:00:00Z"))
+        assert len(window) == 4
+        assert window.as_numpy()[0] == np.datetime64("2023-01-01T06:00:00")
+        assert window[1] == (InstantUtc.from_str("2023-01-01T12:00:00Z"), InstantUtc.from_str("2023-01-01T18:00:00Z"))
+        assert list(window[1:3]) == [window[1], window[2]]
+        assert list(window[::-2]) == [window[3], window[1]]
+        assert window[::-2].as_numpy().tolist() == window.as_numpy()[::-2].tolist()
+
+
+if __name__ == "__main__":
+    pytest.main()
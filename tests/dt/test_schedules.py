@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import timedelta
+from typing import Self
+
+import pytest
+
+from realized.dt.instants import InstantUtc, InstantWithCity
+from realized.dt.schedules import Clock, FoldPolicy, GapPolicy, Schedule
+from realized.errors import LocalTimeError
+
+DAY = timedelta(days=1)
+SPRING = InstantWithCity.from_str("2022-03-12T02:30:00-08:00 [America/Los_Angeles]")
+FALL = InstantWithCity.from_str("2022-11-05T01:30:00-07:00 [America/Los_Angeles]")
+
+
+def _times(schedule: Schedule) -> list[str]:
+    return [s.split("T")[1] for s in schedule.expand().as_strs().tolist()]
+
+
+class TestSchedule:
+    @pytest.mark.parametrize(
+        ("policy", "expected"),
+        [
+            (GapPolicy.LATER, ["02:30:00-08:00 [America/Los_Angeles]", "03:30:00-07:00 [America/Los_Angeles]"]),
+            (GapPolicy.EARLIER, ["02:30:00-08:00 [America/Los_Angeles]", "01:30:00-08:00 [America/Los_Angeles]"]),
+            (GapPolicy.SKIP, ["02:30:00-08:00 [America/Los_Angeles]"]),
+        ],
+    )
+    def test_gap(self: Self, policy: GapPolicy, expected: list[str]) -> None:
+        assert _times(Schedule(SPRING, DAY, 1, gaps=policy)) == expected
+
+    def test_fold(self: Self) -> None:
+        assert _times(Schedule(FALL, DAY, 1))[1] == "01:30:00-07:00 [America/Los_Angeles]"
+        assert _times(Schedule(FALL, DAY, 1, folds=FoldPolicy.LATER))[1] == "01:30:00-08:00 [America/Los_Angeles]"
+        with pytest.raises(LocalTimeError):
+            Schedule(FALL, DAY, 1, folds=FoldPolicy.RAISE).expand()
+
+    def test_clocks(self: Self) -> None:
+        assert _times(Schedule(SPRING, DAY, 3))[3] == "02:30:00-07:00 [America/Los_Angeles]"
+        assert _times(Schedule(SPRING, DAY, 3, clock=Clock.ELAPSED))[3] == "03:30:00-07:00 [America/Los_Angeles]"
+
+    def test_window(self: Self) -> None:
+        schedule = Schedule(SPRING, DAY)
+        start, end = InstantUtc.from_str("2032-03-20T00:00:00Z"), InstantUtc.from_str("2032-03-22T00:00:00Z")
+        assert schedule.expand(start, end).as_strs().tolist() == [
+            "2032-03-20T02:30:00-07:00 [America/Los_Angeles]",
+            "2032-03-21T02:30:00-07:00 [America/Los_Angeles]",
+        ]
+        with pytest.raises(ValueError):
+            schedule.expand(start)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Self
+
+import pytest
+
+from realized.dt import Resolution
+from realized.dt.durations import ColonSeparatedDuration, Duration, IsoDuration
+from realized.dt.instants import InstantUtc, InstantWithCity, InstantWithOffset
+from realized.dt.sniffing import DurationFormat, parse_durations, parse_instants, sniff_durations, sniff_instants
+from realized.errors import RealizedParseError
+
+
+class TestSniffing:
+    def test_sniff_durations(self: Self) -> None:
+        assert sniff_durations(["01:02:03.500", "00:00:01.250"]) == (
+            DurationFormat.COLON_SEPARATED,
+            Resolution.MILLISECOND,
+        )
+        assert sniff_durations(["PT1S", "P1DT2H", "01:00:00.000001"]) == (DurationFormat.ISO8601, Resolution.SECOND)
+
+    def test_sniff_instants(self: Self) -> None:
+        assert sniff_instants(["2022-09-01T00:22:56.500-07:00"]) == (InstantWithOffset, Resolution.MILLISECOND)
+        assert sniff_instants(["2022-09-01T00:22:56Z"]) == (InstantUtc, Resolution.SECOND)
+        city = "2022-09-01T00:22:56.000001-07:00 [America/Los_Angeles]"
+        assert sniff_instants([city]) == (InstantWithCity, Resolution.MICROSECOND)
+
+    def test_colon_column(self: Self) -> None:
+        values = ["01:02:03.500", "-00:00:01.250", "123:59:60.000", "00:00:00.000"]
+        array = parse_durations(values)
+        assert array.duration_type is ColonSeparatedDuration
+        assert array.to_durations() == [ColonSeparatedDuration.from_str(v) for v in values]
+
+    def test_falls_back_on_mismatch(self: Self) -> None:
+        values = ["01:02:03.500"] * 70 + ["01:02:03", "PT1H", "00:00:00.000007"]
+        array = parse_durations(values)
+        assert array.micros.tolist()[-3:] == [3723000000, 3600000000, 7]
+        assert parse_durations(["PT1S"] * 70 + ["00:00:02"]).micros.tolist()[-2:] == [1000000, 2000000]
+
+    def test_iso_column(self: Self) -> None:
+        values = ["PT1H2M3.5S", "P1D", "-PT0.000001S", "PT1H2M3.5S"]
+        array = parse_durations(values)
+        assert array.duration_type is IsoDuration
+        assert array.micros.tolist() == [Duration.from_any(v).as_microseconds for v in values]
+
+    @pytest.mark.parametrize("value", ["1:2:3", "01:61:00", "PT", "01:00:00.1", ":00:00", "1 hour"])
+    def test_invalid(self: Self, value: str) -> None:
+        with pytest.raises(RealizedParseError):
+            parse_durations(["01:00:00", value])
+
+    @pytest.mark.parametrize(
+        "values",
+        [["PT9999999999999999H"], ["9999999999999999:00:00"], ["01:00:00", "9999999999999999:00:00"]],
+    )
+    def test_out_of_range(self: Self, values: list[str]) -> None:
+        with pytest.raises(RealizedParseError, match=f"Row {len(values) - 1}"):
+            parse_durations(values)
+
+    def test_empty(self: Self) -> None:
+        assert len(parse_durations([])) == 0
+        assert len(parse_instants([])) == 0
+        assert parse_instants([], InstantWithOffset).instant_type is InstantWithOffset
+
+    def test_instants(self: Self) -> None:
+        array = parse_instants(["2022-09-01T00:22:56+02:00", "2022-09-01T00:22:56Z", "2022-09-01T00:22:56.500-05:30"])
+        assert array.instant_type is InstantWithOffset
+        assert array.offsets.tolist() == [120, 0, -330]
+        assert array.resolution is Resolution.MILLISECOND
+        utc = parse_instants(["2022-09-01T00:22:56Z", "2022-09-01T00:22:56+00:00"])
+        assert utc.instant_type is InstantUtc
+        assert utc.as_strs().tolist() == ["2022-09-01T00:22:56Z"] * 2
+        with pytest.raises(RealizedParseError):
+            parse_instants(["2022-09-01T00:22:56Z", "2022-09-01T00:22:56+01:00"], InstantUtc)
+
+
+if __name__ == "__main__":
+    pytest.main()
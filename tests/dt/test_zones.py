@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import datetime, timedelta
+from typing import Self
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from realized.dt.arrays import InstantArray
+from realized.dt.instants import InstantUtc, InstantWithCity
+from realized.dt.zones import EPOCH, ZoneTable
+
+MICROS = timedelta(microseconds=1)
+
+
+class TestZoneTable:
+    @pytest.mark.parametrize("key", ["America/Los_Angeles", "Europe/Dublin", "Australia/Lord_Howe", "Asia/Kolkata"])
+    def test_matches_zoneinfo(self: Self, key: str) -> None:
+        table = ZoneTable.of(key)
+        zone = ZoneInfo(key)
+        micros = np.random.default_rng(0).integers(-3_000_000_000_000_000, 5_000_000_000_000_000, 500)
+        micros = np.concatenate([micros, table.transitions - 1, table.transitions])
+        expected = [(EPOCH + u * MICROS).astimezone(zone).utcoffset() // timedelta(seconds=1) for u in micros.tolist()]
+        assert table.utc_offsets(micros).tolist() == expected
+
+    @pytest.mark.parametrize("fold", [0, 1])
+    def test_to_utc(self: Self, fold: int) -> None:
+        table = ZoneTable.of("America/Los_Angeles")
+        # 01:30 happens twice on 2022-11-06; 02:30 does not happen on 2022-03-13
+        walls = [datetime(2022, 11, 6, 1, 30), datetime(2022, 3, 13, 2, 30), datetime(2150, 7, 1)]
+        local = np.array([(w - datetime(1970, 1, 1)) // MICROS for w in walls])
+        expected = [(w.replace(tzinfo=table.zone, fold=fold) - EPOCH) // MICROS for w in walls]
+        assert table.to_utc(local, fold=fold).tolist() == expected
+
+    def test_cached(self: Self) -> None:
+        assert ZoneTable.of("Europe/Paris") is ZoneTable.of(ZoneInfo("Europe/Paris"))
+
+
+class TestInstantArrayZones:
+    def test_to_zone(self: Self) -> None:
+        array = InstantArray.from_strs(["2022-09-01T00:22:56Z", "2022-01-01T00:00:00Z"], InstantUtc)
+        paris = array.to_zone("Europe/Paris")
+        assert paris.as_strs().tolist() == [
+            "2022-09-01T02:22:56+02:00 [Europe/Paris]",
+            "2022-01-01T01:00:00+01:00 [Europe/Paris]",
+        ]
+        assert paris.to_instants()[0] == InstantWithCity.from_str("2022-09-01T02:22:56+02:00 [Europe/Paris]")
+        assert (paris.to_zone("Etc/UTC") == array).all()
+
+    def test_from_local_micros(self: Self) -> None:
+        local = InstantArray.from_strs(["2022-09-01T02:22:56Z"], InstantUtc).micros
+        array = InstantArray.from_local_micros(local, "Europe/Paris")
+        assert array.as_strs().tolist() == ["2022-09-01T02:22:56+02:00 [Europe/Paris]"]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+import mmap
+from decimal import Decimal
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+import pytest
+
+from realized import Well8x12
+from realized._core import Model
+from realized.binary import BinaryLayout
+from realized.dt.durations import IsoDuration
+from realized.dt.instants import InstantUtc, InstantWithCity, InstantWithOffset
+from realized.misc.coordinates import Rectangle
+
+
+class TestBinaryLayout:
+    @pytest.mark.parametrize(
+        ("model_type", "values", "size"),
+        [
+            (InstantUtc, ["1969-12-31T23:59:59.999999Z", "2022-09-01T00:22:56Z"], 8),
+            (InstantWithOffset, ["2022-09-01T00:22:56.500-05:30", "2022-09-01T00:22:56+14:00"], 10),
+            (IsoDuration, ["PT1H2M3.500S", "-PT24H0.000001S"], 8),
+            (Well8x12, ["A01", "H12"], 2),
+            (Rectangle, ["(1,2)x(30,40)", "(0,0)x(0,0)"], 32),
+        ],
+    )
+    def test_round_trip(self: Self, model_type: type[Model], values: list[str], size: int) -> None:
+        models = [model_type.from_str(v) for v in values]
+        layout = BinaryLayout.of(model_type)
+        data = layout.encode(models)
+        assert len(data) == layout.size * len(models) == size * len(models)
+        view = layout.decode(data)
+        assert len(view) == len(models)
+        assert list(view) == models
+        assert [view[i].as_str for i in range(-2, 2)] == values + values
+        assert layout.numpy_dtype().itemsize == size
+
+    def test_city(self: Self) -> None:
+        values = ["2022-09-01T00:22:56-07:00 [America/Los_Angeles]", "2022-11-06T01:30:00-08:00 [America/Los_Angeles]"]
+        models = [InstantWithCity.from_str(v) for v in values]
+        layout = BinaryLayout.of(InstantWithCity, "America/Los_Angeles")
+        assert [m.as_str for m in layout.decode(layout.encode(models))] == values
+        assert layout.describe()["zone"] == "America/Los_Angeles"
+        with pytest.raises(TypeError):
+            BinaryLayout.of(InstantWithCity)
+        with pytest.raises(ValueError):
+            BinaryLayout.of(InstantWithCity, "Europe/Berlin").encode(models)
+
+    def test_zero_copy(self: Self, tmp_path: Path) -> None:
+        layout = BinaryLayout.of(InstantWithOffset)
+        models = [InstantWithOffset.from_str(f"2022-09-01T00:22:{s:02}+02:00") for s in range(10)]
+        path = tmp_path / "instants.bin"
+        path.write_bytes(layout.encode(models))
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = layout.decode(mm)
+            part = view[2:5]
+            assert part.buffer.obj is view.buffer.obj
+            assert list(part) == models[2:5]
+            array = view.as_numpy()
+            assert array["offset_minutes"].tolist() == [120] * 10
+            assert array["micros"][0] == 1661984520000000
+            assert not array.flags.writeable
+            del view, part, array
+
+    def test_describe(self: Self) -> None:
+        layout = BinaryLayout.of(InstantWithOffset)
+        assert layout.describe() == {
+            "type": "InstantWithOffset",
+            "struct": "<qh",
+            "size": 10,
+            "fields": [{"name": "micros", "dtype": "<i8"}, {"name": "offset_minutes", "dtype": "<i2"}],
+            "zone": None,
+        }
+        assert np.dtype(layout.dtype_descr) == layout.numpy_dtype()
+
+    def test_invalid(self: Self) -> None:
+        with pytest.raises(TypeError):
+            BinaryLayout.of(Model)
+        with pytest.raises(ValueError):
+            BinaryLayout.of(InstantUtc).decode(b"\x00" * 9)
+        with pytest.raises(ValueError):
+            BinaryLayout.of(Rectangle).encode([Rectangle(Decimal("0.5"), Decimal(0), Decimal(1), Decimal(1))])
+
+
+if __name__ == "__main__":
+    pytest.main()
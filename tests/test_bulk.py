@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Self
+
+import pytest
+
+from realized import Well8x12
+from realized._core import _PARSE_ERRORS
+from realized.bulk import try_parse_many
+from realized.dt.durations import ColonSeparatedDuration, IsoDuration
+from realized.dt.instants import InstantUtc, InstantWithCity, InstantWithOffset
+from realized.errors import ParseErrorCode
+from realized.misc.coordinates import XY
+
+
+class TestTryParseMany:
+    def test_instants(self: Self) -> None:
+        values = ["2022-09-01T00:22:56Z", "2022-02-30T00:00:00Z", "yesterday", "2022-09-01T24:00:00Z", 5]
+        result = try_parse_many(InstantUtc, values, max_messages=10)
+        assert result.values[0] == InstantUtc.from_str(values[0])
+        assert result.values[1:] == [None] * 4
+        assert result.valid.tolist() == [True, False, False, False, False]
+        assert [ParseErrorCode(c) for c in result.codes] == [
+            ParseErrorCode.OK,
+            ParseErrorCode.RANGE,
+            ParseErrorCode.SYNTAX,
+            ParseErrorCode.RANGE,
+            ParseErrorCode.TYPE,
+        ]
+        assert result.summary == "4 of 5 rows are invalid (SYNTAX: 1, RANGE: 2, TYPE: 1)"
+        assert sorted(result.messages) == [1, 2, 3, 4]
+        assert "RealizedParseError" in result.messages[2]
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2022-09-01T00:22:56+02:00",
+            "2024-02-29T12:00:00.500-05:30",
+            "2022-09-01T00:22:56.000001+14:00",
+            "2022-09-01T00:22:56-00:00",
+            "2022-09-01T00:22:56+14:01",
+            "2023-02-29T00:00:00+00:00",
+            "2022-13-01T00:00:00+00:00",
+            "2022-09-01T00:60:00+00:00",
+        ],
+    )
+    def test_agrees_with_from_str(self: Self, value: str) -> None:
+        result = try_parse_many(InstantWithOffset, [value])
+        try:
+            expected = InstantWithOffset.from_str(value)
+        except _PARSE_ERRORS:
+            expected = None
+        assert result.values == [expected]
+
+    def test_city(self: Self) -> None:
+        values = [
+            "2022-09-01T00:22:56-07:00 [America/Los_Angeles]",
+            "2022-09-01T00:22:56-08:00 [America/Los_Angeles]",
+            "2022-09-01T00:22:56-07:00 [America/Nowhere]",
+            "2022-09-01T00:22:56-07:00",
+        ]
+        result = try_parse_many(InstantWithCity, values)
+        assert result.values[0] == InstantWithCity.from_str(values[0])
+        assert result.codes.tolist() == [0, ParseErrorCode.ZONE, ParseErrorCode.ZONE, ParseErrorCode.SYNTAX]
+        assert result.messages == {}
+
+    def test_durations(self: Self) -> None:
+        result = try_parse_many(IsoDuration, ["PT1H", "01:00:00", "P1000000000D"])
+        assert result.values[0] == IsoDuration.from_str("PT1H")
+        assert result.codes.tolist() == [0, ParseErrorCode.SYNTAX, ParseErrorCode.RANGE]
+        result = try_parse_many(ColonSeparatedDuration, ["01:00:00.500", "PT1H"])
+        assert result.codes.tolist() == [0, ParseErrorCode.SYNTAX]
+
+    def test_wells(self: Self) -> None:
+        result = try_parse_many(Well8x12, ["A01", "A1", "Z99"], max_messages=1)
+        assert result.values[0] is Well8x12.from_str("A01")
+        assert result.error_counts() == {ParseErrorCode.SYNTAX: 2}
+        assert len(result.messages) == 1
+
+    def test_default_hook(self: Self) -> None:
+        result = try_parse_many(XY, ["(1,2)", "(1,2", "(x,y)"], max_messages=5)
+        assert result.values[0] == XY.from_str("(1,2)")
+        assert result.valid.tolist() == [True, False, False]
+        assert sorted(result.messages) == [1, 2]
+
+
+if __name__ == "__main__":
+    pytest.main()
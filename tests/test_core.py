@@ -0,0 +1,271 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+import pickle
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Self
+
+import pytest
+
+from realized import Well8x12, Well48x72, WellSet8x12
+from realized._core import JsonEncoder, Model, ParseCacheInfo
+from realized.dt.durations import ColonSeparatedDuration, IsoDuration
+from realized.dt.instants import Instant, InstantUtc, InstantWithCity, InstantWithOffset
+from realized.dt.intervals import Interval
+from realized.errors import RealizedParseError, ZoneMismatchError
+from realized.misc.coordinates import XY, Rectangle
+
+
+class TestParseCache:
+    def test_lifecycle(self: Self) -> None:
+        assert InstantUtc.parse_cache_info() is None
+        InstantUtc.enable_parse_cache(maxsize=2)
+        try:
+            a = InstantUtc.from_str("2022-09-01T00:22:56Z")
+            assert InstantUtc.from_str("2022-09-01T00:22:56Z") is a
+            assert InstantUtc.parse_cache_info() == ParseCacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+            InstantUtc.from_str("2022-09-01T00:22:57Z")
+            InstantUtc.from_str("2022-09-01T00:22:58Z")
+            assert InstantUtc.parse_cache_info().currsize == 2
+            InstantUtc.clear_parse_cache()
+            assert InstantUtc.parse_cache_info() == ParseCacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+        finally:
+            InstantUtc.disable_parse_cache()
+        assert InstantUtc.parse_cache_info() is None
+        assert InstantUtc.from_str("2022-09-01T00:22:56Z") is not InstantUtc.from_str("2022-09-01T00:22:56Z")
+
+    def test_restores_from_str(self: Self) -> None:
+        original = vars(InstantUtc)["from_str"]
+        InstantUtc.enable_parse_cache()
+        try:
+            assert vars(InstantUtc)["from_str"] is not original
+            InstantUtc.enable_parse_cache()  # replacing the cache does not wrap twice
+            assert vars(InstantUtc)["from_str"].__func__.__wrapped__ is original.__func__
+        finally:
+            InstantUtc.disable_parse_cache()
+        assert vars(InstantUtc)["from_str"] is original
+
+    def test_unhashable_input(self: Self) -> None:
+        InstantUtc.enable_parse_cache()
+        try:
+            InstantUtc.from_str(memoryview(b"2022-09-01T00:22:56Z"))
+            assert InstantUtc.parse_cache_info().misses == 0
+        finally:
+            InstantUtc.disable_parse_cache()
+
+
+class TestJsonEncoder:
+    def test_nested_models(self: Self) -> None:
+        instant = InstantUtc.from_str("2022-09-01T00:22:56Z")
+        city = InstantWithCity.from_str("2022-09-01T00:22:56-07:00 [America/Los_Angeles]")
+        interval = Interval(instant, instant)
+        data = {"instants": [instant, city], "nested": {"interval": interval}, "n": 1}
+        assert JsonEncoder().to_json(data) == (
+            '{"instants":["2022-09-01T00:22:56Z",'
+            '{"timestamp":"2022-09-01T00:22:56-07:00","timezone":"America/Los_Angeles"}],'
+            '"nested":{"interval":{"start":"2022-09-01T00:22:56Z","end":"2022-09-01T00:22:56Z"}},"n":1}'
+        )
+
+    def test_bytes_round_trip(self: Self) -> None:
+        city = InstantWithCity.from_str("2022-09-01T00:22:56-07:00 [America/Los_Angeles]")
+        data = city.to_json_bytes()
+        assert data == city.to_json().encode("utf-8")
+        assert InstantWithCity.from_json_bytes(memoryview(data)) == city
+        assert InstantWithCity.from_bytes(city.as_str.encode("ascii")) == city
+        interval = Interval.from_bytes(b"2022-09-01T00:22:56+01:00--2022-09-01T01:00:00+01:00")
+        assert interval.end.as_str == "2022-09-01T01:00:00+01:00"
+
+    def test_other_dataclasses(self: Self) -> None:
+        @dataclass(frozen=True)
+        class Reading:
+            value: int
+            at: InstantUtc
+
+        reading = Reading(1, InstantUtc.from_str("2022-09-01T00:22:56Z"))
+        assert JsonEncoder().to_json({"d": reading}) == '{"d":{"value":1,"at":"2022-09-01T00:22:56Z"}}'
+
+    def test_not_serializable(self: Self) -> None:
+        with pytest.raises(TypeError):
+            JsonEncoder().to_json([object()])
+
+
+class _Legacy:
+    """
+    Pickles a model the way `Model.__reduce__` did before models pickled their raw fields.
+    """
+
+    def __init__(self: Self, model: Model) -> None:
+        self.model = model
+
+    def __reduce__(self: Self) -> tuple:
+        return self.model.__class__.from_str, (self.model.as_str,)
+
+
+class TestPickle:
+    @pytest.mark.parametrize(
+        "model",
+        [
+            InstantUtc.from_str("1969-12-31T23:59:59.999999Z"),
+            InstantWithOffset.from_str("2022-09-01T00:22:56.500-05:30"),
+            InstantWithOffset.from_str("2022-09-01T00:22:56+00:00"),
+            InstantWithCity.from_str("2022-11-06T01:30:00-08:00 [America/Los_Angeles]"),  # fold=1
+            IsoDuration.from_str("-P1DT0.000001S"),
+            ColonSeparatedDuration.from_str("01:02:03.500"),
+            Interval.from_str("2022-09-01T00:00:00Z--2022-09-02T00:00:00Z"),
+            Well8x12.from_str("H12"),
+            Well48x72.from_str("AV01"),
+            WellSet8x12.from_str("A01*B03,H12"),
+        ],
+    )
+    def test_round_trip(self: Self, model: Model) -> None:
+        data = pickle.dumps(model)
+        again = pickle.loads(data)
+        assert again.__class__ is model.__class__
+        assert again == model
+        assert again.as_str == model.as_str
+
+    def test_city_keeps_fold(self: Self) -> None:
+        instant = InstantWithCity.from_str("2022-11-06T01:30:00-08:00 [America/Los_Angeles]")
+        assert pickle.loads(pickle.dumps(instant)).dt.fold == instant.dt.fold == 1
+
+    def test_wells_are_interned(self: Self) -> None:
+        well = Well8x12.from_str("B03")
+        assert pickle.loads(pickle.dumps(well)) is well
+
+    def test_legacy_pickles_load(self: Self) -> None:
+        instant = InstantWithCity.from_str("2022-09-01T00:22:56-07:00 [America/Los_Angeles]")
+        assert pickle.loads(pickle.dumps(_Legacy(instant))) == instant
+
+    def test_compact(self: Self) -> None:
+        instants = [InstantUtc.from_str(f"2022-09-01T00:22:{s:02}Z") for s in range(60)]
+        assert len(pickle.dumps(instants)) < len(pickle.dumps([_Legacy(i) for i in instants]))
+
+
+class TestSortKey:
+    def test_instants_sort_by_utc(self: Self) -> None:
+        instants = [
+            InstantWithOffset.from_str("2022-09-01T00:22:56.500-05:30"),
+            InstantUtc.from_str("1969-12-31T23:59:59.999999Z"),
+            InstantWithCity.from_str("2022-11-06T01:30:00-08:00 [America/Los_Angeles]"),
+            InstantWithCity.from_str("2022-11-06T01:30:00-07:00 [America/Los_Angeles]"),
+            InstantUtc.from_str("2022-09-01T05:52:56Z"),
+            InstantWithOffset.from_str("2022-09-01T07:52:56.000001+02:00"),
+            InstantUtc.from_str("1900-01-01T00:00:00Z"),
+        ]
+        by_key = sorted(instants, key=lambda i: i.as_sort_key)
+        assert [i.dt for i in by_key] == sorted(i.dt for i in instants)
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            InstantUtc.from_str("1969-12-31T23:59:59.999999Z"),
+            InstantWithOffset.from_str("2022-09-01T00:22:56.500-05:30"),
+            InstantWithCity.from_str("2022-11-06T01:30:00-08:00 [America/Los_Angeles]"),
+            IsoDuration.from_str("-P1DT0.000001S"),
+            ColonSeparatedDuration.from_str("01:02:03.500"),
+            Interval.from_str("2022-09-01T00:00:00+02:00--2022-09-02T00:00:00+02:00"),
+            Well8x12.from_str("H12"),
+            WellSet8x12.from_str("A01*B03,H12"),
+            XY.from_str("(3,4)"),
+            Rectangle.from_str("(1,2)x(30,40)"),
+        ],
+    )
+    def test_round_trip(self: Self, model: Model) -> None:
+        again = model.__class__.from_sort_key(model.as_sort_key)
+        assert again.__class__ is model.__class__
+        assert again == model
+        assert again.as_str == model.as_str
+
+    def test_any_instant(self: Self) -> None:
+        instant = InstantWithCity.from_str("2022-11-06T01:30:00-08:00 [America/Los_Angeles]")
+        assert Instant.from_sort_key(instant.as_sort_key).dt.fold == 1
+        with pytest.raises(RealizedParseError):
+            InstantUtc.from_sort_key(instant.as_sort_key)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            ["-PT0.000001S", "PT0S", "-P1D", "PT1H", "PT0.5S", "-PT2H"],
+            ["2022-09-01T00:00:00Z--2022-09-03T00:00:00Z", "2022-09-01T00:00:00Z--2022-09-02T00:00:00Z"],
+        ],
+    )
+    def test_order(self: Self, values: list[str]) -> None:
+        model_type = Interval if "--" in values[0] else IsoDuration
+        models = [model_type.from_str(v) for v in values]
+        assert sorted(models, key=lambda m: m.as_sort_key) == sorted(models)
+
+    def test_wells(self: Self) -> None:
+        wells = [Well8x12.from_str(v) for v in ["H12", "A02", "B01", "A01", "G05"]]
+        assert sorted(wells, key=lambda w: w.as_sort_key) == sorted(wells, key=lambda w: w.as_index)
+        assert len(WellSet8x12.from_str("A01").as_sort_key) == 12
+
+    def test_coordinates(self: Self) -> None:
+        points = [XY(Decimal(x), Decimal(y)) for x, y in [(3, 4), (-2, 9), (3, -1), (0, 0)]]
+        assert sorted(points, key=lambda p: p.as_sort_key) == sorted(points)
+        with pytest.raises(ValueError):
+            _ = XY(Decimal("0.5"), Decimal(1)).as_sort_key
+
+    def test_invalid(self: Self) -> None:
+        with pytest.raises(RealizedParseError):
+            IsoDuration.from_sort_key(b"\x00" * 7)
+        with pytest.raises(NotImplementedError):
+            Model.from_sort_key(b"")
+
+
+@pytest.fixture()
+def trusted_checks(request: pytest.FixtureRequest) -> Iterator[None]:
+    # restores the previous state, which REALIZED_CHECK_TRUSTED may have set
+    enabled = Model._checks_trusted
+    if getattr(request, "param", True):
+        Model.enable_trusted_checks()
+    else:
+        Model.disable_trusted_checks()
+    try:
+        yield
+    finally:
+        Model._checks_trusted = enabled
+
+
+class TestUnchecked:
+    @pytest.mark.parametrize("trusted_checks", [False], indirect=True)
+    @pytest.mark.usefixtures("trusted_checks")
+    def test_skips_validation(self: Self) -> None:
+        assert InstantUtc._unchecked(datetime(2022, 9, 1, tzinfo=timezone.utc)).dt.tzinfo is timezone.utc
+        start = InstantUtc.from_str("2022-09-01T00:00:00Z")
+        end = InstantWithOffset.from_str("2022-09-02T00:00:00+02:00")
+        assert Interval._unchecked(start, end).end is end
+
+    @pytest.mark.parametrize("trusted_checks", [False], indirect=True)
+    @pytest.mark.usefixtures("trusted_checks")
+    def test_wells_are_interned(self: Self) -> None:
+        assert Well8x12._unchecked(2, 3) is Well8x12.from_str("B03")
+
+    @pytest.mark.usefixtures("trusted_checks")
+    def test_checks(self: Self) -> None:
+        with pytest.raises(ZoneMismatchError):
+            InstantUtc._unchecked(datetime(2022, 9, 1, tzinfo=timezone.utc))
+        start = InstantUtc.from_str("2022-09-01T00:00:00Z")
+        end = InstantWithOffset.from_str("2022-09-02T00:00:00+02:00")
+        with pytest.raises(ZoneMismatchError):
+            Interval._unchecked(start, end)
+        with pytest.raises(ValueError):
+            Well8x12._unchecked(9, 1)
+
+    @pytest.mark.usefixtures("trusted_checks")
+    def test_checked_round_trip(self: Self) -> None:
+        models = [
+            InstantWithCity.from_str("2022-11-06T01:30:00-08:00 [America/Los_Angeles]"),
+            InstantWithOffset.from_str("2022-09-01T00:22:56.500-05:30"),
+            IsoDuration.from_str("-P1DT0.000001S"),
+            Interval.from_str("2022-09-01T00:00:00Z--2022-09-02T00:00:00Z"),
+        ]
+        assert pickle.loads(pickle.dumps(models)) == models
+        assert [m.from_sort_key(m.as_sort_key) for m in models] == models
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+from typing import Self
+
+import pytest
+
+from realized.dt.instants import InstantWithCity
+from realized.dt.intervals import Interval
+from realized.errors import RealizedParseError
+from realized.ndjson import NdjsonCodec
+
+
+class TestNdjsonCodec:
+    def test_round_trip(self: Self) -> None:
+        values = [
+            "2022-09-01T00:22:56-07:00 [America/Los_Angeles]",
+            "2022-01-01T00:00:00.500+01:00 [Europe/Paris]",
+            "2022-01-01T00:00:00Z [Etc/UTC]",
+        ]
+        instants = [InstantWithCity.from_str(v) for v in values]
+        codec = NdjsonCodec(InstantWithCity, chunk_size=2, read_size=7)
+        assert [len(c.splitlines()) for c in codec.encode(instants)] == [2, 1]
+        fp = io.BytesIO()
+        assert codec.write(instants, fp) == 3
+        fp.seek(0)
+        assert list(codec.read(fp)) == instants
+
+    def test_interval(self: Self) -> None:
+        interval = Interval.from_str("2022-09-01T00:22:56Z--2022-09-01T01:00:00.250Z")
+        codec = NdjsonCodec(Interval)
+        assert list(codec.decode([b"\n", *codec.encode([interval])])) == [interval]
+
+    @pytest.mark.parametrize("size", [1, 2, 5, 100])
+    def test_split_lines(self: Self, size: int) -> None:
+        interval = Interval.from_str("2022-09-01T00:22:56Z--2022-09-01T01:00:00.250Z")
+        codec = NdjsonCodec(Interval)
+        data = b"\n".join(b"".join(codec.encode([interval])) for _ in range(3))  # no final newline
+        chunks = [data[i : i + size] for i in range(0, len(data), size)]
+        assert list(codec.decode(chunks)) == [interval] * 3
+
+    def test_invalid(self: Self) -> None:
+        codec = NdjsonCodec(InstantWithCity)
+        with pytest.raises(RealizedParseError, match="Line 2"):
+            list(codec.decode([b'{"timestamp": "2022-09-01T00:22:56Z", "timezone": "Etc/UTC"}\n', b"{"]))
+        with pytest.raises(RealizedParseError, match="Line 3"):
+            list(NdjsonCodec(Interval).decode([b"\n\n", b'{"x": 1}']))
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Self
+
+import pytest
+
+from realized import Well8x12, WellSet8x12
+from realized.binary import BinaryView
+from realized.dt.durations import IsoDuration
+from realized.dt.instants import InstantUtc, InstantWithCity, InstantWithOffset
+from realized.errors import RealizedParseError
+from realized.parallel import format_many, parse_many
+
+INSTANTS = [f"2022-09-{d:02}T{h:02}:22:56.500Z" for d in range(1, 29) for h in range(24)]
+
+
+class TestParseMany:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_order(self: Self, workers: int) -> None:
+        instants = parse_many(InstantUtc, INSTANTS, workers=workers, chunk_size=100)
+        assert isinstance(instants, BinaryView)
+        assert [i.as_str for i in instants] == INSTANTS
+
+    def test_wells(self: Self) -> None:
+        labels = ["H12", "A01", "B03"] * 50
+        wells = parse_many(Well8x12, labels, workers=2, chunk_size=40)
+        assert [w.as_str for w in wells] == labels
+        assert wells[1] is Well8x12.from_str("A01")
+
+    def test_unpacked(self: Self) -> None:
+        values = ["A01*B03,H12", "C01-C12"] * 20
+        assert parse_many(WellSet8x12, values, workers=2, chunk_size=7) == [WellSet8x12.from_str(v) for v in values]
+
+    def test_mixed_zones(self: Self) -> None:
+        values = [
+            "2022-09-01T00:22:56-07:00 [America/Los_Angeles]",
+            "2022-09-01T00:22:56+02:00 [Europe/Paris]",
+            "2022-09-01T00:22:56+02:00 [Europe/Paris]",
+        ]
+        instants = parse_many(InstantWithCity, values, workers=2, chunk_size=2)
+        assert [i.as_str for i in instants] == values
+        assert format_many(instants, workers=2, chunk_size=2) == values
+
+    def test_invalid(self: Self) -> None:
+        values = [*INSTANTS[:250], "2022-02-30T00:00:00Z", *INSTANTS[250:]]
+        with pytest.raises(RealizedParseError, match="Row 250 "):
+            parse_many(InstantUtc, values, workers=2, chunk_size=100)
+
+
+class TestFormatMany:
+    def test_view(self: Self) -> None:
+        instants = parse_many(InstantUtc, INSTANTS, workers=1, chunk_size=100)
+        assert format_many(instants, workers=2, chunk_size=64) == INSTANTS
+
+    @pytest.mark.parametrize(
+        "models",
+        [
+            [IsoDuration.from_str(f"PT{i}M0.500S") for i in range(100)],
+            [InstantWithOffset.from_str("2022-09-01T00:22:56-05:30"), InstantUtc.from_str("2022-09-01T00:22:56Z")] * 9,
+            [],
+        ],
+    )
+    def test_models(self: Self, models: list) -> None:
+        assert format_many(models, workers=2, chunk_size=8) == [m.as_str for m in models]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: Copyright 2020-2024, Contributors to Realized
+# SPDX-PackageHomePage: https://github.com/dmyersturnbull/realized
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Self
+
+import pytest
+
+from realized import Well8x12
+from realized.dt.instants import InstantUtc
+from realized.errors import RealizedParseError
+from realized.streaming import AsyncLineParser
+
+VALUES = [f"2022-09-01T{h:02}:{m:02}:56.500Z" for h in range(24) for m in range(0, 60, 7)]
+DATA = ("\n".join(VALUES) + "\n").encode("ascii")
+
+
+async def _chunks(data: bytes, size: int, delay: float = 0.0) -> AsyncIterator[bytes]:
+    for i in range(0, len(data), size):
+        if delay:
+            await asyncio.sleep(delay)
+        yield data[i : i + size]
+
+
+async def _collect(parser: AsyncLineParser, source: object) -> list[list]:
+    return [batch async for batch in parser.batches(source)]
+
+
+class TestAsyncLineParser:
+    def test_stream_reader(self: Self) -> None:
+        async def run() -> list[list]:
+            reader = asyncio.StreamReader()
+            reader.feed_data(DATA)
+            reader.feed_eof()
+            return await _collect(AsyncLineParser(InstantUtc, batch_size=50, read_size=333), reader)
+
+        batches = asyncio.run(run())
+        assert [len(b) for b in batches][:-1] == [50] * (len(VALUES) // 50)
+        assert [i.as_str for b in batches for i in b] == VALUES
+
+    @pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+    def test_executor(self: Self, executor_type: type) -> None:
+        labels = ["H12", "A01", "", "B03\r"] * 40
+        data = "\n".join(labels).encode("ascii")
+        with executor_type(max_workers=2) as executor:
+            parser = AsyncLineParser(Well8x12, batch_size=16, executor=executor, max_pending=3)
+            batches = asyncio.run(_collect(parser, _chunks(data, 13)))
+        assert [w.as_str for b in batches for w in b] == [v.strip() for v in labels if v]
+
+    @pytest.mark.parametrize("executor_type", [None, ThreadPoolExecutor])
+    def test_blank_batches(self: Self, executor_type: type | None) -> None:
+        data = ("\n" * 10 + VALUES[0] + "\n" * 10).encode("ascii")
+        executor = None if executor_type is None else executor_type(max_workers=1)
+        try:
+            parser = AsyncLineParser(InstantUtc, batch_size=4, executor=executor)
+            batches = asyncio.run(_collect(parser, _chunks(data, 7)))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        assert [[i.as_str for i in b] for b in batches] == [[VALUES[0]]]
+
+    def test_max_wait(self: Self) -> None:
+        # the source is slower than max_wait, so batches are yielded before they fill
+        parser = AsyncLineParser(InstantUtc, batch_size=1000, max_wait=0.01)
+        batches = asyncio.run(_collect(parser, _chunks(DATA[:500], 125, delay=0.05)))
+        assert len(batches) > 1
+        assert [i.as_str for b in batches for i in b] == VALUES[:20]
+
+    def test_models(self: Self) -> None:
+        async def run() -> list:
+            return [m async for m in AsyncLineParser(InstantUtc, batch_size=7).models(_chunks(DATA, 64))]
+
+        assert [i.as_str for i in asyncio.run(run())] == VALUES
+
+    def test_invalid(self: Self) -> None:
+        data = b"2022-09-01T00:00:00Z\n\n2022-02-30T00:00:00Z\n"
+        with pytest.raises(RealizedParseError, match="Line 3 "):
+            asyncio.run(_collect(AsyncLineParser(InstantUtc), _chunks(data, 5)))
+
+
+if __name__ == "__main__":
+    pytest.main()